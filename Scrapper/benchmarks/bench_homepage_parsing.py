@@ -0,0 +1,126 @@
+"""
+Acurácia e Vazão do Parser da Página Inicial
+Roda o pipeline da coleta de links (parse_match_text + clean_match_details, com o índice de times)
+sobre o corpus sintético de fixtures/homepage_containers.json (containers escritos à mão no formato
+da página, não uma captura ao vivo: a acurácia vale para os casos do corpus, não para o tráfego real):
+
+- acurácia: campos e containers iguais ao esperado, com a lista de divergências
+- vazão: containers por segundo e latência p50/p99 por container (estilo pytest-benchmark)
+
+Uso (a partir da pasta Scrapper):
+    python benchmarks/bench_homepage_parsing.py [--rounds 500] [--min-accuracy 1.0] [--json]
+
+Sai com código 1 quando a acurácia por container fica abaixo de --min-accuracy
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from match_text_parser import parse_match_text, clean_match_details
+from team_index import team_index
+from benchmarks.corpus import load_corpus
+
+FIELDS = ("home_team", "away_team", "home_score", "away_score", "match_time", "match_status")
+
+
+def parse_container(container):
+    """Mesmo caminho de SofaScoreLinksService para um container (sem o cache entre coletas)"""
+    return clean_match_details(parse_match_text(container["text"], container["spans"], team_index))
+
+
+def check_accuracy(corpus):
+    field_hits = dict.fromkeys(FIELDS, 0)
+    exact = 0
+    mismatches = []
+    for container in corpus:
+        result = parse_container(container)
+        wrong = [field for field in FIELDS if result.get(field) != container["expected"][field]]
+        for field in FIELDS:
+            if field not in wrong:
+                field_hits[field] += 1
+        if wrong:
+            mismatches.append({
+                "id": container["id"],
+                "text": container["text"],
+                "fields": {field: {"expected": container["expected"][field], "got": result.get(field)}
+                           for field in wrong}
+            })
+        else:
+            exact += 1
+    total = len(corpus)
+    return {
+        "containers": total,
+        "exact": exact,
+        "accuracy": round(exact / total, 4) if total else 0.0,
+        "field_accuracy": {field: round(hits / total, 4) for field, hits in field_hits.items()},
+        "mismatches": mismatches
+    }
+
+
+def measure_throughput(corpus, rounds):
+    # Aquecimento: compila/aquece caches do módulo re antes da medição
+    for container in corpus:
+        parse_container(container)
+
+    timings_ns = []
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for container in corpus:
+            container_started = time.perf_counter_ns()
+            parse_container(container)
+            timings_ns.append(time.perf_counter_ns() - container_started)
+    elapsed = time.perf_counter() - started
+
+    timings_ns.sort()
+    p99_index = min(len(timings_ns) - 1, int(len(timings_ns) * 0.99))
+    return {
+        "rounds": rounds,
+        "containers_per_second": round(len(timings_ns) / elapsed, 1),
+        "mean_us": round(statistics.fmean(timings_ns) / 1000, 2),
+        "p50_us": round(timings_ns[len(timings_ns) // 2] / 1000, 2),
+        "p99_us": round(timings_ns[p99_index] / 1000, 2),
+        "max_us": round(timings_ns[-1] / 1000, 2)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=500)
+    parser.add_argument("--min-accuracy", type=float, default=1.0)
+    parser.add_argument("--json", action="store_true", help="imprime o relatório em JSON (para comparar execuções)")
+    args = parser.parse_args()
+
+    corpus = load_corpus()
+    report = {
+        "accuracy": check_accuracy(corpus),
+        "throughput": measure_throughput(corpus, args.rounds)
+    }
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        accuracy = report["accuracy"]
+        throughput = report["throughput"]
+        print(f"🎯 Acurácia: {accuracy['exact']}/{accuracy['containers']} containers ({accuracy['accuracy']:.1%})")
+        for field, value in accuracy["field_accuracy"].items():
+            print(f"   {field:<13} {value:.1%}")
+        for mismatch in accuracy["mismatches"]:
+            print(f"❌ {mismatch['id']}: '{mismatch['text']}'")
+            for field, values in mismatch["fields"].items():
+                print(f"     {field}: esperado '{values['expected']}', obtido '{values['got']}'")
+        print(f"⚡ Vazão: {throughput['containers_per_second']:,.0f} containers/s "
+              f"(média {throughput['mean_us']}µs, p50 {throughput['p50_us']}µs, "
+              f"p99 {throughput['p99_us']}µs, máx {throughput['max_us']}µs; {throughput['rounds']} rodadas)")
+
+    if report["accuracy"]["accuracy"] < args.min_accuracy:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
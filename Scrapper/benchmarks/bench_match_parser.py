@@ -0,0 +1,71 @@
+"""
+Benchmark do Parser de Texto dos Containers
+Compara o parser antigo (legacy_match_parser.py) com o match_text_parser.py nos textos do corpus
+de containers da página inicial do SofaScore: tempo por container e resultados divergentes
+
+Uso (a partir da pasta Scrapper):
+    python benchmarks/bench_match_parser.py [--rounds 2000]
+"""
+
+import os
+import io
+import sys
+import time
+import argparse
+import functools
+import contextlib
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from match_text_parser import parse_match_text
+from team_index import team_index
+from benchmarks.legacy_match_parser import LegacyMatchTextParser
+from benchmarks.corpus import load_corpus
+
+# Textos do corpus sintético da página inicial (fixtures/homepage_containers.json, escrito à mão)
+CONTAINER_TEXTS = [container["text"] for container in load_corpus()]
+
+
+def run(parse, texts, rounds):
+    """Executa o parser sobre o corpus e devolve (segundos por container, resultados da última rodada)"""
+    results = []
+    started = time.perf_counter()
+    for _ in range(rounds):
+        results = [parse(text) for text in texts]
+    elapsed = time.perf_counter() - started
+    return elapsed / (rounds * len(texts)), results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+
+    legacy = LegacyMatchTextParser()
+    # O parser antigo imprime cada tentativa; o custo de formatar as mensagens entra na medição
+    with contextlib.redirect_stdout(io.StringIO()):
+        legacy_seconds, legacy_results = run(legacy.extract_match_details_from_text, CONTAINER_TEXTS, args.rounds)
+    # Mesma configuração da coleta: índice de times semeado com os casos conhecidos
+    new_seconds, new_results = run(functools.partial(parse_match_text, team_index=team_index),
+                                   CONTAINER_TEXTS, args.rounds)
+
+    print(f"📊 {len(CONTAINER_TEXTS)} containers x {args.rounds} rodadas")
+    print(f"🐢 Parser antigo: {legacy_seconds * 1e6:8.2f} µs/container")
+    print(f"⚡ Parser novo:   {new_seconds * 1e6:8.2f} µs/container ({legacy_seconds / new_seconds:.1f}x)")
+
+    recognized_legacy = sum(1 for result in legacy_results if result["home_team"] != "N/A")
+    recognized_new = sum(1 for result in new_results if result["home_team"] != "N/A")
+    print(f"✅ Reconhecidos: antigo {recognized_legacy}/{len(CONTAINER_TEXTS)}, novo {recognized_new}/{len(CONTAINER_TEXTS)}")
+
+    print("\n🔍 Divergências (antigo -> novo):")
+    for text, old, new in zip(CONTAINER_TEXTS, legacy_results, new_results):
+        if old != new:
+            print(f"  '{text}'")
+            print(f"     {old['home_team']} x {old['away_team']} {old['home_score']}-{old['away_score']} "
+                  f"{old['match_time']} {old['match_status']}")
+            print(f"  -> {new['home_team']} x {new['away_team']} {new['home_score']}-{new['away_score']} "
+                  f"{new['match_time']} {new['match_status']}")
+
+
+if __name__ == "__main__":
+    main()
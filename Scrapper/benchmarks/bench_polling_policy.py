@@ -0,0 +1,147 @@
+"""
+Simulação do Intervalo Adaptativo de Coleta
+Reproduz uma partida sintética (pré-jogo, 1º tempo com acréscimos, intervalo, 2º tempo com gol nos
+acréscimos, fim) e compara o intervalo fixo de 30s com a PollingPolicy:
+
+- requisições: coletas feitas do início do monitoramento até a partida sair do agendador
+- latência: tempo entre cada incidente e a primeira coleta que o enxerga (média, máximo e nos acréscimos)
+- coletas por intervalo escolhido pela política (onde as requisições foram gastas)
+
+Uso (a partir da pasta Scrapper):
+    python benchmarks/bench_polling_policy.py [--lead-minutes 30] [--fixed-interval 30] [--max-ratio 0.55]
+
+Sai com código 1 quando o adaptativo passa de --max-ratio das requisições do intervalo fixo
+"""
+
+import os
+import sys
+import argparse
+import statistics
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from important_scripts.polling_policy import polling_policy
+
+KICKOFF = 1_700_000_000
+FIRST_HALF_SECONDS = 48 * 60        # 45 + 3 de acréscimo
+HALFTIME_SECONDS = 15 * 60
+SECOND_HALF_SECONDS = 51 * 60       # 45 + 6 de acréscimo
+SECOND_HALF_START = KICKOFF + FIRST_HALF_SECONDS + HALFTIME_SECONDS
+FULL_TIME = SECOND_HALF_START + SECOND_HALF_SECONDS
+
+# (minuto, acréscimo, segundos dentro do minuto, tipo, time da casa?)
+INCIDENTS = [
+    (12, 0, 17, "card", True), (23, 0, 41, "goal", True), (38, 0, 8, "card", False), (45, 2, 33, "card", True),
+    (58, 0, 52, "substitution", False), (61, 0, 5, "substitution", True), (67, 0, 29, "goal", False),
+    (70, 0, 44, "substitution", True), (74, 0, 11, "card", False), (78, 0, 37, "substitution", False),
+    (84, 0, 23, "substitution", True), (88, 0, 56, "card", True), (90, 4, 14, "goal", True),
+    (90, 5, 48, "card", False)
+]
+
+
+def incident_timestamp(minute, added, second):
+    if minute <= 45:
+        return KICKOFF + (minute - 1 + added) * 60 + second
+    return SECOND_HALF_START + (minute - 46 + added) * 60 + second
+
+
+def snapshot(now):
+    """Snapshot bruto (formato de get_live_match_data_api) no instante now"""
+    if now < KICKOFF:
+        code, period_start = 0, None
+    elif now < KICKOFF + FIRST_HALF_SECONDS:
+        code, period_start = 6, KICKOFF
+    elif now < SECOND_HALF_START:
+        code, period_start = 31, None
+    elif now < FULL_TIME:
+        code, period_start = 7, SECOND_HALF_START
+    else:
+        code, period_start = 100, None
+
+    timeline = [
+        {"incidentType": kind, "time": minute, "addedTime": added, "isHome": is_home}
+        for minute, added, second, kind, is_home in INCIDENTS
+        if incident_timestamp(minute, added, second) <= now
+    ]
+    goals = [incident for incident in timeline if incident["incidentType"] == "goal"]
+    return {
+        "basic_info": {
+            "status": {"code": code},
+            "startTimestamp": KICKOFF,
+            "time": {"currentPeriodStartTimestamp": period_start} if period_start else {},
+            "homeScore": {"current": sum(1 for goal in goals if goal["isHome"])},
+            "awayScore": {"current": sum(1 for goal in goals if not goal["isHome"])}
+        },
+        "timeline": list(reversed(timeline))
+    }
+
+
+def simulate(next_interval, start):
+    """Instantes das coletas até a partida ser dada como encerrada"""
+    polls = []
+    now = start
+    while True:
+        polls.append(now)
+        interval = next_interval(snapshot(now), now)
+        if interval is None:
+            return polls
+        now += interval
+
+
+def fixed(seconds):
+    def next_interval(raw_data, now):
+        return None if raw_data["basic_info"]["status"]["code"] == 100 else seconds
+    return next_interval
+
+
+def adaptive(raw_data, now):
+    return polling_policy.next_interval(raw_data, now)[0]
+
+
+def latencies(polls):
+    result = []
+    for minute, added, second, _, _ in INCIDENTS:
+        happened = incident_timestamp(minute, added, second)
+        seen = next(poll for poll in polls if poll >= happened)
+        result.append((minute, added, seen - happened))
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lead-minutes", type=int, default=30, help="minutos de monitoramento antes do início")
+    parser.add_argument("--fixed-interval", type=float, default=30)
+    parser.add_argument("--max-ratio", type=float, default=0.55,
+                        help="requisições do adaptativo / do intervalo fixo aceitas (meta: metade)")
+    args = parser.parse_args()
+
+    start = KICKOFF - args.lead_minutes * 60
+    results = {
+        f"fixo {args.fixed_interval:.0f}s": simulate(fixed(args.fixed_interval), start),
+        "adaptativo": simulate(adaptive, start)
+    }
+
+    baseline = None
+    print(f"⚽ Partida sintética: {len(INCIDENTS)} incidentes, monitorada desde {args.lead_minutes} min antes do início")
+    for name, polls in results.items():
+        lat = latencies(polls)
+        stoppage = [seconds for minute, added, seconds in lat if added > 0]
+        baseline = baseline or len(polls)
+        print(f"📡 {name:<11} {len(polls):4d} requisições ({len(polls) / baseline:.0%}) | latência média "
+              f"{statistics.fmean(seconds for _, _, seconds in lat):5.1f}s, máx {max(seconds for _, _, seconds in lat):5.1f}s, "
+              f"acréscimos {statistics.fmean(stoppage):5.1f}s")
+
+    polls = results["adaptativo"]
+    intervals = Counter(int(later - earlier) for earlier, later in zip(polls, polls[1:]))
+    print("⏱️ Coletas do adaptativo por intervalo: " +
+          ", ".join(f"{seconds}s x{count}" for seconds, count in sorted(intervals.items())))
+
+    ratio = len(polls) / baseline
+    if ratio > args.max_ratio:
+        print(f"❌ Adaptativo em {ratio:.0%} das requisições do intervalo fixo (máximo {args.max_ratio:.0%})")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
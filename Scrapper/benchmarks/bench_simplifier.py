@@ -0,0 +1,103 @@
+"""
+Benchmark da Categorização de Estatísticas
+Compara o extract_key_statistics antigo (várias buscas por palavra em name.lower() por item)
+com o índice por chave do MatchDataSimplifier em um dia de snapshots sintéticos no formato
+do endpoint /event/{id}/statistics (períodos ALL, 1ST e 2ND)
+
+Uso (a partir da pasta Scrapper):
+    python benchmarks/bench_simplifier.py [--snapshots 2000]
+"""
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from important_scripts.simplify_match_data import MatchDataSimplifier
+
+# (chave, nome) como enviados pelo SofaScore
+STAT_ITEMS = [
+    ("ballPossession", "Ball possession"), ("expectedGoals", "Expected goals"),
+    ("bigChanceCreated", "Big chances"), ("totalShotsOnGoal", "Total shots"),
+    ("goalkeeperSaves", "Goalkeeper saves"), ("cornerKicks", "Corner kicks"), ("fouls", "Fouls"),
+    ("passes", "Passes"), ("totalTackle", "Tackles"), ("freeKicks", "Free kicks"),
+    ("yellowCards", "Yellow cards"), ("shotsOnGoal", "Shots on target"), ("hitWoodwork", "Hit woodwork"),
+    ("shotsOffGoal", "Shots off target"), ("blockedScoringAttempt", "Blocked shots"),
+    ("totalShotsInsideBox", "Shots inside box"), ("totalShotsOutsideBox", "Shots outside box"),
+    ("bigChanceMissed", "Big chances missed"), ("touchesInOppBox", "Touches in penalty area"),
+    ("accuratePasses", "Accurate passes"), ("throwIns", "Throw-ins"), ("finalThirdEntries", "Final third entries"),
+    ("accurateLongBalls", "Long balls"), ("accurateCrosses", "Crosses"), ("duelWonPercent", "Duels"),
+    ("dispossessed", "Dispossessed"), ("groundDuelsPercentage", "Ground duels"),
+    ("aerialDuelsPercentage", "Aerial duels"), ("dribblesPercentage", "Dribbles"),
+    ("wonTacklePercent", "Tackles won"), ("interceptionWon", "Interceptions"), ("ballRecovery", "Recoveries"),
+    ("totalClearance", "Clearances"), ("goalKicks", "Goal kicks"), ("errorsLeadToShot", "Errors lead to a shot"),
+]
+
+
+def build_snapshot(seed):
+    items = [{"key": key, "name": name, "home": str((seed + index) % 20), "away": str((seed * 3 + index) % 20)}
+             for index, (key, name) in enumerate(STAT_ITEMS)]
+    return [{"period": period, "groups": [{"groupName": "Match overview", "statisticsItems": items}]}
+            for period in ("ALL", "1ST", "2ND")]
+
+
+def legacy_extract_key_statistics(stats_data):
+    """Implementação anterior (só o período ALL, categorias por ordem fixa de palavras)"""
+    simplified_stats = {"possession": {}, "shots": {}, "passes": {}, "duels": {}, "defending": {}}
+    for period_data in stats_data:
+        if period_data.get("period") == "ALL":
+            for group in period_data.get("groups", []):
+                for item in group.get("statisticsItems", []):
+                    name = item.get("name", "")
+                    home = item.get("home", "0")
+                    away = item.get("away", "0")
+                    if "possession" in name.lower():
+                        simplified_stats["possession"][name] = {"home": home, "away": away}
+                    elif any(word in name.lower() for word in ["shot", "goal", "chance"]):
+                        simplified_stats["shots"][name] = {"home": home, "away": away}
+                    elif any(word in name.lower() for word in ["pass", "cross", "through"]):
+                        simplified_stats["passes"][name] = {"home": home, "away": away}
+                    elif any(word in name.lower() for word in ["duel", "aerial", "ground"]):
+                        simplified_stats["duels"][name] = {"home": home, "away": away}
+                    elif any(word in name.lower() for word in ["tackle", "clearance", "block"]):
+                        simplified_stats["defending"][name] = {"home": home, "away": away}
+    return simplified_stats
+
+
+def timed(func, snapshots):
+    started = time.perf_counter()
+    for snapshot in snapshots:
+        func(snapshot)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--snapshots", type=int, default=2000)
+    args = parser.parse_args()
+
+    snapshots = [build_snapshot(seed) for seed in range(args.snapshots)]
+    simplifier = MatchDataSimplifier()
+
+    legacy_seconds = timed(legacy_extract_key_statistics, snapshots)
+    new_seconds = timed(simplifier.extract_key_statistics, snapshots)
+    periods_seconds = timed(simplifier.split_statistics_by_period, snapshots)
+
+    print(f"📊 {args.snapshots} snapshots x {len(STAT_ITEMS)} estatísticas x 3 períodos")
+    print(f"🐢 Antigo (só ALL):          {legacy_seconds * 1e6 / args.snapshots:8.2f} µs/snapshot")
+    print(f"⚡ Índice (só ALL):          {new_seconds * 1e6 / args.snapshots:8.2f} µs/snapshot "
+          f"({new_seconds / legacy_seconds:.0%} do antigo)")
+    print(f"⚡ Índice (ALL + 1ST + 2ND): {periods_seconds * 1e6 / args.snapshots:8.2f} µs/snapshot")
+
+    legacy = legacy_extract_key_statistics(snapshots[0])
+    new = simplifier.extract_key_statistics(snapshots[0])
+    for category in new:
+        moved_in = sorted(set(new[category]) - set(legacy[category]))
+        if moved_in:
+            print(f"🔀 {category}: {', '.join(moved_in)}")
+
+
+if __name__ == "__main__":
+    main()
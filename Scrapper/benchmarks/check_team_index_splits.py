@@ -0,0 +1,106 @@
+"""
+Split do Índice de Times com Nomes Vindos do Banco
+O índice de times é semeado com os casos conhecidos do parser e atualizado com match_info.home_team/away_team.
+O fluxo de screenshot grava placeholders ("Home"/"Away") e palpites do slug da URL
+("Slovakia U21 Spain" / "U21") nessas colunas; se entrassem no índice, o prefixo mais longo
+sequestraria o split de pares conhecidos. Este script:
+
+- semeia o índice com os pares esperados do corpus e de SPECIFIC_CASES
+- atualiza com um banco falso que mistura nomes lidos da página, palpites da URL e placeholders
+- confere que todo par conhecido continua separado nele mesmo e que nada além dos nomes da página entrou
+- mostra o sequestro num índice que aceita as linhas sem filtrar (controle)
+
+Uso (a partir da pasta Scrapper):
+    python benchmarks/check_team_index_splits.py
+
+Sai com código 1 quando algum par conhecido é separado errado
+"""
+
+import os
+import sys
+import asyncio
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from corpus import load_corpus
+from match_text_parser import SPECIFIC_CASES
+from team_index import TeamNameIndex, team_key, TEAM_SOURCE_PAGE, TEAM_SOURCE_URL, TEAM_SOURCE_PLACEHOLDER
+
+# Linhas de match_info como o fluxo de screenshot as grava
+DATABASE_ROWS = [
+    {"home_team": "Slovakia U21", "away_team": "Spain U21", "team_names_source": TEAM_SOURCE_PAGE,
+     "updated_at": "2026-10-01T18:00:00+00:00"},
+    {"home_team": "Slovakia U21 Spain", "away_team": "U21", "team_names_source": TEAM_SOURCE_URL,
+     "updated_at": "2026-10-01T18:05:00+00:00"},
+    {"home_team": "Home", "away_team": "Away", "team_names_source": TEAM_SOURCE_PLACEHOLDER,
+     "updated_at": "2026-10-01T18:10:00+00:00"},
+    {"home_team": "Time Casa", "away_team": "Time Visitante", "team_names_source": None,
+     "updated_at": "2026-10-01T18:15:00+00:00"}
+]
+
+
+class FakeDatabase:
+    """Só o que TeamNameIndex.refresh usa do DatabaseService"""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def get_team_names(self, since=None):
+        return [row for row in self.rows if not since or row["updated_at"] >= since]
+
+
+def seed_pairs():
+    """Pares esperados do corpus e casos conhecidos do parser (semente do índice)"""
+    pairs = {(entry["expected"]["home_team"], entry["expected"]["away_team"])
+             for entry in load_corpus() if entry["expected"]}
+    pairs.update(tuple(pair) for pair in SPECIFIC_CASES.values())
+    return sorted(pairs)
+
+
+def page_pairs():
+    return [(row["home_team"], row["away_team"]) for row in DATABASE_ROWS if row["team_names_source"] == TEAM_SOURCE_PAGE]
+
+
+def seeded_index():
+    return TeamNameIndex(name for pair in seed_pairs() for name in pair)
+
+
+def hijacked(index, pairs):
+    """Pares conhecidos que o índice separa diferente do esperado"""
+    wrong = []
+    for home_team, away_team in pairs:
+        result = index.split(home_team + away_team)
+        if result is None or [team_key(name) for name in result] != [team_key(home_team), team_key(away_team)]:
+            wrong.append((home_team, away_team, result))
+    return wrong
+
+
+def main():
+    pairs = sorted(set(seed_pairs()) | set(page_pairs()))
+
+    index = seeded_index()
+    added = asyncio.run(index.refresh(FakeDatabase(DATABASE_ROWS)))
+    problems = [f"'{home_team}{away_team}' separado em {result}" for home_team, away_team, result in hijacked(index, pairs)]
+    page_names = {team_key(name) for pair in page_pairs() for name in pair}
+    for row in DATABASE_ROWS:
+        for name in (row["home_team"], row["away_team"]):
+            if team_key(name) not in page_names and team_key(name) in index._names:
+                problems.append(f"'{name}' ({row['team_names_source']}) entrou no índice")
+
+    # Controle: todas as linhas do banco adicionadas sem olhar a origem
+    unfiltered = seeded_index()
+    unfiltered.add_many(name for row in DATABASE_ROWS for name in (row["home_team"], row["away_team"]))
+    control = hijacked(unfiltered, pairs)
+
+    print(f"📇 {len(pairs)} pares conhecidos; {added} nome(s) do banco no índice ({len(index)} no total)")
+    for home_team, away_team, result in control:
+        print(f"   sem filtro: '{home_team}{away_team}' -> {result}")
+    for problem in problems:
+        print(f"❌ {problem}")
+    if problems:
+        sys.exit(1)
+    print(f"✅ Todos os pares conhecidos separados corretamente (sem filtro: {len(control)} sequestrado(s))")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Ida e Volta das Chaves de Estatística (XHR x DOM)
+A análise avançada (_generate_advanced_match_analysis) lê as estatísticas pelas chaves que o
+extrator da página (match_page) gera a partir dos rótulos em português. Este script converte um
+payload de /event/{id}/statistics com to_match_data e confere:
+
+- toda chave lida pela análise sai de to_match_data, com valor que a análise consegue converter
+- a chave é a mesma que o extrator DOM gera para o rótulo exibido na página (a expressão do
+  extrator é executada com node quando disponível)
+
+Uso (a partir da pasta Scrapper):
+    python benchmarks/check_xhr_statistic_keys.py
+
+Sai com código 1 quando alguma chave diverge ou falta
+"""
+
+import os
+import re
+import sys
+import json
+import shutil
+import subprocess
+
+SCRAPPER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SCRAPPER_DIR)
+
+from xhr_capture import STATISTIC_LABELS, dom_statistic_key, to_match_data
+from page_extractors import get_extractor
+
+# Itens no formato da API do SofaScore (nomes em inglês; a página mostra os rótulos de STATISTIC_LABELS)
+API_ITEMS = [
+    {"key": "ballPossession", "name": "Ball possession", "home": "58%", "away": "42%", "homeValue": 58, "awayValue": 42},
+    {"key": "totalShotsOnGoal", "name": "Total shots", "home": "14", "away": "6", "homeValue": 14, "awayValue": 6},
+    {"key": "shotsOnGoal", "name": "Shots on target", "home": "5", "away": "2", "homeValue": 5, "awayValue": 2},
+    {"key": "bigChanceCreated", "name": "Big chances", "home": "3", "away": "1", "homeValue": 3, "awayValue": 1},
+    {"key": "duelWonPercent", "name": "Duels", "home": "54%", "away": "46%", "homeValue": 54, "awayValue": 46},
+    {"key": "throwIns", "name": "Throw-ins", "home": "17", "away": "12", "homeValue": 17, "awayValue": 12},
+    {"key": "cornerKicks", "name": "Corner kicks", "home": "7", "away": "2", "homeValue": 7, "awayValue": 2},
+    {"key": "passes", "name": "Passes", "home": "512", "away": "371", "homeValue": 512, "awayValue": 371},
+    {"key": "accuratePasses", "name": "Accurate passes", "home": "441 (86%)", "away": "289 (78%)",
+     "homeValue": 441, "awayValue": 289},
+    {"key": "yellowCards", "name": "Yellow cards", "home": "2", "away": "3", "homeValue": 2, "awayValue": 3}
+]
+
+RAW_DATA = {
+    "basic_info": {"homeTeam": {"name": "Flamengo"}, "awayTeam": {"name": "Palmeiras"}},
+    "statistics": [{"period": "ALL", "groups": [{"groupName": "Match overview", "statisticsItems": API_ITEMS}]}]
+}
+
+
+def analysis_keys():
+    """Chaves de stats[...] lidas por _generate_advanced_match_analysis (services.py)"""
+    with open(os.path.join(SCRAPPER_DIR, "services.py"), encoding="utf-8") as file:
+        source = file.read()
+    start = source.index("def _generate_advanced_match_analysis")
+    end = source.index("\n    def ", start)
+    return sorted(set(re.findall(r"stats\['(\w+)'\]", source[start:end])))
+
+
+def dom_keys(labels):
+    """Chaves que o extrator match_page gera para os rótulos (node executa a expressão do próprio script)"""
+    version, script = get_extractor("match_page")
+    expression = re.search(r"const key = (.+);", script).group(1)
+    node = shutil.which("node")
+    if not node:
+        print("⚠️ node não encontrado: usando dom_statistic_key no lugar da expressão do extrator")
+        return version, {label: dom_statistic_key(label) for label in labels}
+    program = (f"const labels = {json.dumps(labels, ensure_ascii=False)};\n"
+               f"const out = {{}};\n"
+               f"for (const name of labels) {{ out[name] = {expression}; }}\n"
+               f"process.stdout.write(JSON.stringify(out));")
+    output = subprocess.run([node, "-e", program], capture_output=True, text=True, check=True).stdout
+    return version, json.loads(output)
+
+
+def main():
+    statistics = to_match_data(RAW_DATA)["statistics"]
+    labels = [STATISTIC_LABELS[item["key"]] for item in API_ITEMS]
+    version, expected = dom_keys(labels)
+    problems = []
+
+    for item, label in zip(API_ITEMS, labels):
+        key = dom_statistic_key(label)
+        if key != expected[label]:
+            problems.append(f"{item['key']}: XHR gera '{key}', extrator DOM gera '{expected[label]}' para '{label}'")
+
+    for key in analysis_keys():
+        stat = statistics.get(key)
+        if stat is None:
+            problems.append(f"'{key}' lida pela análise não sai de to_match_data")
+            continue
+        for side in ("home", "away"):
+            try:
+                int(stat[side].replace('%', ''))
+            except ValueError:
+                problems.append(f"'{key}' ({side}): valor '{stat[side]}' não convertido pela análise")
+
+    print(f"🔑 Extrator match_page@{version}; chaves lidas pela análise: {', '.join(analysis_keys())}")
+    for key, stat in statistics.items():
+        print(f"   {key:<22} {stat['home']:>5} x {stat['away']:<5} ({stat['name']})")
+    for problem in problems:
+        print(f"❌ {problem}")
+    if problems:
+        sys.exit(1)
+    print("✅ Chaves de to_match_data iguais às do extrator DOM")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Corpus de Containers da Página Inicial
+Carrega fixtures/homepage_containers.json (corpus sintético, escrito à mão no formato da página;
+não é uma captura ao vivo); entradas escritas como HTML são convertidas para o mesmo
+payload de CONTAINER_PAYLOAD_SCRIPT (textContent do link e textos dos spans com mais de 2 caracteres)
+"""
+
+import os
+import json
+from html.parser import HTMLParser
+from typing import Dict, Any, List, Tuple
+
+CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "homepage_containers.json")
+
+
+class _ContainerPayloadParser(HTMLParser):
+    """Equivalente em Python de anchor.textContent e anchor.querySelectorAll('span')"""
+
+    def __init__(self):
+        super().__init__()
+        self.text_parts: List[str] = []
+        self.spans: List[str] = []
+        self._open_spans: List[List[str]] = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "span":
+            self._open_spans.append([])
+
+    def handle_endtag(self, tag):
+        if tag == "span" and self._open_spans:
+            text = "".join(self._open_spans.pop()).strip()
+            if len(text) > 2:
+                self.spans.append(text)
+
+    def handle_data(self, data):
+        self.text_parts.append(data)
+        for span in self._open_spans:
+            span.append(data)
+
+
+def payload_from_html(html: str) -> Tuple[str, List[str]]:
+    """(texto, spans) de um container escrito como HTML"""
+    parser = _ContainerPayloadParser()
+    parser.feed(html)
+    parser.close()
+    return "".join(parser.text_parts), parser.spans
+
+
+def load_corpus(path: str = CORPUS_PATH) -> List[Dict[str, Any]]:
+    """Entradas com id, href, text, spans e expected"""
+    with open(path, "r", encoding="utf-8") as f:
+        containers = json.load(f)["containers"]
+
+    corpus = []
+    for container in containers:
+        if "html" in container:
+            text, spans = payload_from_html(container["html"])
+        else:
+            text, spans = container["text"], container.get("spans", [])
+        corpus.append({
+            "id": container["id"],
+            "href": container["href"],
+            "text": text,
+            "spans": spans,
+            "expected": container["expected"]
+        })
+    return corpus
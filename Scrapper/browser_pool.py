@@ -0,0 +1,481 @@
+"""
+Pool de Navegadores Chromium
+Mantém navegadores aquecidos durante a vida da API e entrega contextos novos por requisição
+"""
+
+import os
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Any, List
+from playwright.async_api import async_playwright
+
+# Argumentos de lançamento compartilhados por todos os navegadores do pool
+# (mesmo conjunto usado pelo SofaScoreLiveCollectorAPI, que funcionou no Docker)
+BROWSER_ARGS = [
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--disable-extensions',
+    '--disable-blink-features=AutomationControlled',
+    '--disable-web-security',
+    '--disable-features=VizDisplayCompositor',
+    '--disable-background-timer-throttling',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-renderer-backgrounding',
+    '--disable-field-trial-config',
+    '--disable-ipc-flooding-protection',
+    '--no-first-run',
+    '--no-default-browser-check',
+    '--no-pings',
+    '--password-store=basic',
+    '--use-mock-keychain'
+]
+
+
+class BrowserPoolFullError(Exception):
+    """Fila de espera do pool de navegadores está cheia"""
+
+
+class BrowserPool:
+    """Pool de navegadores Chromium reutilizados entre requisições"""
+
+    def __init__(self, size: int = None, max_queue: int = None,
+                 contexts_per_browser: int = None, acquire_timeout: float = None):
+        self.size = size or int(os.getenv('BROWSER_POOL_SIZE', '2'))
+        self.max_queue = max_queue if max_queue is not None else int(os.getenv('BROWSER_POOL_MAX_QUEUE', '20'))
+        self.contexts_per_browser = contexts_per_browser or int(os.getenv('BROWSER_POOL_CONTEXTS_PER_BROWSER', '3'))
+        self.acquire_timeout = acquire_timeout or float(os.getenv('BROWSER_POOL_ACQUIRE_TIMEOUT', '60'))
+
+        self._playwright = None
+        self._browsers: List[Any] = []
+        self._active_contexts: List[int] = []
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._launch_lock: Optional[asyncio.Lock] = None
+        self._waiting = 0
+        self._started = False
+        # BrowserSupervisor opcional (recebe eventos de lançamento, uso e erro por navegador)
+        self.supervisor = None
+
+        self.stats = {
+            "contexts_served": 0,
+            "rejected_queue_full": 0,
+            "acquire_timeouts": 0,
+            "browser_relaunches": 0
+        }
+
+    @property
+    def is_running(self) -> bool:
+        return self._started
+
+    async def start(self):
+        """Inicia o Playwright e lança os navegadores do pool"""
+        if self._started:
+            return
+
+        print(f"🚀 [BROWSER-POOL] Iniciando pool com {self.size} navegador(es), "
+              f"{self.contexts_per_browser} contexto(s) por navegador, fila máxima {self.max_queue}")
+
+        self._playwright = await async_playwright().start()
+        self._slots = asyncio.Semaphore(self.size * self.contexts_per_browser)
+        self._launch_lock = asyncio.Lock()
+
+        try:
+            for index in range(self.size):
+                self._browsers.append(await self._launch_browser())
+                self._active_contexts.append(0)
+                if self.supervisor:
+                    self.supervisor.on_launch(index)
+        except Exception:
+            await self.stop()
+            raise
+
+        self._started = True
+        print(f"✅ [BROWSER-POOL] {len(self._browsers)} navegador(es) aquecido(s)")
+
+    async def stop(self):
+        """Fecha todos os navegadores e encerra o Playwright"""
+        print("🔄 [BROWSER-POOL] Encerrando pool de navegadores...")
+        self._started = False
+
+        for browser in self._browsers:
+            try:
+                await browser.close()
+            except Exception as e:
+                print(f"⚠️ [BROWSER-POOL] Erro ao fechar navegador: {e}")
+
+        self._browsers = []
+        self._active_contexts = []
+
+        if self._playwright:
+            try:
+                await self._playwright.stop()
+            except Exception as e:
+                print(f"⚠️ [BROWSER-POOL] Erro ao encerrar Playwright: {e}")
+            self._playwright = None
+
+        print("✅ [BROWSER-POOL] Pool encerrado")
+
+    async def _launch_browser(self):
+        """Lança um navegador Chromium com os argumentos do pool"""
+        return await self._playwright.chromium.launch(
+            headless=True,
+            args=BROWSER_ARGS,
+            timeout=30000
+        )
+
+    async def get_browser(self):
+        """Retorna um navegador conectado do pool (o menos ocupado)"""
+        if not self._started:
+            raise RuntimeError("Pool de navegadores não foi iniciado")
+        index = await self._pick_browser()
+        return self._browsers[index]
+
+    async def _pick_browser(self) -> int:
+        """Escolhe o navegador com menos contextos ativos, relançando se desconectado"""
+        async with self._launch_lock:
+            candidates = list(range(len(self._browsers)))
+            if self.supervisor:
+                # Navegadores marcados para reciclagem não recebem trabalho novo (se houver outro)
+                candidates = [i for i in candidates if not self.supervisor.is_draining(i)] or candidates
+            index = min(candidates, key=lambda i: self._active_contexts[i])
+
+            if not self._browsers[index].is_connected():
+                print(f"⚠️ [BROWSER-POOL] Navegador #{index} desconectado, relançando...")
+                if self.supervisor:
+                    self.supervisor.on_crash(index)
+                await self._swap_browser(index)
+
+            return index
+
+    async def _swap_browser(self, index: int):
+        """Troca o navegador do slot por um novo e fecha o antigo (chamar com _launch_lock)"""
+        old_browser = self._browsers[index]
+        self._browsers[index] = await self._launch_browser()
+        self._active_contexts[index] = 0
+        self.stats["browser_relaunches"] += 1
+        if self.supervisor:
+            self.supervisor.on_launch(index)
+        try:
+            if old_browser.is_connected():
+                await old_browser.close()
+        except Exception as e:
+            print(f"⚠️ [BROWSER-POOL] Erro ao fechar navegador antigo #{index}: {e}")
+
+    async def replace_browser(self, index: int):
+        """Recicla/relança o navegador de um slot (usado pelo supervisor)"""
+        if not self._started:
+            return
+        async with self._launch_lock:
+            print(f"🔄 [BROWSER-POOL] Substituindo navegador #{index}...")
+            await self._swap_browser(index)
+
+    def track_lease(self, browser) -> Optional[int]:
+        """Registra um uso do navegador fora de context() (ex: abas do PagePool)"""
+        for index, candidate in enumerate(self._browsers):
+            if candidate is browser:
+                self._active_contexts[index] += 1
+                if self.supervisor:
+                    self.supervisor.on_lease(index)
+                return index
+        return None
+
+    def track_release(self, index: Optional[int], browser, ok: bool):
+        """Libera um uso registrado; ignora se o navegador do slot já foi trocado"""
+        if index is None or index >= len(self._browsers) or self._browsers[index] is not browser:
+            return
+        self._active_contexts[index] = max(0, self._active_contexts[index] - 1)
+        if self.supervisor:
+            self.supervisor.on_release(index, ok)
+
+    @asynccontextmanager
+    async def context(self, init_script: str = None, default_timeout: int = None, **context_options):
+        """Entrega um contexto novo em um navegador aquecido e o fecha ao final"""
+        if not self._started:
+            raise RuntimeError("Pool de navegadores não foi iniciado")
+
+        if self._waiting >= self.max_queue:
+            self.stats["rejected_queue_full"] += 1
+            raise BrowserPoolFullError(
+                f"Fila do pool de navegadores cheia ({self._waiting} requisições aguardando)"
+            )
+
+        self._waiting += 1
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=self.acquire_timeout)
+        except asyncio.TimeoutError:
+            self.stats["acquire_timeouts"] += 1
+            raise BrowserPoolFullError(
+                f"Timeout de {self.acquire_timeout}s aguardando navegador livre no pool"
+            )
+        finally:
+            self._waiting -= 1
+
+        index = None
+        browser = None
+        context = None
+        ok = False
+        try:
+            index = await self._pick_browser()
+            browser = self._browsers[index]
+            self.track_lease(browser)
+
+            context = await browser.new_context(**context_options)
+            if default_timeout:
+                context.set_default_timeout(default_timeout)
+                context.set_default_navigation_timeout(default_timeout)
+            if init_script:
+                await context.add_init_script(init_script)
+
+            self.stats["contexts_served"] += 1
+            yield context
+            ok = True
+
+        finally:
+            if context is not None:
+                try:
+                    await context.close()
+                except Exception as e:
+                    print(f"⚠️ [BROWSER-POOL] Erro ao fechar contexto: {e}")
+            if browser is not None:
+                self.track_release(index, browser, ok)
+            self._slots.release()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retorna o estado atual do pool"""
+        return {
+            "running": self._started,
+            "size": self.size,
+            "contexts_per_browser": self.contexts_per_browser,
+            "max_queue": self.max_queue,
+            "waiting": self._waiting,
+            "active_contexts": list(self._active_contexts),
+            **self.stats
+        }
+
+
+class PagePool:
+    """Pool de abas (Page) aquecidas, com script anti-automação e headers já aplicados"""
+
+    def __init__(self, browser_pool: BrowserPool, max_pages: int = None, warm_pages: int = None,
+                 clear_storage: bool = None, max_uses: int = None):
+        self.browser_pool = browser_pool
+        self.max_pages = max_pages or int(os.getenv('PAGE_POOL_SIZE', '4'))
+        self.warm_pages = warm_pages if warm_pages is not None else int(os.getenv('PAGE_POOL_WARM', '2'))
+        self.clear_storage = clear_storage if clear_storage is not None else \
+            os.getenv('PAGE_POOL_CLEAR_STORAGE', 'true').lower() == 'true'
+        self.max_uses = max_uses or int(os.getenv('PAGE_POOL_MAX_USES', '50'))
+
+        # Por perfil: configuração, contexto persistente (mantém cookies), abas livres e limite de abas
+        self._profiles: Dict[str, Dict[str, Any]] = {}
+        # Função opcional que retorna chaves de localStorage a preservar no reset (ex: consentimento)
+        self.preserve_storage_keys = None
+
+        self.stats = {
+            "pages_created": 0,
+            "pages_reused": 0,
+            "pages_discarded": 0
+        }
+
+    @property
+    def is_running(self) -> bool:
+        return self.browser_pool is not None and self.browser_pool.is_running
+
+    def register_profile(self, name: str, init_script: str = None, default_timeout: int = None,
+                         **context_options):
+        """Registra um perfil de aba (idempotente; atualiza as opções usadas em contextos recriados)"""
+        if name in self._profiles:
+            self._profiles[name]["context_options"] = context_options
+            return
+        self._profiles[name] = {
+            "init_script": init_script,
+            "default_timeout": default_timeout,
+            "context_options": context_options,
+            "context": None,
+            "idle": [],
+            "uses": {},
+            "slots": asyncio.Semaphore(self.max_pages),
+            "lock": asyncio.Lock()
+        }
+
+    async def warm_up(self):
+        """Pré-cria abas para todos os perfis registrados"""
+        for name, profile in self._profiles.items():
+            missing = self.warm_pages - len(profile["idle"])
+            for _ in range(max(0, missing)):
+                try:
+                    profile["idle"].append(await self._new_page(profile))
+                except Exception as e:
+                    print(f"⚠️ [PAGE-POOL] Erro ao aquecer aba do perfil '{name}': {e}")
+                    break
+            print(f"🔥 [PAGE-POOL] Perfil '{name}' com {len(profile['idle'])} aba(s) pronta(s)")
+
+    async def _get_context(self, profile: Dict[str, Any]):
+        """Retorna o contexto persistente do perfil, recriando se o navegador caiu"""
+        async with profile["lock"]:
+            context = profile["context"]
+            if context is not None and context.browser is not None and context.browser.is_connected():
+                return context
+
+            browser = await self.browser_pool.get_browser()
+            context = await browser.new_context(**profile["context_options"])
+            if profile["default_timeout"]:
+                context.set_default_timeout(profile["default_timeout"])
+                context.set_default_navigation_timeout(profile["default_timeout"])
+            if profile["init_script"]:
+                await context.add_init_script(profile["init_script"])
+
+            profile["context"] = context
+            profile["idle"] = []
+            profile["uses"] = {}
+            return context
+
+    async def _new_page(self, profile: Dict[str, Any]):
+        context = await self._get_context(profile)
+        page = await context.new_page()
+        profile["uses"][id(page)] = 0
+        self.stats["pages_created"] += 1
+        return page
+
+    async def _reset_page(self, page):
+        """Limpa a aba para o próximo uso (cookies do contexto são mantidos)"""
+        if self.clear_storage:
+            keep_keys = self.preserve_storage_keys() if self.preserve_storage_keys else []
+            try:
+                await page.evaluate("""(keepKeys) => {
+                    try {
+                        const kept = {};
+                        keepKeys.forEach(k => { const v = localStorage.getItem(k); if (v !== null) kept[k] = v; });
+                        localStorage.clear();
+                        sessionStorage.clear();
+                        Object.entries(kept).forEach(([k, v]) => localStorage.setItem(k, v));
+                    } catch (e) {}
+                }""", keep_keys)
+            except Exception:
+                pass
+        await page.goto('about:blank')
+
+    async def _discard_page(self, profile: Dict[str, Any], page):
+        profile["uses"].pop(id(page), None)
+        self.stats["pages_discarded"] += 1
+        try:
+            if not page.is_closed():
+                await page.close()
+        except Exception:
+            pass
+
+    @asynccontextmanager
+    async def page(self, profile_name: str, init_script: str = None, default_timeout: int = None,
+                   **context_options):
+        """Entrega uma aba pronta do perfil e a devolve ao pool depois de resetada"""
+        self.register_profile(profile_name, init_script=init_script,
+                              default_timeout=default_timeout, **context_options)
+        profile = self._profiles[profile_name]
+
+        await profile["slots"].acquire()
+        page = None
+        healthy = False
+        try:
+            while profile["idle"]:
+                candidate = profile["idle"].pop()
+                if candidate.is_closed() or not candidate.context.browser.is_connected():
+                    await self._discard_page(profile, candidate)
+                    continue
+                page = candidate
+                self.stats["pages_reused"] += 1
+                break
+
+            if page is None:
+                page = await self._new_page(profile)
+
+            profile["uses"][id(page)] = profile["uses"].get(id(page), 0) + 1
+            browser = page.context.browser
+            lease = self.browser_pool.track_lease(browser)
+            try:
+                yield page
+                healthy = True
+            finally:
+                self.browser_pool.track_release(lease, browser, healthy)
+
+        finally:
+            if page is not None:
+                reusable = healthy and not page.is_closed() and \
+                    profile["uses"].get(id(page), 0) < self.max_uses
+                if reusable:
+                    try:
+                        await self._reset_page(page)
+                        profile["idle"].append(page)
+                    except Exception:
+                        await self._discard_page(profile, page)
+                else:
+                    await self._discard_page(profile, page)
+            profile["slots"].release()
+
+    async def close(self):
+        """Fecha abas e contextos persistentes de todos os perfis"""
+        for profile in self._profiles.values():
+            for page in profile["idle"]:
+                try:
+                    await page.close()
+                except Exception:
+                    pass
+            profile["idle"] = []
+            if profile["context"] is not None:
+                try:
+                    await profile["context"].close()
+                except Exception:
+                    pass
+                profile["context"] = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retorna o estado atual do pool de abas"""
+        return {
+            "max_pages": self.max_pages,
+            "profiles": {name: {"idle_pages": len(profile["idle"])}
+                         for name, profile in self._profiles.items()},
+            **self.stats
+        }
+
+
+@asynccontextmanager
+async def browser_context(pool: Optional[BrowserPool], create_browser_context,
+                          init_script: str = None, default_timeout: int = None,
+                          **context_options):
+    """Abre um contexto no pool compartilhado ou, sem pool, lança um navegador dedicado"""
+    if pool is not None and pool.is_running:
+        async with pool.context(init_script=init_script, default_timeout=default_timeout,
+                                **context_options) as context:
+            yield context
+        return
+
+    # Fallback: comportamento original (um navegador por requisição)
+    async with async_playwright() as playwright:
+        browser, context = await create_browser_context(playwright)
+        try:
+            yield context
+        finally:
+            await browser.close()
+
+
+@asynccontextmanager
+async def browser_page(page_pool: Optional[PagePool], profile_name: str,
+                       browser_pool: Optional[BrowserPool], create_browser_context,
+                       init_script: str = None, default_timeout: int = None,
+                       **context_options):
+    """Entrega uma aba aquecida do pool de abas ou, sem ele, uma aba em um contexto novo"""
+    if page_pool is not None and page_pool.is_running:
+        async with page_pool.page(profile_name, init_script=init_script,
+                                  default_timeout=default_timeout, **context_options) as page:
+            yield page
+        return
+
+    async with browser_context(browser_pool, create_browser_context, init_script=init_script,
+                               default_timeout=default_timeout, **context_options) as context:
+        page = await context.new_page()
+        try:
+            yield page
+        finally:
+            try:
+                await page.close()
+            except Exception:
+                pass
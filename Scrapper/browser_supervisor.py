@@ -0,0 +1,262 @@
+"""
+Supervisor de Saúde dos Navegadores
+Acompanha RSS, abas servidas e taxa de erro de cada navegador do pool, recicla navegadores
+que passam dos limites, relança navegadores que caíram e repete uma vez o job interrompido
+"""
+
+import os
+import time
+import asyncio
+import functools
+from typing import Optional, Dict, Any, List
+
+# Mensagens do Playwright que indicam que o navegador/contexto caiu durante o job
+BROWSER_CRASH_MARKERS = (
+    "target closed",
+    "target page, context or browser has been closed",
+    "browser has been closed",
+    "browser has disconnected",
+    "browser closed",
+    "connection closed",
+    "page crashed"
+)
+
+# Contadores de jobs repetidos (compartilhados por todos os serviços)
+retry_stats = {
+    "jobs_retried": 0,
+    "jobs_recovered": 0,
+    "jobs_failed_after_retry": 0
+}
+
+
+class BrowserCrashError(RuntimeError):
+    """O navegador caiu de novo na repetição do job (a API responde 503: o cliente pode tentar de novo)"""
+
+
+def is_browser_crash(error: Exception) -> bool:
+    """Verifica se a exceção veio de um navegador/contexto que caiu"""
+    if type(error).__name__ == "TargetClosedError":
+        return True
+    message = str(error).lower()
+    return any(marker in message for marker in BROWSER_CRASH_MARKERS)
+
+
+def retry_on_browser_crash(failure_message: str):
+    """
+    Decorador para jobs de scraping: se o navegador cair no meio do job, repete uma vez
+    (o pool entrega um navegador novo); se cair de novo, lança BrowserCrashError
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            for attempt in (1, 2):
+                try:
+                    result = await func(*args, **kwargs)
+                    if attempt == 2:
+                        retry_stats["jobs_recovered"] += 1
+                    return result
+                except Exception as e:
+                    if not is_browser_crash(e):
+                        raise
+                    if attempt == 1:
+                        retry_stats["jobs_retried"] += 1
+                        print(f"♻️ [SUPERVISOR] Navegador caiu durante {func.__name__} ({e}), repetindo em navegador novo...")
+                        continue
+                    retry_stats["jobs_failed_after_retry"] += 1
+                    raise BrowserCrashError(f"{failure_message}: navegador caiu duas vezes ({str(e)})") from e
+        return wrapper
+    return decorator
+
+
+def _read_rss_bytes(pid: int) -> int:
+    """RSS de um processo via /proc (Linux); 0 quando indisponível"""
+    try:
+        with open(f"/proc/{pid}/statm", 'r') as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf('SC_PAGE_SIZE')
+    except Exception:
+        return 0
+
+
+class BrowserSupervisor:
+    """Monitora os navegadores de um BrowserPool e decide quando reciclá-los"""
+
+    def __init__(self, pool, max_rss_mb: float = None, max_pages_served: int = None,
+                 max_error_rate: float = None, error_rate_min_jobs: int = None,
+                 check_interval: float = None, drain_timeout: float = None):
+        self.pool = pool
+        self.max_rss_mb = max_rss_mb or float(os.getenv('BROWSER_MAX_RSS_MB', '1024'))
+        self.max_pages_served = max_pages_served or int(os.getenv('BROWSER_MAX_PAGES_SERVED', '200'))
+        self.max_error_rate = max_error_rate or float(os.getenv('BROWSER_MAX_ERROR_RATE', '0.5'))
+        self.error_rate_min_jobs = error_rate_min_jobs or int(os.getenv('BROWSER_ERROR_RATE_MIN_JOBS', '10'))
+        self.check_interval = check_interval or float(os.getenv('BROWSER_SUPERVISOR_INTERVAL', '30'))
+        self.drain_timeout = drain_timeout or float(os.getenv('BROWSER_DRAIN_TIMEOUT', '120'))
+
+        self._records: List[Dict[str, Any]] = []
+        self._task: Optional[asyncio.Task] = None
+
+        self.stats = {
+            "recycles": 0,
+            "crash_restarts": 0,
+            "checks": 0
+        }
+
+        pool.supervisor = self
+
+    # --- Hooks chamados pelo BrowserPool ---
+
+    def _record(self, index: int) -> Dict[str, Any]:
+        while len(self._records) <= index:
+            self._records.append({
+                "generation": 0,
+                "launched_at": time.time(),
+                "pages_served": 0,
+                "jobs": 0,
+                "errors": 0,
+                "rss_mb": None,
+                "draining": False,
+                "draining_since": None,
+                "recycle_reason": None
+            })
+        return self._records[index]
+
+    def on_launch(self, index: int):
+        """Novo navegador no slot: zera contadores da geração"""
+        record = self._record(index)
+        record.update({
+            "generation": record["generation"] + 1,
+            "launched_at": time.time(),
+            "pages_served": 0,
+            "jobs": 0,
+            "errors": 0,
+            "rss_mb": None,
+            "draining": False,
+            "draining_since": None,
+            "recycle_reason": None
+        })
+
+    def on_crash(self, index: int):
+        self.stats["crash_restarts"] += 1
+        print(f"💥 [SUPERVISOR] Navegador #{index} caiu, relançando")
+
+    def on_lease(self, index: int):
+        self._record(index)["pages_served"] += 1
+
+    def on_release(self, index: int, ok: bool):
+        record = self._record(index)
+        record["jobs"] += 1
+        if not ok:
+            record["errors"] += 1
+
+    def is_draining(self, index: int) -> bool:
+        return index < len(self._records) and self._records[index]["draining"]
+
+    # --- Monitoramento ---
+
+    async def start(self):
+        """Inicia o laço de monitoramento em background"""
+        for index in range(len(self.pool._browsers)):
+            self._record(index)
+        if self._task is None:
+            self._task = asyncio.create_task(self._monitor())
+            print(f"🩺 [SUPERVISOR] Monitorando navegadores a cada {self.check_interval}s "
+                  f"(RSS máx {self.max_rss_mb}MB, {self.max_pages_served} abas, erro máx {self.max_error_rate:.0%})")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _monitor(self):
+        while True:
+            await asyncio.sleep(self.check_interval)
+            try:
+                await self.check()
+            except Exception as e:
+                print(f"⚠️ [SUPERVISOR] Erro na verificação dos navegadores: {e}")
+
+    async def _measure_rss_mb(self, browser) -> Optional[float]:
+        """Soma o RSS do processo do navegador e de seus filhos (pids via CDP)"""
+        try:
+            session = await browser.new_browser_cdp_session()
+            try:
+                info = await session.send("SystemInfo.getProcessInfo")
+            finally:
+                await session.detach()
+        except Exception:
+            return None
+        total = sum(_read_rss_bytes(process["id"]) for process in info.get("processInfo", []))
+        return round(total / (1024 * 1024), 1) if total else None
+
+    def _recycle_reason(self, record: Dict[str, Any]) -> Optional[str]:
+        if record["rss_mb"] is not None and record["rss_mb"] > self.max_rss_mb:
+            return f"rss {record['rss_mb']}MB > {self.max_rss_mb}MB"
+        if record["pages_served"] >= self.max_pages_served:
+            return f"{record['pages_served']} abas servidas"
+        if record["jobs"] >= self.error_rate_min_jobs:
+            error_rate = record["errors"] / record["jobs"]
+            if error_rate > self.max_error_rate:
+                return f"taxa de erro {error_rate:.0%}"
+        return None
+
+    async def check(self):
+        """Mede cada navegador, relança os que caíram e recicla os que passaram dos limites"""
+        self.stats["checks"] += 1
+        for index, browser in enumerate(list(self.pool._browsers)):
+            record = self._record(index)
+
+            if not browser.is_connected():
+                self.on_crash(index)
+                await self.pool.replace_browser(index)
+                continue
+
+            record["rss_mb"] = await self._measure_rss_mb(browser)
+
+            if not record["draining"]:
+                reason = self._recycle_reason(record)
+                if reason:
+                    # Para de receber trabalho novo e espera os jobs em andamento terminarem
+                    record["draining"] = True
+                    record["draining_since"] = time.time()
+                    record["recycle_reason"] = reason
+                    print(f"🔁 [SUPERVISOR] Navegador #{index} será reciclado: {reason}")
+
+            if record["draining"]:
+                drained = self.pool._active_contexts[index] == 0
+                timed_out = time.time() - record["draining_since"] > self.drain_timeout
+                if drained or timed_out:
+                    self.stats["recycles"] += 1
+                    await self.pool.replace_browser(index)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Estado por navegador para o /health"""
+        now = time.time()
+        return {
+            "thresholds": {
+                "max_rss_mb": self.max_rss_mb,
+                "max_pages_served": self.max_pages_served,
+                "max_error_rate": self.max_error_rate
+            },
+            "browsers": [
+                {
+                    "index": index,
+                    "connected": index < len(self.pool._browsers) and self.pool._browsers[index].is_connected(),
+                    "generation": record["generation"],
+                    "uptime_seconds": round(now - record["launched_at"], 1),
+                    "pages_served": record["pages_served"],
+                    "jobs": record["jobs"],
+                    "errors": record["errors"],
+                    "error_rate": round(record["errors"] / record["jobs"], 3) if record["jobs"] else 0.0,
+                    "rss_mb": record["rss_mb"],
+                    "draining": record["draining"],
+                    "recycle_reason": record["recycle_reason"]
+                }
+                for index, record in enumerate(self._records)
+            ],
+            **self.stats,
+            **retry_stats
+        }
@@ -0,0 +1,120 @@
+"""
+Estado de Consentimento Persistido
+Captura o storage_state do Playwright depois de aceitar o banner de cookies, salva em disco
+e o carrega em todo contexto novo, evitando o clique/espera do banner em cada navegação. A presença
+do banner (contagem do seletor, sem espera) é verificada em toda navegação: se ele voltar, é aceito e o
+estado é salvo de novo; estados mais velhos que CONSENT_STATE_MAX_AGE_HOURS são regravados a partir do contexto
+"""
+
+import os
+import json
+import time
+import asyncio
+from pathlib import Path
+from typing import Optional, Dict, Any, List
+
+from wait_strategies import readiness_waiter
+
+COOKIE_BUTTON_SELECTOR = 'button:has-text("Accept"), button:has-text("Aceitar"), [data-testid="cookie-accept"]'
+
+
+class ConsentStateStore:
+    """Guarda o estado pós-consentimento e decide quando ainda é preciso procurar o banner"""
+
+    def __init__(self, path: str = None, enabled: bool = None, max_age_hours: float = None):
+        self.path = Path(path or os.getenv('CONSENT_STATE_PATH', 'data/consent_state.json'))
+        self.enabled = enabled if enabled is not None else \
+            os.getenv('CONSENT_STATE_ENABLED', 'true').lower() == 'true'
+        self.max_age_hours = max_age_hours or float(os.getenv('CONSENT_STATE_MAX_AGE_HOURS', '168'))
+        self._lock = asyncio.Lock()
+        self._keys_cache = (None, [])
+
+        self.stats = {
+            "banner_checks": 0,
+            "banner_accepted": 0,
+            "state_saves": 0,
+            "stale_refreshes": 0,
+            "save_errors": 0
+        }
+
+    def has_state(self) -> bool:
+        return self.enabled and self.path.exists()
+
+    def is_fresh(self) -> bool:
+        """Estado existe e não passou da idade máxima"""
+        if not self.has_state():
+            return False
+        age_hours = (time.time() - self.path.stat().st_mtime) / 3600
+        return age_hours < self.max_age_hours
+
+    def context_options(self) -> Dict[str, Any]:
+        """Opções para browser.new_context carregando o estado salvo (se houver)"""
+        if self.has_state():
+            return {"storage_state": str(self.path)}
+        return {}
+
+    def storage_keys(self) -> List[str]:
+        """Chaves de localStorage do estado salvo (preservadas no reset das abas do pool)"""
+        if not self.has_state():
+            return []
+        try:
+            mtime = self.path.stat().st_mtime
+            if self._keys_cache[0] != mtime:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    state = json.load(f)
+                keys = [item["name"] for origin in state.get("origins", []) for item in origin.get("localStorage", [])]
+                self._keys_cache = (mtime, keys)
+            return self._keys_cache[1]
+        except Exception:
+            return []
+
+    async def save(self, context):
+        """Salva o storage_state do contexto (escrita atômica)"""
+        async with self._lock:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_suffix('.tmp')
+                await context.storage_state(path=str(tmp_path))
+                os.replace(tmp_path, self.path)
+                self.stats["state_saves"] += 1
+                print(f"💾 [CONSENT] Estado de consentimento salvo em {self.path}")
+            except Exception as e:
+                self.stats["save_errors"] += 1
+                print(f"⚠️ [CONSENT] Erro ao salvar estado de consentimento: {e}")
+
+    async def handle_banner(self, page, fallback_delay: Optional[float] = None) -> bool:
+        """
+        Aceita o banner de cookies se ele aparecer e atualiza o estado salvo.
+        Sem banner, só a contagem do seletor é feita (sem clique nem espera); um estado salvo
+        vencido é regravado a partir do contexto atual
+        """
+        self.stats["banner_checks"] += 1
+        try:
+            cookie_button = page.locator(COOKIE_BUTTON_SELECTOR)
+            if await cookie_button.count() == 0:
+                if self.has_state() and not self.is_fresh():
+                    self.stats["stale_refreshes"] += 1
+                    await self.save(page.context)
+                return False
+            await cookie_button.first.click()
+            print("🍪 Cookies aceitos")
+            await readiness_waiter.wait_for(page, "cookie_dismissed", fallback_delay=fallback_delay)
+        except Exception:
+            return False  # Ignorar se não houver banner de cookies
+
+        self.stats["banner_accepted"] += 1
+        if self.enabled:
+            await self.save(page.context)
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "path": str(self.path),
+            "has_state": self.has_state(),
+            **self.stats
+        }
+
+
+# Instância compartilhada pelos serviços (screenshot, scraping e links usam o mesmo estado)
+consent_store = ConsentStateStore()
@@ -11,9 +11,15 @@ from typing import Optional, Dict, Any, List
 from supabase import create_client, Client
 from dotenv import load_dotenv
 
+from executors import executors
+
 # Carregar variáveis de ambiente
 load_dotenv()
 
+# match_info.monitor_state das partidas acompanhadas pelo LiveScheduler. O monitoramento fica em colunas
+# próprias (monitoring_enabled/monitor_state): match_info.status é sobrescrito por outros fluxos (screenshot etc.)
+MONITOR_STATE_MONITORING = "monitoring"
+
 class DatabaseService:
     """Serviço para gerenciar dados no Supabase"""
     
@@ -26,11 +32,15 @@ class DatabaseService:
         
         self.client: Client = create_client(self.supabase_url, self.supabase_key)
     
+    async def _execute(self, query):
+        """Executa a consulta (cliente síncrono) no pool de threads de I/O, sem bloquear o event loop"""
+        return await executors.run_io(query.execute, name="supabase_query")
+    
     async def test_connection(self) -> bool:
         """Testa a conectividade com o Supabase"""
         try:
             # Tentar fazer uma consulta simples
-            result = self.client.table('match_info').select('id').limit(1).execute()
+            result = await self._execute(self.client.table('match_info').select('id').limit(1))
             
             if hasattr(result, 'data'):
                 return True
@@ -89,6 +99,9 @@ class DatabaseService:
                 match_date TIMESTAMP WITH TIME ZONE,
                 status VARCHAR(50),
                 is_active BOOLEAN DEFAULT true,
+                monitoring_enabled BOOLEAN DEFAULT false,
+                monitor_state VARCHAR(30),
+                team_names_source VARCHAR(20),
                 created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
                 updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
             );
@@ -119,6 +132,11 @@ class DatabaseService:
             CREATE INDEX IF NOT EXISTS idx_match_info_match_id ON match_info(match_id);
             CREATE INDEX IF NOT EXISTS idx_match_info_status ON match_info(status);
             CREATE INDEX IF NOT EXISTS idx_match_info_is_active ON match_info(is_active);
+            -- Bancos criados antes do monitoramento ao vivo
+            ALTER TABLE match_info ADD COLUMN IF NOT EXISTS monitoring_enabled BOOLEAN DEFAULT false;
+            ALTER TABLE match_info ADD COLUMN IF NOT EXISTS monitor_state VARCHAR(30);
+            ALTER TABLE match_info ADD COLUMN IF NOT EXISTS team_names_source VARCHAR(20);
+            CREATE INDEX IF NOT EXISTS idx_match_info_monitoring_enabled ON match_info(monitoring_enabled);
             CREATE INDEX IF NOT EXISTS idx_match_info_match_date ON match_info(match_date);
             
             -- Índices para screenshot_analysis
@@ -222,7 +240,7 @@ class DatabaseService:
             
             for table_name in tables_to_check:
                 try:
-                    result = self.client.table(table_name).select('id').limit(1).execute()
+                    result = await self._execute(self.client.table(table_name).select('id').limit(1))
                 except Exception:
                     missing_tables.append(table_name)
             
@@ -252,7 +270,7 @@ class DatabaseService:
                 'analysis_text': analysis
             }
             
-            result = self.client.table('match_data').insert(data_to_insert).execute()
+            result = await self._execute(self.client.table('match_data').insert(data_to_insert))
             
             if result.data:
                 return record_id
@@ -267,12 +285,11 @@ class DatabaseService:
     async def get_match_data(self, match_id: str, limit: int = 10) -> List[Dict[str, Any]]:
         """Recupera dados de uma partida específica"""
         try:
-            result = self.client.table('match_data')\
+            result = await self._execute(self.client.table('match_data')\
                 .select('*')\
                 .eq('match_id', match_id)\
                 .order('collected_at', desc=True)\
-                .limit(limit)\
-                .execute()
+                .limit(limit))
             
             return result.data if result.data else []
             
@@ -283,12 +300,11 @@ class DatabaseService:
     async def get_latest_match_data(self, match_id: str) -> Optional[Dict[str, Any]]:
         """Recupera os dados mais recentes de uma partida"""
         try:
-            result = self.client.table('match_data')\
+            result = await self._execute(self.client.table('match_data')\
                 .select('*')\
                 .eq('match_id', match_id)\
                 .order('collected_at', desc=True)\
-                .limit(1)\
-                .execute()
+                .limit(1))
             
             return result.data[0] if result.data else None
             
@@ -299,12 +315,11 @@ class DatabaseService:
     async def get_match_history(self, match_id: str, limit: int = 10) -> List[Dict[str, Any]]:
         """Recupera o histórico de coletas de uma partida específica"""
         try:
-            result = self.client.table('match_data')\
+            result = await self._execute(self.client.table('match_data')\
                 .select('id, match_id, collected_at, created_at, updated_at')\
                 .eq('match_id', match_id)\
                 .order('collected_at', desc=True)\
-                .limit(limit)\
-                .execute()
+                .limit(limit))
             
             # Formatar dados para resposta mais amigável
             history = []
@@ -338,7 +353,7 @@ class DatabaseService:
                 'links_data': {'filtered_links': links_data}
             }
             
-            result = self.client.table('filtered_links').insert(data_to_insert).execute()
+            result = await self._execute(self.client.table('filtered_links').insert(data_to_insert))
             
             if result.data:
                 return record_id
@@ -353,11 +368,10 @@ class DatabaseService:
     async def get_filtered_links(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Recupera links filtrados mais recentes"""
         try:
-            result = self.client.table('filtered_links')\
+            result = await self._execute(self.client.table('filtered_links')\
                 .select('*')\
                 .order('collection_timestamp', desc=True)\
-                .limit(limit)\
-                .execute()
+                .limit(limit))
             
             return result.data if result.data else []
             
@@ -368,11 +382,10 @@ class DatabaseService:
     async def get_latest_filtered_links(self) -> Optional[Dict[str, Any]]:
         """Recupera os links filtrados mais recentes"""
         try:
-            result = self.client.table('filtered_links')\
+            result = await self._execute(self.client.table('filtered_links')\
                 .select('*')\
                 .order('collection_timestamp', desc=True)\
-                .limit(1)\
-                .execute()
+                .limit(1))
             
             return result.data[0] if result.data else None
             
@@ -384,8 +397,11 @@ class DatabaseService:
     async def save_match_info(self, match_id: str, url_complete: str, url_slug: str = None,
                             title: str = None, home_team: str = None, away_team: str = None,
                             tournament: str = None, match_date: str = None, 
-                            status: str = None) -> Optional[str]:
-        """Salva informações da partida no Supabase"""
+                            status: str = None, team_names_source: str = None) -> Optional[str]:
+        """
+        Salva informações da partida no Supabase
+        (team_names_source: de onde vieram home_team/away_team, ver team_index.TEAM_SOURCE_*)
+        """
         try:
             # Usar upsert como estratégia principal para evitar conflitos de chave duplicada
             data_to_upsert = {
@@ -398,6 +414,7 @@ class DatabaseService:
                 'tournament': tournament,
                 'match_date': match_date,
                 'status': status,
+                'team_names_source': team_names_source,
                 'is_active': True
             }
             
@@ -405,10 +422,10 @@ class DatabaseService:
             data_to_upsert = {k: v for k, v in data_to_upsert.items() if v is not None}
             
             # Usar upsert diretamente (mais eficiente e evita erro de chave duplicada)
-            result = self.client.table('match_info').upsert(
+            result = await self._execute(self.client.table('match_info').upsert(
                 data_to_upsert, 
                 on_conflict='match_id'
-            ).execute()
+            ))
             
             if result.data and len(result.data) > 0:
                 actual_record_id = result.data[0].get('id')
@@ -424,12 +441,11 @@ class DatabaseService:
     async def get_match_info(self, match_id: str) -> Optional[Dict[str, Any]]:
         """Recupera informações de uma partida específica"""
         try:
-            result = self.client.table('match_info')\
+            result = await self._execute(self.client.table('match_info')\
                 .select('*')\
                 .eq('match_id', match_id)\
                 .eq('is_active', True)\
-                .limit(1)\
-                .execute()
+                .limit(1))
             
             return result.data[0] if result.data else None
             
@@ -440,12 +456,11 @@ class DatabaseService:
     async def get_all_active_matches(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Recupera todas as partidas ativas"""
         try:
-            result = self.client.table('match_info')\
+            result = await self._execute(self.client.table('match_info')\
                 .select('*')\
                 .eq('is_active', True)\
                 .order('created_at', desc=True)\
-                .limit(limit)\
-                .execute()
+                .limit(limit))
             
             return result.data if result.data else []
             
@@ -453,13 +468,89 @@ class DatabaseService:
             print(f"❌ Erro ao buscar partidas ativas: {e}")
             return []
     
+    async def get_team_names(self, since: Optional[str] = None,
+                             page_size: int = 1000) -> Optional[List[Dict[str, Any]]]:
+        """
+        Recupera os times de match_info alterados a partir de 'since' (sem 'since', o histórico inteiro),
+        paginando em ordem crescente de updated_at; None em caso de erro (para não avançar a marca de atualização)
+        """
+        try:
+            rows = []
+            while True:
+                query = self.client.table('match_info').select('home_team, away_team, team_names_source, updated_at')
+                if since:
+                    query = query.gte('updated_at', since)
+                result = await self._execute(query.order('updated_at')\
+                    .range(len(rows), len(rows) + page_size - 1))
+                page = result.data or []
+                rows.extend(page)
+                if len(page) < page_size:
+                    return rows
+            
+        except Exception as e:
+            print(f"❌ Erro ao buscar nomes de times: {e}")
+            return None
+    
+    async def start_match_monitoring(self, match_id: str, url_complete: str) -> bool:
+        """Marca a partida como monitorada ao vivo (retomada no próximo início da API)"""
+        try:
+            monitoring = {
+                'monitoring_enabled': True,
+                'monitor_state': MONITOR_STATE_MONITORING,
+                'is_active': True
+            }
+            result = await self._execute(self.client.table('match_info')\
+                .update(monitoring)\
+                .eq('match_id', match_id))
+            
+            if not result.data:
+                # Partida ainda não registrada em match_info
+                result = await self._execute(self.client.table('match_info').insert({
+                    'match_id': match_id,
+                    'url_complete': url_complete,
+                    **monitoring
+                }))
+            
+            return bool(result.data)
+            
+        except Exception as e:
+            print(f"❌ Erro ao registrar monitoramento da partida: {e}")
+            return False
+    
+    async def get_monitored_matches(self, limit: int = 200) -> List[Dict[str, Any]]:
+        """Recupera as partidas ativas marcadas como monitoradas ao vivo"""
+        try:
+            result = await self._execute(self.client.table('match_info')\
+                .select('match_id, url_complete, home_team, away_team, updated_at')\
+                .eq('is_active', True)\
+                .eq('monitoring_enabled', True)\
+                .limit(limit))
+            
+            return result.data if result.data else []
+            
+        except Exception as e:
+            print(f"❌ Erro ao buscar partidas monitoradas: {e}")
+            return []
+    
+    async def stop_match_monitoring(self, match_id: str, monitor_state: str) -> bool:
+        """Desmarca o monitoramento ao vivo (finished, failed, stopped), sem tocar em match_info.status"""
+        try:
+            result = await self._execute(self.client.table('match_info')\
+                .update({'monitoring_enabled': False, 'monitor_state': monitor_state})\
+                .eq('match_id', match_id))
+            
+            return bool(result.data)
+            
+        except Exception as e:
+            print(f"❌ Erro ao encerrar monitoramento da partida: {e}")
+            return False
+    
     async def update_match_status(self, match_id: str, status: str) -> bool:
         """Atualiza o status de uma partida"""
         try:
-            result = self.client.table('match_info')\
+            result = await self._execute(self.client.table('match_info')\
                 .update({'status': status})\
-                .eq('match_id', match_id)\
-                .execute()
+                .eq('match_id', match_id))
             
             if result.data:
                 return True
@@ -474,10 +565,9 @@ class DatabaseService:
     async def deactivate_match(self, match_id: str) -> bool:
         """Desativa uma partida (marca como inativa)"""
         try:
-            result = self.client.table('match_info')\
+            result = await self._execute(self.client.table('match_info')\
                 .update({'is_active': False})\
-                .eq('match_id', match_id)\
-                .execute()
+                .eq('match_id', match_id))
             
             if result.data:
                 return True
@@ -513,7 +603,7 @@ class DatabaseService:
             # Remover campos None
             data_to_insert = {k: v for k, v in data_to_insert.items() if v is not None}
             
-            result = self.client.table('screenshot_analysis').insert(data_to_insert).execute()
+            result = await self._execute(self.client.table('screenshot_analysis').insert(data_to_insert))
             
             if result.data:
                 return record_id
@@ -528,12 +618,11 @@ class DatabaseService:
     async def get_screenshot_analysis(self, match_id: str, limit: int = 10) -> List[Dict[str, Any]]:
         """Recupera análises de screenshot de uma partida específica"""
         try:
-            result = self.client.table('screenshot_analysis')\
+            result = await self._execute(self.client.table('screenshot_analysis')\
                 .select('*')\
                 .eq('match_id', match_id)\
                 .order('created_at', desc=True)\
-                .limit(limit)\
-                .execute()
+                .limit(limit))
             
             return result.data if result.data else []
             
@@ -544,12 +633,11 @@ class DatabaseService:
     async def get_latest_screenshot_analysis(self, match_id: str) -> Optional[Dict[str, Any]]:
         """Recupera a análise de screenshot mais recente de uma partida"""
         try:
-            result = self.client.table('screenshot_analysis')\
+            result = await self._execute(self.client.table('screenshot_analysis')\
                 .select('*')\
                 .eq('match_id', match_id)\
                 .order('created_at', desc=True)\
-                .limit(1)\
-                .execute()
+                .limit(1))
             
             return result.data[0] if result.data else None
             
@@ -560,11 +648,10 @@ class DatabaseService:
     async def get_all_screenshot_analyses(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Recupera todas as análises de screenshot"""
         try:
-            result = self.client.table('screenshot_analysis')\
+            result = await self._execute(self.client.table('screenshot_analysis')\
                 .select('*')\
                 .order('created_at', desc=True)\
-                .limit(limit)\
-                .execute()
+                .limit(limit))
             
             return result.data if result.data else []
             
@@ -625,6 +712,9 @@ CREATE TABLE IF NOT EXISTS match_info (
     match_date TIMESTAMP WITH TIME ZONE,
     status VARCHAR(50),
     is_active BOOLEAN DEFAULT true,
+    monitoring_enabled BOOLEAN DEFAULT false,
+    monitor_state VARCHAR(30),
+    team_names_source VARCHAR(20),
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
@@ -661,6 +751,11 @@ CREATE INDEX IF NOT EXISTS idx_filtered_links_created_at ON filtered_links(creat
 CREATE INDEX IF NOT EXISTS idx_match_info_match_id ON match_info(match_id);
 CREATE INDEX IF NOT EXISTS idx_match_info_status ON match_info(status);
 CREATE INDEX IF NOT EXISTS idx_match_info_is_active ON match_info(is_active);
+-- Bancos criados antes do monitoramento ao vivo
+ALTER TABLE match_info ADD COLUMN IF NOT EXISTS monitoring_enabled BOOLEAN DEFAULT false;
+ALTER TABLE match_info ADD COLUMN IF NOT EXISTS monitor_state VARCHAR(30);
+ALTER TABLE match_info ADD COLUMN IF NOT EXISTS team_names_source VARCHAR(20);
+CREATE INDEX IF NOT EXISTS idx_match_info_monitoring_enabled ON match_info(monitoring_enabled);
 CREATE INDEX IF NOT EXISTS idx_match_info_match_date ON match_info(match_date);
 
 -- Índices para screenshot_analysis
@@ -852,31 +947,31 @@ ORDER BY mi.created_at DESC;
             stats = {}
             
             # Estatísticas da tabela match_data
-            result = self.client.table('match_data').select('id', count='exact').execute()
+            result = await self._execute(self.client.table('match_data').select('id', count='exact'))
             stats['match_data'] = {
                 'total_records': result.count if hasattr(result, 'count') else 0
             }
             
             # Estatísticas da tabela filtered_links
-            result = self.client.table('filtered_links').select('id', count='exact').execute()
+            result = await self._execute(self.client.table('filtered_links').select('id', count='exact'))
             stats['filtered_links'] = {
                 'total_records': result.count if hasattr(result, 'count') else 0
             }
             
             # Estatísticas da tabela match_info
-            result = self.client.table('match_info').select('id', count='exact').execute()
+            result = await self._execute(self.client.table('match_info').select('id', count='exact'))
             stats['match_info'] = {
                 'total_records': result.count if hasattr(result, 'count') else 0
             }
             
             # Estatísticas da tabela screenshot_analysis
-            result = self.client.table('screenshot_analysis').select('id', count='exact').execute()
+            result = await self._execute(self.client.table('screenshot_analysis').select('id', count='exact'))
             stats['screenshot_analysis'] = {
                 'total_records': result.count if hasattr(result, 'count') else 0
             }
             
             # Partidas ativas
-            result = self.client.table('match_info').select('id', count='exact').eq('is_active', True).execute()
+            result = await self._execute(self.client.table('match_info').select('id', count='exact').eq('is_active', True))
             stats['active_matches'] = result.count if hasattr(result, 'count') else 0
             
             return stats
@@ -48,6 +48,9 @@ CREATE TABLE IF NOT EXISTS match_info (
     match_date TIMESTAMP WITH TIME ZONE,
     status VARCHAR(50),
     is_active BOOLEAN DEFAULT true,
+    monitoring_enabled BOOLEAN DEFAULT false,
+    monitor_state VARCHAR(30),
+    team_names_source VARCHAR(20),
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
@@ -84,6 +87,11 @@ CREATE INDEX IF NOT EXISTS idx_filtered_links_created_at ON filtered_links(creat
 CREATE INDEX IF NOT EXISTS idx_match_info_match_id ON match_info(match_id);
 CREATE INDEX IF NOT EXISTS idx_match_info_status ON match_info(status);
 CREATE INDEX IF NOT EXISTS idx_match_info_is_active ON match_info(is_active);
+-- Bancos criados antes do monitoramento ao vivo
+ALTER TABLE match_info ADD COLUMN IF NOT EXISTS monitoring_enabled BOOLEAN DEFAULT false;
+ALTER TABLE match_info ADD COLUMN IF NOT EXISTS monitor_state VARCHAR(30);
+ALTER TABLE match_info ADD COLUMN IF NOT EXISTS team_names_source VARCHAR(20);
+CREATE INDEX IF NOT EXISTS idx_match_info_monitoring_enabled ON match_info(monitoring_enabled);
 CREATE INDEX IF NOT EXISTS idx_match_info_match_date ON match_info(match_date);
 
 -- Índices para screenshot_analysis
@@ -0,0 +1,145 @@
+"""
+Executores Compartilhados
+Pool de processos para transformações pesadas de CPU (parsing dos containers, simplificação,
+JSON de vários MB) e pool de threads para I/O bloqueante (cliente síncrono do Supabase),
+mantendo o event loop da API livre; cada tarefa é cronometrada por nome
+"""
+
+import os
+import json
+import time
+import asyncio
+import functools
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional, Dict, Any, Callable
+
+
+class TaskExecutors:
+    """Pools de processos (CPU) e threads (I/O) iniciados no lifespan da API"""
+
+    def __init__(self, cpu_workers: int = None, io_workers: int = None):
+        self.cpu_enabled = os.getenv('EXECUTOR_CPU_ENABLED', 'true').lower() == 'true'
+        self.cpu_workers = cpu_workers or int(os.getenv('EXECUTOR_CPU_WORKERS', '0')) or min(4, os.cpu_count() or 1)
+        self.io_workers = io_workers or int(os.getenv('EXECUTOR_IO_WORKERS', '16'))
+        # JSON menor que isso é decodificado no próprio loop (enviar ao processo custaria mais)
+        self.json_offload_bytes = int(os.getenv('EXECUTOR_JSON_OFFLOAD_BYTES', str(1024 * 1024)))
+
+        self._cpu: Optional[ProcessPoolExecutor] = None
+        self._io: Optional[ThreadPoolExecutor] = None
+        # Serializa a troca do pool de processos quebrado entre chamadas simultâneas
+        self._cpu_lock = threading.Lock()
+        self.cpu_pool_restarts = 0
+        self.task_stats: Dict[str, Dict[str, Any]] = {}
+
+    def _new_cpu_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=self.cpu_workers, mp_context=multiprocessing.get_context("spawn"))
+
+    def _replace_broken_cpu_pool(self, broken: ProcessPoolExecutor, name: str):
+        """Troca o pool quebrado uma única vez (quem chegar depois encontra o pool novo) e encerra o antigo"""
+        with self._cpu_lock:
+            if self._cpu is not broken:
+                return
+            print(f"💥 [EXECUTORS] Pool de processos quebrou durante {name}, recriando...")
+            self._cpu = self._new_cpu_pool()
+            self.cpu_pool_restarts += 1
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    def start(self):
+        if self.cpu_enabled and self._cpu is None:
+            self._cpu = self._new_cpu_pool()
+        if self._io is None:
+            self._io = ThreadPoolExecutor(max_workers=self.io_workers, thread_name_prefix="io-executor")
+        print(f"🧮 [EXECUTORS] {self.cpu_workers if self._cpu else 0} processo(s) de CPU, "
+              f"{self.io_workers} thread(s) de I/O")
+
+    def shutdown(self):
+        if self._cpu is not None:
+            self._cpu.shutdown(wait=True, cancel_futures=True)
+            self._cpu = None
+        if self._io is not None:
+            self._io.shutdown(wait=True, cancel_futures=True)
+            self._io = None
+        print("✅ [EXECUTORS] Pools encerrados")
+
+    def _record(self, name: str, pool: str, elapsed_ms: float, ok: bool):
+        stats = self.task_stats.setdefault(name, {
+            "pool": pool,
+            "calls": 0,
+            "failures": 0,
+            "total_ms": 0.0,
+            "max_ms": 0.0
+        })
+        stats["pool"] = pool
+        stats["calls"] += 1
+        stats["total_ms"] += elapsed_ms
+        stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+        if not ok:
+            stats["failures"] += 1
+
+    async def _timed(self, name: str, pool: str, executor, func: Callable, args, kwargs):
+        started = time.perf_counter()
+        ok = False
+        try:
+            call = functools.partial(func, *args, **kwargs)
+            if executor is None:
+                result = call()
+            else:
+                result = await asyncio.get_running_loop().run_in_executor(executor, call)
+            ok = True
+            return result
+        finally:
+            self._record(name, pool, (time.perf_counter() - started) * 1000, ok)
+
+    async def run_cpu(self, func: Callable, *args, name: str = None, **kwargs) -> Any:
+        """
+        Executa func no pool de processos (func e argumentos precisam ser serializáveis).
+        Sem pool (desabilitado ou dentro dos processos de scraping), executa no próprio processo
+        """
+        name = name or func.__name__
+        pool = self._cpu
+        if pool is None:
+            return await self._timed(name, "inline", None, func, args, kwargs)
+        try:
+            return await self._timed(name, "process", pool, func, args, kwargs)
+        except BrokenProcessPool:
+            # Um processo morreu (ex: OOM): recria o pool e executa esta tarefa localmente
+            self._replace_broken_cpu_pool(pool, name)
+            return await self._timed(name, "inline", None, func, args, kwargs)
+
+    async def run_io(self, func: Callable, *args, name: str = None, **kwargs) -> Any:
+        """Executa uma chamada bloqueante no pool de threads (ou no executor padrão do loop)"""
+        name = name or func.__name__
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        ok = False
+        try:
+            result = await loop.run_in_executor(self._io, functools.partial(func, *args, **kwargs))
+            ok = True
+            return result
+        finally:
+            self._record(name, "thread", (time.perf_counter() - started) * 1000, ok)
+
+    async def decode_json(self, body: bytes, name: str = "json_loads") -> Any:
+        """Decodifica JSON; corpos grandes vão para o pool de processos"""
+        if len(body) < self.json_offload_bytes:
+            return json.loads(body)
+        return await self.run_cpu(json.loads, body, name=name)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "cpu_workers": self.cpu_workers if self._cpu else 0,
+            "io_workers": self.io_workers if self._io else 0,
+            "cpu_pool_restarts": self.cpu_pool_restarts,
+            "tasks": {
+                name: {**stats, "total_ms": round(stats["total_ms"], 2), "max_ms": round(stats["max_ms"], 2),
+                       "avg_ms": round(stats["total_ms"] / stats["calls"], 2) if stats["calls"] else 0.0}
+                for name, stats in self.task_stats.items()
+            }
+        }
+
+
+# Instância global (pools criados no lifespan do main.py)
+executors = TaskExecutors()
@@ -0,0 +1,82 @@
+"""
+Busca direta de JSON nos endpoints da API do SofaScore
+Usa o APIRequestContext do Playwright (mesmos cookies/cabeçalhos do contexto do navegador),
+sem renderizar página nem recortar JSON do HTML
+"""
+
+import json
+import asyncio
+from typing import Optional, Dict, Any
+
+try:
+    # Na API: JSON grande é decodificado no pool de processos
+    from executors import executors
+except ImportError:
+    # Scripts avulsos (coletor_playwright.py): decodifica no próprio processo
+    executors = None
+
+# Cabeçalhos das chamadas de API: conexão keep-alive e resposta comprimida
+API_HEADERS = {
+    'Accept': 'application/json, text/plain, */*',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive'
+}
+
+# Contadores compartilhados (expostos no /health)
+fetch_stats: Dict[str, Any] = {
+    "requests": 0,
+    "succeeded": 0,
+    "failed": 0,
+    "retries": 0,
+    "bytes_received": 0
+}
+
+
+async def fetch_json(requester, url: str, timeout: int = 20000, max_retries: int = 2,
+                     retry_delay: float = 1.0, verbose: bool = True) -> Optional[Dict[str, Any]]:
+    """
+    Busca e decodifica o JSON de um endpoint.
+
+    requester pode ser um BrowserContext ou uma Page: ambos expõem `.request`,
+    que compartilha cookies e cabeçalhos com o contexto do navegador.
+    Retorna None em falha (mesmo contrato dos antigos fetch_api_data).
+    """
+    endpoint_name = url.rstrip('/').split('/')[-1]
+    request = requester.request
+
+    for attempt in range(max_retries):
+        fetch_stats["requests"] += 1
+        if attempt > 0:
+            fetch_stats["retries"] += 1
+        try:
+            response = await request.get(url, headers=API_HEADERS, timeout=timeout)
+
+            if response.ok:
+                body = await response.body()
+                fetch_stats["bytes_received"] += len(body)
+                data = await executors.decode_json(body, name="api_json") if executors else json.loads(body)
+                fetch_stats["succeeded"] += 1
+                if verbose:
+                    print(f"✅ JSON recebido - {endpoint_name} ({len(body)} bytes)")
+                return data
+
+            if verbose:
+                print(f"❌ Status HTTP inválido: {response.status} - {endpoint_name}")
+            # 404 significa que o endpoint não existe para a partida (ex: shotmap): não adianta repetir
+            if response.status == 404:
+                break
+
+        except Exception as e:
+            if verbose:
+                print(f"❌ Erro na tentativa {attempt + 1}/{max_retries} para {endpoint_name}: {type(e).__name__} - {str(e)}")
+
+        if attempt < max_retries - 1:
+            await asyncio.sleep(retry_delay)
+
+    fetch_stats["failed"] += 1
+    return None
+
+
+def get_fetch_stats() -> Dict[str, Any]:
+    """Retorna os contadores de chamadas de API"""
+    return dict(fetch_stats)
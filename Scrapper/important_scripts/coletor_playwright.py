@@ -9,6 +9,11 @@ import sys
 from playwright.async_api import async_playwright
 from pathlib import Path
 
+try:
+    from .api_fetcher import fetch_json
+except ImportError:
+    from api_fetcher import fetch_json
+
 class PlaywrightSofaScoreCollector:
     """Coletor usando Playwright para obter shotmap"""
     
@@ -51,50 +56,29 @@ class PlaywrightSofaScoreCollector:
         """Obtém shotmap de uma partida específica"""
         async with async_playwright() as playwright:
             browser, context = await self.create_browser_context(playwright)
-            page = await context.new_page()
             
             try:
                 # Construir URL da API
                 url = f"{self.base_url}event/{match_id}/shotmap"
                 print(f"🎯 Acessando: {url}")
                 
-                # Fazer requisição para shotmap
-                response = await page.goto(url, wait_until='networkidle', timeout=30000)
-                print(f"📡 Status da resposta: {response.status}")
+                # Buscar o JSON direto pelo APIRequestContext (sem renderizar a página)
+                data = await fetch_json(context, url, timeout=30000)
                 
-                if response.status == 200:
-                    # Obter conteúdo da página
-                    content = await page.content()
+                if data is not None:
+                    print("✅ Dados JSON extraídos com sucesso!")
+                    
+                    # Salvar dados
+                    filename = f"shotmap_{match_id}.json"
+                    filepath = self.data_dir / filename
+                    
+                    with open(filepath, 'w', encoding='utf-8') as f:
+                        json.dump(data, f, indent=2, ensure_ascii=False)
                     
-                    # Tentar extrair JSON do conteúdo
-                    try:
-                        json_start = content.find('{')
-                        json_end = content.rfind('}') + 1
-                        
-                        if json_start != -1 and json_end > json_start:
-                            json_content = content[json_start:json_end]
-                            data = json.loads(json_content)
-                            print("✅ Dados JSON extraídos com sucesso!")
-                            
-                            # Salvar dados
-                            filename = f"shotmap_{match_id}.json"
-                            filepath = self.data_dir / filename
-                            
-                            with open(filepath, 'w', encoding='utf-8') as f:
-                                json.dump(data, f, indent=2, ensure_ascii=False)
-                            
-                            print(f"💾 Dados salvos em: {filepath.absolute()}")
-                            return data
-                        else:
-                            print("⚠️ Conteúdo não parece ser JSON válido")
-                            return None
-                            
-                    except json.JSONDecodeError as e:
-                        print(f"⚠️ Erro ao decodificar JSON: {e}")
-                        return None
-                        
+                    print(f"💾 Dados salvos em: {filepath.absolute()}")
+                    return data
                 else:
-                    print(f"❌ Erro na requisição: Status {response.status}")
+                    print("❌ Erro na requisição do shotmap")
                     return None
                     
             except Exception as e:
@@ -10,6 +10,9 @@ from datetime import datetime
 from playwright.async_api import async_playwright
 from pathlib import Path
 from .simplify_match_data import MatchDataSimplifier
+from .api_fetcher import fetch_json
+from .polling_policy import polling_policy
+from .snapshot_changes import snapshot_change_detector
 
 # Importar assistente técnico para integração automática
 try:
@@ -84,23 +87,12 @@ class SofaScoreLiveCollector:
         
         return browser, context
     
-    async def fetch_api_data(self, page, endpoint):
+    async def fetch_api_data(self, context, endpoint):
         """Função auxiliar para buscar dados de uma API endpoint"""
-        try:
-            response = await page.goto(endpoint, wait_until='networkidle', timeout=20000)
-            
-            if response.status == 200:
-                content = await page.content()
-                json_start = content.find('{')
-                json_end = content.rfind('}') + 1
-                
-                if json_start != -1 and json_end > json_start:
-                    json_content = content[json_start:json_end]
-                    return json.loads(json_content)
-            return None
-        except Exception as e:
-            print(f"⚠️ Erro ao buscar {endpoint}: {e}")
-            return None
+        data = await fetch_json(context, endpoint, timeout=20000, max_retries=1, verbose=False)
+        if data is None:
+            print(f"⚠️ Erro ao buscar {endpoint}")
+        return data
     
     async def run_automatic_analysis(self, simplified_filepath):
         """Executa análise técnica automática nos dados simplificados"""
@@ -169,7 +161,6 @@ class SofaScoreLiveCollector:
         """Coleta todos os dados relevantes de uma partida ao vivo"""
         async with async_playwright() as playwright:
             browser, context = await self.create_browser_context(playwright)
-            page = await context.new_page()
             
             try:
                 print(f"🔄 Coletando dados ao vivo da partida {match_id}...")
@@ -180,7 +171,7 @@ class SofaScoreLiveCollector:
                 
                 # 1. Informações básicas da partida
                 print("📊 Coletando informações básicas...")
-                basic_info = await self.fetch_api_data(page, f"{self.base_url}event/{match_id}")
+                basic_info = await self.fetch_api_data(context, f"{self.base_url}event/{match_id}")
                 if basic_info:
                     match_data['basic_info'] = {
                         'homeTeam': basic_info.get('event', {}).get('homeTeam', {}),
@@ -188,6 +179,7 @@ class SofaScoreLiveCollector:
                         'homeScore': basic_info.get('event', {}).get('homeScore', {}),
                         'awayScore': basic_info.get('event', {}).get('awayScore', {}),
                         'status': basic_info.get('event', {}).get('status', {}),
+                        'time': basic_info.get('event', {}).get('time', {}),
                         'startTimestamp': basic_info.get('event', {}).get('startTimestamp'),
                         'tournament': basic_info.get('event', {}).get('tournament', {}),
                         'season': basic_info.get('event', {}).get('season', {})
@@ -195,19 +187,19 @@ class SofaScoreLiveCollector:
                 
                 # 2. Estatísticas da partida
                 print("📈 Coletando estatísticas...")
-                stats = await self.fetch_api_data(page, f"{self.base_url}event/{match_id}/statistics")
+                stats = await self.fetch_api_data(context, f"{self.base_url}event/{match_id}/statistics")
                 if stats:
                     match_data['statistics'] = stats.get('statistics', [])
                 
                 # 3. Timeline de eventos
                 print("⏱️ Coletando timeline...")
-                timeline = await self.fetch_api_data(page, f"{self.base_url}event/{match_id}/incidents")
+                timeline = await self.fetch_api_data(context, f"{self.base_url}event/{match_id}/incidents")
                 if timeline:
                     match_data['timeline'] = timeline.get('incidents', [])
                 
                 # 4. Lineups e formações
                 print("👥 Coletando escalações...")
-                lineups = await self.fetch_api_data(page, f"{self.base_url}event/{match_id}/lineups")
+                lineups = await self.fetch_api_data(context, f"{self.base_url}event/{match_id}/lineups")
                 if lineups:
                     match_data['lineups'] = {
                         'home': lineups.get('home', {}),
@@ -218,13 +210,13 @@ class SofaScoreLiveCollector:
                 
                 # 6. Shotmap (mapa de chutes)
                 print("🎯 Coletando shotmap...")
-                shotmap = await self.fetch_api_data(page, f"{self.base_url}event/{match_id}/shotmap")
+                shotmap = await self.fetch_api_data(context, f"{self.base_url}event/{match_id}/shotmap")
                 if shotmap:
                     match_data['shotmap'] = shotmap.get('shotmap', [])
                 
                 # 7. Estatísticas dos jogadores
                 print("⚽ Coletando stats dos jogadores...")
-                player_stats = await self.fetch_api_data(page, f"{self.base_url}event/{match_id}/player-statistics")
+                player_stats = await self.fetch_api_data(context, f"{self.base_url}event/{match_id}/player-statistics")
                 if player_stats:
                     match_data['player_statistics'] = player_stats
                 
@@ -239,7 +231,7 @@ class SofaScoreLiveCollector:
                 momentum = None
                 for endpoint in momentum_endpoints:
                     print(f"   🔄 Tentando: {endpoint}")
-                    momentum = await self.fetch_api_data(page, endpoint)
+                    momentum = await self.fetch_api_data(context, endpoint)
                     if momentum:
                         print(f"   ✅ Momentum encontrado em: {endpoint}")
                         # Extrair apenas dados de momentum se existirem
@@ -254,13 +246,13 @@ class SofaScoreLiveCollector:
                 
                 # 9. Passes dos jogadores
                 print("🎯 Coletando passes...")
-                passes = await self.fetch_api_data(page, f"{self.base_url}event/{match_id}/passes")
+                passes = await self.fetch_api_data(context, f"{self.base_url}event/{match_id}/passes")
                 if passes:
                     match_data['passes'] = passes
                 
                 # 10. Dados de posicionamento tático
                 print("🗺️ Coletando posicionamento...")
-                positions = await self.fetch_api_data(page, f"{self.base_url}event/{match_id}/average-positions")
+                positions = await self.fetch_api_data(context, f"{self.base_url}event/{match_id}/average-positions")
                 if positions:
                     match_data['average_positions'] = positions
                 
@@ -271,6 +263,17 @@ class SofaScoreLiveCollector:
                     'collector_version': '1.0'
                 }
                 
+                # Coleta idêntica à anterior: só a última verificação avança (sem arquivos nem análise)
+                check = snapshot_change_detector.check(match_id, match_data)
+                skip_stats = snapshot_change_detector.get_stats()
+                if not check.changed:
+                    print(f"🟰 Nada mudou desde {check.last_changed_at} (verificado em {check.last_checked_at})")
+                    print(f"📉 Coletas sem mudança: {skip_stats['unchanged']}/{skip_stats['checks']} "
+                          f"({skip_stats['skip_rate']:.0%})")
+                    return match_data
+                if not check.first:
+                    print(f"🔀 Seções alteradas: {', '.join(check.changed_sections)}")
+                
                 # Salvar dados com timestamp
                 filename = f"match_{match_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
                 filepath = self.data_dir / filename
@@ -294,6 +297,8 @@ class SofaScoreLiveCollector:
                         json.dump(simplified_data, f, indent=2, ensure_ascii=False)
                     
                     print(f"✅ Dados simplificados salvos em: {simplified_filepath.absolute()}")
+                    # Mudança gravada: a partir daqui coletas idênticas são descartadas
+                    snapshot_change_detector.commit(match_id, check.hashes, check.changed_sections)
                     
                     # Mostrar estatísticas de redução
                     original_size = filepath.stat().st_size / 1024
@@ -321,11 +326,16 @@ class SofaScoreLiveCollector:
                 await browser.close()
     
     async def collect_live_data_loop(self, match_id, interval_seconds=30, max_iterations=None):
-        """Coleta dados em loop para simular tempo real"""
+        """
+        Coleta dados em loop para simular tempo real (uma partida por processo).
+        Com interval_seconds=None o intervalo é adaptativo (PollingPolicy) e o loop termina no fim da partida.
+        Para acompanhar várias partidas com navegadores compartilhados, use live_scheduler.py
+        """
         iteration = 0
+        adaptive = interval_seconds is None
         
         print(f"🚀 Iniciando coleta em tempo real para partida {match_id}")
-        print(f"⏰ Intervalo: {interval_seconds} segundos")
+        print(f"⏰ Intervalo: {'adaptativo' if adaptive else f'{interval_seconds} segundos'}")
         if max_iterations:
             print(f"🔄 Máximo de iterações: {max_iterations}")
         
@@ -355,20 +365,33 @@ class SofaScoreLiveCollector:
                 break
             
             # Aguardar próxima coleta
-            print(f"⏳ Aguardando {interval_seconds} segundos...")
-            await asyncio.sleep(interval_seconds)
+            wait_seconds = interval_seconds
+            if adaptive:
+                wait_seconds, phase, reason = polling_policy.next_interval(data or {})
+                if wait_seconds is None:
+                    print(f"\n🏁 Partida encerrada! {iteration} iterações realizadas")
+                    break
+                if not data:
+                    # Coleta falhou: tenta de novo logo em vez de esperar o intervalo de bola rolando
+                    wait_seconds = polling_policy.hot
+                print(f"📐 Fase: {phase} ({reason})")
+            print(f"⏳ Aguardando {wait_seconds:.0f} segundos...")
+            await asyncio.sleep(wait_seconds)
 
 async def main():
     """Função principal"""
     if len(sys.argv) < 2:
-        print("❌ Uso: python get_game_info.py <match_id> [interval_seconds] [max_iterations]")
+        print("❌ Uso: python get_game_info.py <match_id> [interval_seconds|auto] [max_iterations]")
         print("📝 Exemplo: python get_game_info.py 11161648")
         print("📝 Exemplo com intervalo: python get_game_info.py 11161648 15")
         print("📝 Exemplo com limite: python get_game_info.py 11161648 30 20")
+        print("📝 Exemplo com intervalo adaptativo: python get_game_info.py 11161648 auto")
         return
     
     match_id = sys.argv[1]
-    interval_seconds = int(sys.argv[2]) if len(sys.argv) > 2 else 30
+    interval_seconds = 30
+    if len(sys.argv) > 2:
+        interval_seconds = None if sys.argv[2] == "auto" else int(sys.argv[2])
     max_iterations = int(sys.argv[3]) if len(sys.argv) > 3 else None
     
     collector = SofaScoreLiveCollector()
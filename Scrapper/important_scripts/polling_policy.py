@@ -0,0 +1,148 @@
+"""
+Intervalo Adaptativo de Coleta ao Vivo
+Deriva o intervalo da próxima coleta de uma partida a partir do status do SofaScore (não iniciada,
+1º tempo, intervalo, 2º tempo, prorrogação, encerrada), dos minutos até o startTimestamp, do placar
+e dos lances decisivos recentes: pouco tráfego no intervalo, antes do apito inicial e com a bola
+rolando sem lances; coletas frequentes só em momentos quentes (gols/cartões seguidos), na reta final
+e nos acréscimos de jogo equilibrado; partidas encerradas saem do monitoramento (intervalo None)
+"""
+
+import os
+import time
+from typing import Optional, Dict, Any, List, Tuple
+
+# status.code do SofaScore -> fase
+PHASE_BY_STATUS_CODE = {
+    0: "not_started",
+    6: "first_half",
+    7: "second_half",
+    31: "halftime",
+    32: "awaiting_extra_time",
+    33: "extra_time_halftime",
+    41: "first_extra_time",
+    42: "second_extra_time",
+    50: "penalties",
+    60: "ended",      # adiada
+    70: "ended",      # cancelada
+    80: "interrupted",
+    90: "ended",      # abandonada
+    100: "ended",
+    110: "ended",     # após prorrogação
+    120: "ended"      # após pênaltis
+}
+
+# status.type (quando o código não é conhecido) -> fase
+PHASE_BY_STATUS_TYPE = {
+    "notstarted": "not_started",
+    "inprogress": "first_half",
+    "finished": "ended",
+    "canceled": "ended",
+    "postponed": "ended",
+    "interrupted": "interrupted"
+}
+
+# Minuto em que cada tempo entra nos acréscimos
+REGULATION_END_MINUTE = {"first_half": 45, "second_half": 90, "first_extra_time": 105, "second_extra_time": 120}
+PERIOD_START_MINUTE = {"first_half": 0, "second_half": 45, "first_extra_time": 90, "second_extra_time": 105}
+
+# Tempos em que a partida pode acabar (reta final com placar apertado)
+DECIDING_PHASES = ("second_half", "second_extra_time")
+
+# Lances que esquentam o jogo (substituições e marcadores de período/acréscimos não contam)
+HOT_INCIDENT_TYPES = ("goal", "card", "varDecision", "inGamePenalty")
+
+
+def _env_seconds(name: str, default: float) -> float:
+    return float(os.getenv(name, str(default)))
+
+
+class PollingPolicy:
+    """Calcula (intervalo em segundos ou None, fase, motivo) para a próxima coleta de uma partida"""
+
+    def __init__(self):
+        self.not_started_far = _env_seconds('LIVE_INTERVAL_NOT_STARTED_FAR', 600)     # > 60 min do início
+        self.not_started = _env_seconds('LIVE_INTERVAL_NOT_STARTED', 180)             # 15-60 min
+        self.kickoff_soon = _env_seconds('LIVE_INTERVAL_KICKOFF_SOON', 60)            # < 15 min ou atrasada
+        self.in_play = _env_seconds('LIVE_INTERVAL_IN_PLAY', 90)                      # bola rolando sem lances
+        self.hot = _env_seconds('LIVE_INTERVAL_HOT', 20)                              # lances decisivos seguidos
+        self.close_game = _env_seconds('LIVE_INTERVAL_CLOSE_GAME', 20)                # reta final, diferença <= 1
+        self.stoppage_close = _env_seconds('LIVE_INTERVAL_STOPPAGE_CLOSE', 15)        # acréscimos, diferença <= 1
+        self.halftime = _env_seconds('LIVE_INTERVAL_HALFTIME', 120)
+        self.interrupted = _env_seconds('LIVE_INTERVAL_INTERRUPTED', 120)
+        self.hot_window_minutes = int(os.getenv('LIVE_HOT_WINDOW_MINUTES', '10'))
+        self.hot_min_incidents = int(os.getenv('LIVE_HOT_MIN_INCIDENTS', '2'))
+        self.close_game_minutes = int(os.getenv('LIVE_CLOSE_GAME_MINUTES', '5'))
+
+    def phase(self, basic_info: Dict[str, Any]) -> str:
+        status = basic_info.get("status") or {}
+        phase = PHASE_BY_STATUS_CODE.get(status.get("code"))
+        if phase is None:
+            phase = PHASE_BY_STATUS_TYPE.get(status.get("type", ""), "first_half")
+        return phase
+
+    def current_minute(self, basic_info: Dict[str, Any], phase: str, now: float) -> Optional[float]:
+        """Minuto de jogo estimado pelo início do período atual (None quando desconhecido)"""
+        period_start = (basic_info.get("time") or {}).get("currentPeriodStartTimestamp")
+        if not period_start or phase not in PERIOD_START_MINUTE:
+            return None
+        return PERIOD_START_MINUTE[phase] + max(0.0, now - period_start) / 60
+
+    def recent_incidents(self, timeline: List[Dict[str, Any]], minute: Optional[float]) -> int:
+        if minute is None:
+            return 0
+        since = minute - self.hot_window_minutes
+        return sum(
+            1 for incident in timeline or []
+            if incident.get("incidentType") in HOT_INCIDENT_TYPES
+            and (incident.get("time") or 0) + (incident.get("addedTime") or 0) >= since
+        )
+
+    def next_interval(self, raw_data: Dict[str, Any], now: float = None) -> Tuple[Optional[float], str, str]:
+        now = now if now is not None else time.time()
+        basic_info = raw_data.get("basic_info") or {}
+        phase = self.phase(basic_info)
+
+        if phase == "ended":
+            return None, phase, "partida encerrada"
+
+        if phase == "not_started":
+            start = basic_info.get("startTimestamp")
+            if not start:
+                return self.not_started, phase, "sem horário de início"
+            minutes_to_start = (start - now) / 60
+            if minutes_to_start > 60:
+                return self.not_started_far, phase, f"início em {minutes_to_start:.0f} min"
+            if minutes_to_start > 15:
+                return self.not_started, phase, f"início em {minutes_to_start:.0f} min"
+            return self.kickoff_soon, phase, "início próximo"
+
+        if phase in ("halftime", "extra_time_halftime", "awaiting_extra_time"):
+            return self.halftime, phase, "intervalo"
+
+        if phase == "interrupted":
+            return self.interrupted, phase, "partida interrompida"
+
+        if phase == "penalties":
+            return self.stoppage_close, phase, "pênaltis"
+
+        minute = self.current_minute(basic_info, phase, now)
+        home = (basic_info.get("homeScore") or {}).get("current") or 0
+        away = (basic_info.get("awayScore") or {}).get("current") or 0
+        close = abs(home - away) <= 1
+        regulation_end = REGULATION_END_MINUTE[phase]
+        if minute is not None and minute >= regulation_end and close:
+            return self.stoppage_close, phase, f"acréscimos ({minute:.0f}') com placar apertado"
+
+        incidents = self.recent_incidents(raw_data.get("timeline"), minute)
+        if incidents >= self.hot_min_incidents:
+            return self.hot, phase, f"{incidents} lances decisivos nos últimos {self.hot_window_minutes} min"
+
+        if phase in DECIDING_PHASES and minute is not None and close \
+                and minute >= regulation_end - self.close_game_minutes:
+            return self.close_game, phase, f"reta final ({minute:.0f}') com placar apertado"
+
+        return self.in_play, phase, "bola rolando sem lances recentes"
+
+
+# Instância global
+polling_policy = PollingPolicy()
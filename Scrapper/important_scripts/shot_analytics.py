@@ -0,0 +1,210 @@
+"""
+Análise Vetorizada de Shotmaps
+Carrega os chutes de várias partidas (playerCoordinates, xg, time, shotType) em arrays NumPy e
+calcula de uma vez: contagem por zonas do campo, xG acumulado por time ao longo do jogo e
+qualidade das finalizações por janela de minutos, para rodar em todas as partidas ao vivo a cada ciclo
+"""
+
+from typing import Dict, Any, List, Tuple
+
+import numpy as np
+
+# No shotmap do SofaScore, x é a distância até a linha do gol atacado e y a posição na largura,
+# ambos em % do campo (pênalti em x ≈ 11.5)
+BOX_DEPTH = 17.0          # grande área: 16.5m de 105m
+SIX_YARD_DEPTH = 5.2      # pequena área: 5.5m de 105m
+BOX_Y = (21.1, 78.9)      # largura da grande área (40.3m de 68m, centrada)
+SIX_YARD_Y = (36.8, 63.2)
+
+# Grade de zonas: faixas de profundidade x faixas de largura
+DEPTH_EDGES = np.array([0.0, SIX_YARD_DEPTH, 11.5, BOX_DEPTH, 30.0, 100.0])
+WIDTH_EDGES = np.array([0.0, BOX_Y[0], SIX_YARD_Y[0], SIX_YARD_Y[1], BOX_Y[1], 100.0])
+DEPTH_ZONES = ("six_yard", "penalty_spot", "box_edge", "outside_box", "long_range")
+WIDTH_ZONES = ("far_left", "left", "central", "right", "far_right")
+
+MAX_MINUTE = 120
+QUALITY_WINDOW_MINUTES = 15
+ON_TARGET_TYPES = ("goal", "save")
+
+TEAMS = ("home", "away")
+
+
+class ShotArrays:
+    """Chutes de várias partidas em arrays paralelos (uma posição por chute)"""
+
+    def __init__(self, match_ids: List[str], match_index, team, x, y, xg, minute, is_goal, on_target):
+        self.match_ids = match_ids
+        self.match_index = match_index  # int: posição da partida em match_ids
+        self.team = team                # int: 0 = casa, 1 = visitante
+        self.x = x
+        self.y = y
+        self.xg = xg
+        self.minute = minute            # int: minuto (acréscimos somados), limitado a MAX_MINUTE
+        self.is_goal = is_goal
+        self.on_target = on_target
+
+    @property
+    def n_matches(self) -> int:
+        return len(self.match_ids)
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+
+def load_shotmaps(shotmaps: Dict[str, List[Dict[str, Any]]]) -> ShotArrays:
+    """Converte {match_id: shotmap} (formato de /event/{id}/shotmap) em ShotArrays"""
+    match_ids = list(shotmaps)
+    rows: List[Tuple] = []
+    for index, match_id in enumerate(match_ids):
+        for shot in shotmaps[match_id] or []:
+            coords = shot.get("playerCoordinates") or {}
+            shot_type = shot.get("shotType", "")
+            rows.append((
+                index,
+                0 if shot.get("isHome", False) else 1,
+                coords.get("x", np.nan),
+                coords.get("y", np.nan),
+                shot.get("xg") or 0.0,
+                (shot.get("time") or 0) + (shot.get("addedTime") or 0),
+                shot_type == "goal",
+                shot_type in ON_TARGET_TYPES
+            ))
+
+    if rows:
+        columns = list(zip(*rows))
+    else:
+        columns = [()] * 8
+
+    return ShotArrays(
+        match_ids=match_ids,
+        match_index=np.asarray(columns[0], dtype=np.int64),
+        team=np.asarray(columns[1], dtype=np.int64),
+        x=np.asarray(columns[2], dtype=np.float64),
+        y=np.asarray(columns[3], dtype=np.float64),
+        xg=np.asarray(columns[4], dtype=np.float64),
+        minute=np.clip(np.asarray(columns[5], dtype=np.int64), 0, MAX_MINUTE),
+        is_goal=np.asarray(columns[6], dtype=bool),
+        on_target=np.asarray(columns[7], dtype=bool)
+    )
+
+
+def in_box(shots: ShotArrays) -> np.ndarray:
+    """Máscara dos chutes de dentro da grande área (chutes sem coordenadas ficam fora)"""
+    return (shots.x <= BOX_DEPTH) & (shots.y >= BOX_Y[0]) & (shots.y <= BOX_Y[1])
+
+
+def is_box_location(x: float, y: float) -> bool:
+    """Versão escalar de in_box para um único chute"""
+    return x <= BOX_DEPTH and BOX_Y[0] <= y <= BOX_Y[1]
+
+
+def _team_slot(shots: ShotArrays) -> np.ndarray:
+    """Índice plano (partida, time) de cada chute"""
+    return shots.match_index * 2 + shots.team
+
+
+def zone_grid_counts(shots: ShotArrays) -> np.ndarray:
+    """Chutes por zona: array (partidas, 2 times, faixas de profundidade, faixas de largura)"""
+    n_depth, n_width = len(DEPTH_ZONES), len(WIDTH_ZONES)
+    has_coords = ~(np.isnan(shots.x) | np.isnan(shots.y))
+    depth_bin = np.clip(np.digitize(shots.x[has_coords], DEPTH_EDGES) - 1, 0, n_depth - 1)
+    width_bin = np.clip(np.digitize(shots.y[has_coords], WIDTH_EDGES) - 1, 0, n_width - 1)
+    flat = (_team_slot(shots)[has_coords] * n_depth + depth_bin) * n_width + width_bin
+    counts = np.bincount(flat, minlength=shots.n_matches * 2 * n_depth * n_width)
+    return counts.reshape(shots.n_matches, 2, n_depth, n_width)
+
+
+def cumulative_xg(shots: ShotArrays) -> np.ndarray:
+    """xG acumulado minuto a minuto: array (partidas, 2 times, MAX_MINUTE + 1)"""
+    minutes = MAX_MINUTE + 1
+    flat = _team_slot(shots) * minutes + shots.minute
+    per_minute = np.bincount(flat, weights=shots.xg, minlength=shots.n_matches * 2 * minutes)
+    return np.cumsum(per_minute.reshape(shots.n_matches, 2, minutes), axis=2)
+
+
+def quality_windows(shots: ShotArrays, window: int = QUALITY_WINDOW_MINUTES) -> Dict[str, np.ndarray]:
+    """
+    Por janela de minutos: chutes, xG somado, xG por chute e chutes no alvo,
+    cada um como array (partidas, 2 times, janelas)
+    """
+    n_windows = MAX_MINUTE // window + 1
+    size = shots.n_matches * 2 * n_windows
+    flat = _team_slot(shots) * n_windows + shots.minute // window
+    shape = (shots.n_matches, 2, n_windows)
+
+    count = np.bincount(flat, minlength=size).reshape(shape)
+    xg = np.bincount(flat, weights=shots.xg, minlength=size).reshape(shape)
+    on_target = np.bincount(flat, weights=shots.on_target.astype(np.float64), minlength=size).reshape(shape)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        xg_per_shot = np.where(count > 0, xg / count, 0.0)
+    return {"shots": count, "xg": xg, "xg_per_shot": xg_per_shot, "on_target": on_target}
+
+
+def team_totals(shots: ShotArrays) -> Dict[str, np.ndarray]:
+    """Totais por (partida, time): chutes, gols, no alvo, na área, xG"""
+    size = shots.n_matches * 2
+    slot = _team_slot(shots)
+    shape = (shots.n_matches, 2)
+    return {
+        "shots": np.bincount(slot, minlength=size).reshape(shape),
+        "goals": np.bincount(slot, weights=shots.is_goal.astype(np.float64), minlength=size).reshape(shape),
+        "on_target": np.bincount(slot, weights=shots.on_target.astype(np.float64), minlength=size).reshape(shape),
+        "in_box": np.bincount(slot, weights=in_box(shots).astype(np.float64), minlength=size).reshape(shape),
+        "xg": np.bincount(slot, weights=shots.xg, minlength=size).reshape(shape)
+    }
+
+
+def analyze_shotmaps(shotmaps: Dict[str, List[Dict[str, Any]]],
+                     window: int = QUALITY_WINDOW_MINUTES) -> Dict[str, Dict[str, Any]]:
+    """
+    Analisa os shotmaps de várias partidas de uma vez e devolve, por match_id, um resumo
+    serializável (JSON) com totais, zonas, xG acumulado e qualidade por janela
+    """
+    shots = load_shotmaps(shotmaps)
+    totals = team_totals(shots)
+    zones = zone_grid_counts(shots)
+    xg_timeline = cumulative_xg(shots)
+    windows = quality_windows(shots, window)
+
+    results = {}
+    for index, match_id in enumerate(shots.match_ids):
+        summary = {
+            "totals": {},
+            "zones": {},
+            "xg_timeline": {},
+            "quality_windows": {"window_minutes": window}
+        }
+        for team_index, team in enumerate(TEAMS):
+            summary["totals"][team] = {
+                "shots": int(totals["shots"][index, team_index]),
+                "goals": int(totals["goals"][index, team_index]),
+                "on_target": int(totals["on_target"][index, team_index]),
+                "in_box": int(totals["in_box"][index, team_index]),
+                "xg": round(float(totals["xg"][index, team_index]), 2)
+            }
+            grid = zones[index, team_index]
+            summary["zones"][team] = {
+                depth: {width: int(grid[d, w]) for w, width in enumerate(WIDTH_ZONES) if grid[d, w]}
+                for d, depth in enumerate(DEPTH_ZONES) if grid[d].any()
+            }
+            # Só os minutos em que o xG mudou (a curva completa tem MAX_MINUTE + 1 pontos)
+            curve = xg_timeline[index, team_index]
+            changed = np.flatnonzero(np.diff(curve, prepend=0.0))
+            summary["xg_timeline"][team] = [[int(minute), round(float(curve[minute]), 2)] for minute in changed]
+            summary["quality_windows"][team] = [
+                {
+                    "from": window_index * window,
+                    "shots": int(windows["shots"][index, team_index, window_index]),
+                    "on_target": int(windows["on_target"][index, team_index, window_index]),
+                    "xg": round(float(windows["xg"][index, team_index, window_index]), 2),
+                    "xg_per_shot": round(float(windows["xg_per_shot"][index, team_index, window_index]), 3)
+                }
+                for window_index in np.flatnonzero(windows["shots"][index, team_index])
+            ]
+        results[match_id] = summary
+    return results
+
+
+def analyze_shotmap(shotmap: List[Dict[str, Any]], window: int = QUALITY_WINDOW_MINUTES) -> Dict[str, Any]:
+    """Resumo de uma única partida (mesmo formato de cada item de analyze_shotmaps)"""
+    return analyze_shotmaps({"match": shotmap}, window)["match"]
@@ -4,56 +4,141 @@ Simplifica dados complexos do SofaScore para análise por IA
 Extrai apenas informações relevantes para assistente técnico
 """
 
+import re
 import json
 import sys
 from pathlib import Path
 from datetime import datetime
 
+try:
+    from .shot_analytics import analyze_shotmap, is_box_location
+except ImportError:
+    # Executado como script (python simplify_match_data.py arquivo.json)
+    from shot_analytics import analyze_shotmap, is_box_location
+
+# Seções do snapshot bruto, na ordem em que entram na visão simplificada
+RAW_SECTIONS = ("basic_info", "statistics", "timeline", "lineups", "shotmap", "player_statistics")
+
+STAT_CATEGORIES = ("possession", "shots", "passes", "duels", "defending")
+
+# Chave da estatística no SofaScore -> categoria (None = conhecida, mas fora do resumo)
+STAT_CATEGORY_BY_KEY = {
+    "ballPossession": "possession",
+    # Finalizações
+    "expectedGoals": "shots",
+    "bigChanceCreated": "shots",
+    "bigChanceScored": "shots",
+    "bigChanceMissed": "shots",
+    "totalShotsOnGoal": "shots",
+    "shotsOnGoal": "shots",
+    "shotsOffGoal": "shots",
+    "blockedScoringAttempt": "shots",
+    "hitWoodwork": "shots",
+    "totalShotsInsideBox": "shots",
+    "totalShotsOutsideBox": "shots",
+    "goalsFromInsideTheBox": "shots",
+    "goalsFromOutsideTheBox": "shots",
+    # Passes
+    "passes": "passes",
+    "accuratePasses": "passes",
+    "totalLongBalls": "passes",
+    "accurateLongBalls": "passes",
+    "totalCrosses": "passes",
+    "accurateCrosses": "passes",
+    "accurateThroughBall": "passes",
+    "finalThirdEntries": "passes",
+    "finalThirdPhaseStatistic": "passes",
+    "touchesInOppBox": "passes",
+    # Duelos
+    "duelWonPercent": "duels",
+    "groundDuelsPercentage": "duels",
+    "aerialDuelsPercentage": "duels",
+    "dribblesPercentage": "duels",
+    "dispossessed": "duels",
+    # Defesa (inclui goleiro: "Goalkeeper saves" não é finalização)
+    "totalTackle": "defending",
+    "wonTacklePercent": "defending",
+    "interceptionWon": "defending",
+    "ballRecovery": "defending",
+    "totalClearance": "defending",
+    "goalkeeperSaves": "defending",
+    "goalsPrevented": "defending",
+    "errorsLeadToShot": "defending",
+    "errorsLeadToGoal": "defending",
+    "diveSaves": "defending",
+    "highClaims": "defending",
+    "punches": "defending",
+    # Fora do resumo
+    "cornerKicks": None,
+    "fouls": None,
+    "yellowCards": None,
+    "redCards": None,
+    "offsides": None,
+    "freeKicks": None,
+    "throwIns": None,
+    "goalKicks": None,
+    "fouledFinalThird": None
+}
+
+# Fallback para chaves desconhecidas: uma busca no nome; alternativas mais específicas primeiro
+# (goleiro antes de "goal", "block" só fora de "blocked shots")
+STAT_NAME_PATTERN = re.compile(
+    r"(?P<possession>possession)"
+    r"|(?P<defending>goalkeeper|saves?\b|tackle|clearance|interception|recover|block(?!ed shot))"
+    r"|(?P<shots>shot|goal|chance|xg\b)"
+    r"|(?P<passes>pass|cross|through|long ball)"
+    r"|(?P<duels>duel|aerial|ground|dribble)",
+    re.IGNORECASE
+)
+
+# Nomes já classificados pelo fallback (o mesmo nome aparece em todo snapshot da partida)
+_name_category_cache = {}
+
+
+def stat_category(key, name):
+    """Categoria de um item de estatística: índice por chave, depois padrão compilado sobre o nome"""
+    if key in STAT_CATEGORY_BY_KEY:
+        return STAT_CATEGORY_BY_KEY[key]
+    if name not in _name_category_cache:
+        match = STAT_NAME_PATTERN.search(name)
+        _name_category_cache[name] = match.lastgroup if match else None
+    return _name_category_cache[name]
+
+
 class MatchDataSimplifier:
     """Simplifica dados de partida para análise por IA"""
     
     def __init__(self):
         pass
     
-    def extract_key_statistics(self, stats_data):
-        """Extrai estatísticas principais organizadas por categoria"""
-        simplified_stats = {
-            "possession": {},
-            "shots": {},
-            "passes": {},
-            "duels": {},
-            "defending": {}
-        }
+    def categorize_statistics(self, stats_data):
+        """
+        Agrupa as estatísticas por período (ALL, 1ST, 2ND) e categoria em uma única passada
+        """
+        periods = {}
         
-        if not stats_data:
-            return simplified_stats
+        for period_data in stats_data or []:
+            period = period_data.get("period", "ALL")
+            categories = periods.setdefault(period, {category: {} for category in STAT_CATEGORIES})
             
-        for period_data in stats_data:
-            if period_data.get("period") == "ALL":
-                groups = period_data.get("groups", [])
-                
-                for group in groups:
-                    group_name = group.get("groupName", "").lower()
-                    items = group.get("statisticsItems", [])
-                    
-                    for item in items:
-                        name = item.get("name", "")
-                        home = item.get("home", "0")
-                        away = item.get("away", "0")
-                        
-                        # Categorizar estatísticas
-                        if "possession" in name.lower():
-                            simplified_stats["possession"][name] = {"home": home, "away": away}
-                        elif any(word in name.lower() for word in ["shot", "goal", "chance"]):
-                            simplified_stats["shots"][name] = {"home": home, "away": away}
-                        elif any(word in name.lower() for word in ["pass", "cross", "through"]):
-                            simplified_stats["passes"][name] = {"home": home, "away": away}
-                        elif any(word in name.lower() for word in ["duel", "aerial", "ground"]):
-                            simplified_stats["duels"][name] = {"home": home, "away": away}
-                        elif any(word in name.lower() for word in ["tackle", "clearance", "block"]):
-                            simplified_stats["defending"][name] = {"home": home, "away": away}
+            for group in period_data.get("groups", []):
+                for item in group.get("statisticsItems", []):
+                    name = item.get("name", "")
+                    category = stat_category(item.get("key"), name)
+                    if category:
+                        categories[category][name] = {"home": item.get("home", "0"), "away": item.get("away", "0")}
         
-        return simplified_stats
+        return periods
+    
+    def extract_key_statistics(self, stats_data):
+        """Extrai estatísticas principais organizadas por categoria"""
+        return self.categorize_statistics(stats_data).get("ALL") or {category: {} for category in STAT_CATEGORIES}
+    
+    def split_statistics_by_period(self, stats_data):
+        """(estatísticas da partida inteira, estatísticas por tempo {"1ST": ..., "2ND": ...})"""
+        periods = self.categorize_statistics(stats_data)
+        key_statistics = periods.pop("ALL", None) or {category: {} for category in STAT_CATEGORIES}
+        return key_statistics, periods
     
     def extract_goals_and_events(self, timeline_data):
         """Extrai gols e eventos principais"""
@@ -133,8 +218,11 @@ class MatchDataSimplifier:
         
         return formations
     
-    def extract_shot_analysis(self, shotmap_data):
-        """Analisa padrões de chutes"""
+    def extract_shot_analysis(self, shotmap_data, summary=None):
+        """
+        Analisa padrões de chutes (totais, zonas, xG acumulado e qualidade por janela);
+        summary: resumo já calculado em lote por analyze_shotmaps (LiveScheduler)
+        """
         shot_analysis = {
             "total_shots": {"home": 0, "away": 0},
             "goals": {"home": 0, "away": 0},
@@ -144,78 +232,90 @@ class MatchDataSimplifier:
         
         if not shotmap_data:
             return shot_analysis
-            
+        
+        if summary is None:
+            summary = analyze_shotmap(shotmap_data)
+        
         for shot in shotmap_data:
-            is_home = shot.get("isHome", False)
-            team_key = "home" if is_home else "away"
-            shot_type = shot.get("shotType", "")
-            
-            shot_analysis["total_shots"][team_key] += 1
-            
-            if shot_type == "goal":
-                shot_analysis["goals"][team_key] += 1
-            
-            # Analisar localização do chute
+            team_key = "home" if shot.get("isHome", False) else "away"
             coords = shot.get("playerCoordinates", {})
             if coords:
-                x, y = coords.get("x", 0), coords.get("y", 0)
-                location = "box" if x > 83 else "outside_box"
+                location = "box" if is_box_location(coords.get("x", 100), coords.get("y", 0)) else "outside_box"
                 shot_analysis["shot_locations"][team_key].append({
                     "time": shot.get("time", 0),
                     "location": location,
-                    "result": shot_type
+                    "result": shot.get("shotType", "")
                 })
         
-        # Calcular eficiência
         for team in ["home", "away"]:
-            total = shot_analysis["total_shots"][team]
-            goals = shot_analysis["goals"][team]
-            if total > 0:
-                efficiency = (goals / total) * 100
+            totals = summary["totals"][team]
+            shot_analysis["total_shots"][team] = totals["shots"]
+            shot_analysis["goals"][team] = totals["goals"]
+            if totals["shots"] > 0:
+                efficiency = (totals["goals"] / totals["shots"]) * 100
                 shot_analysis["shooting_efficiency"][team] = f"{efficiency:.1f}%"
         
+        shot_analysis.update({
+            "totals": summary["totals"],
+            "zones": summary["zones"],
+            "xg_timeline": summary["xg_timeline"],
+            "quality_windows": summary["quality_windows"]
+        })
+        
         return shot_analysis
     
+    def extract_match_summary(self, basic_info):
+        """Times, placar, status, torneio e técnicos"""
+        return {
+            "home_team": basic_info.get("homeTeam", {}).get("name", ""),
+            "away_team": basic_info.get("awayTeam", {}).get("name", ""),
+            "score": {
+                "home": basic_info.get("homeScore", {}).get("current", 0),
+                "away": basic_info.get("awayScore", {}).get("current", 0)
+            },
+            "status": basic_info.get("status", {}).get("description", ""),
+            "tournament": basic_info.get("tournament", {}).get("name", ""),
+            "managers": {
+                "home": basic_info.get("homeTeam", {}).get("manager", {}).get("name", ""),
+                "away": basic_info.get("awayTeam", {}).get("manager", {}).get("name", "")
+            }
+        }
+    
+    def simplify_section(self, section, payload, shot_summary=None):
+        """Chaves da visão simplificada geradas por uma seção do snapshot bruto"""
+        if section == "basic_info":
+            return {"match_summary": self.extract_match_summary(payload or {})}
+        if section == "statistics":
+            key_statistics, period_statistics = self.split_statistics_by_period(payload or [])
+            return {"key_statistics": key_statistics, "period_statistics": period_statistics}
+        if section == "timeline":
+            return {"events_timeline": self.extract_goals_and_events(payload or [])}
+        if section == "lineups":
+            return {"tactical_setup": self.extract_formations_and_lineups(payload or {})}
+        if section == "shotmap":
+            return {"shooting_analysis": self.extract_shot_analysis(payload or [], shot_summary)}
+        return {}  # player_statistics: ainda sem resumo
+    
+    def simplify_snapshot(self, full_data):
+        """Visão simplificada completa de um snapshot bruto (formato de get_live_match_data_api)"""
+        simplified_data = {}
+        for section in RAW_SECTIONS:
+            simplified_data.update(self.simplify_section(section, full_data.get(section)))
+        
+        metadata = full_data.get("metadata", {})
+        simplified_data["collection_info"] = {
+            "collected_at": metadata.get("collected_at", ""),
+            "match_id": metadata.get("match_id", "")
+        }
+        return simplified_data
+    
     def simplify_match_data(self, json_file_path):
         """Função principal para simplificar dados da partida"""
         try:
             with open(json_file_path, 'r', encoding='utf-8') as f:
                 full_data = json.load(f)
             
-            # Extrair informações básicas
-            basic_info = full_data.get("basic_info", {})
-            
-            simplified_data = {
-                "match_summary": {
-                    "home_team": basic_info.get("homeTeam", {}).get("name", ""),
-                    "away_team": basic_info.get("awayTeam", {}).get("name", ""),
-                    "score": {
-                        "home": basic_info.get("homeScore", {}).get("current", 0),
-                        "away": basic_info.get("awayScore", {}).get("current", 0)
-                    },
-                    "status": basic_info.get("status", {}).get("description", ""),
-                    "tournament": basic_info.get("tournament", {}).get("name", ""),
-                    "managers": {
-                        "home": basic_info.get("homeTeam", {}).get("manager", {}).get("name", ""),
-                        "away": basic_info.get("awayTeam", {}).get("manager", {}).get("name", "")
-                    }
-                },
-                
-                "key_statistics": self.extract_key_statistics(full_data.get("statistics", [])),
-                
-                "events_timeline": self.extract_goals_and_events(full_data.get("timeline", [])),
-                
-                "tactical_setup": self.extract_formations_and_lineups(full_data.get("lineups", {})),
-                
-                "shooting_analysis": self.extract_shot_analysis(full_data.get("shotmap", [])),
-                
-                "collection_info": {
-                    "collected_at": full_data.get("metadata", {}).get("collected_at", ""),
-                    "match_id": full_data.get("metadata", {}).get("match_id", "")
-                }
-            }
-            
-            return simplified_data
+            return self.simplify_snapshot(full_data)
             
         except Exception as e:
             print(f"❌ Erro ao processar arquivo: {e}")
@@ -0,0 +1,117 @@
+"""
+Detecção de Mudanças nos Snapshots ao Vivo
+Hash de conteúdo por seção de cada snapshot coletado (basic_info, statistics, timeline, lineups,
+shotmap, player_statistics, ...): coletas idênticas à anterior só atualizam o "última verificação",
+sem gravar arquivos, inserir em match_data nem chamar a OpenAI; os contadores mostram a taxa de descarte.
+check() só compara; os hashes passam a valer com commit(), chamado depois que a mudança foi gravada
+(se a gravação falhar, a próxima coleta idêntica ainda conta como mudança)
+"""
+
+import json
+import hashlib
+from datetime import datetime
+from typing import Optional, Dict, Any, List
+
+# Seções que não descrevem a partida (mudam a cada coleta)
+IGNORED_SECTIONS = ("metadata",)
+
+
+def content_hash(payload: Any) -> str:
+    """Hash estável do conteúdo (independe da ordem das chaves dos dicionários)"""
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.blake2b(encoded.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def section_hashes(snapshot: Dict[str, Any]) -> Dict[str, str]:
+    """Hash de cada seção do snapshot bruto"""
+    return {section: content_hash(payload) for section, payload in snapshot.items()
+            if section not in IGNORED_SECTIONS}
+
+
+class SnapshotCheck:
+    """Resultado da comparação de um snapshot com o anterior da mesma partida"""
+
+    def __init__(self, changed_sections: List[str], hashes: Dict[str, str], first: bool,
+                 last_checked_at: str, last_changed_at: Optional[str]):
+        self.changed_sections = changed_sections
+        self.hashes = hashes
+        self.first = first
+        self.last_checked_at = last_checked_at
+        self.last_changed_at = last_changed_at
+
+    @property
+    def changed(self) -> bool:
+        return self.first or bool(self.changed_sections)
+
+
+class SnapshotChangeDetector:
+    """Últimos hashes por partida e contadores de coletas com/sem mudança"""
+
+    def __init__(self):
+        self._hashes: Dict[str, Dict[str, str]] = {}
+        self._checked_at: Dict[str, str] = {}
+        self._changed_at: Dict[str, str] = {}
+        self.section_changes: Dict[str, int] = {}
+        self.stats = {
+            "checks": 0,
+            "changed": 0,
+            "unchanged": 0
+        }
+
+    def check(self, match_id: str, snapshot: Dict[str, Any]) -> SnapshotCheck:
+        """Compara com o último snapshot confirmado (sem guardar os hashes deste: ver commit)"""
+        match_id = str(match_id)
+        now = datetime.now().isoformat()
+        hashes = section_hashes(snapshot)
+        previous = self._hashes.get(match_id)
+
+        if previous is None:
+            changed_sections = list(hashes)
+        else:
+            # Seção ausente nesta coleta (endpoint falhou) não conta como mudança
+            changed_sections = [section for section, digest in hashes.items() if previous.get(section) != digest]
+            hashes = {**previous, **hashes}
+
+        self.stats["checks"] += 1
+        self._checked_at[match_id] = now
+        if previous is None or changed_sections:
+            self.stats["changed"] += 1
+        else:
+            self.stats["unchanged"] += 1
+
+        return SnapshotCheck(changed_sections, hashes, previous is None, now, self._changed_at.get(match_id))
+
+    def commit(self, match_id: str, hashes: Dict[str, str], changed_sections: List[str] = ()) -> str:
+        """Confirma os hashes de um snapshot alterado depois de gravado/publicado; retorna o horário da mudança"""
+        match_id = str(match_id)
+        now = datetime.now().isoformat()
+        self._hashes[match_id] = hashes
+        self._changed_at[match_id] = now
+        for section in changed_sections:
+            self.section_changes[section] = self.section_changes.get(section, 0) + 1
+        return now
+
+    def last_checked_at(self, match_id: str) -> Optional[str]:
+        return self._checked_at.get(str(match_id))
+
+    def last_changed_at(self, match_id: str) -> Optional[str]:
+        return self._changed_at.get(str(match_id))
+
+    def forget(self, match_id: str):
+        match_id = str(match_id)
+        self._hashes.pop(match_id, None)
+        self._checked_at.pop(match_id, None)
+        self._changed_at.pop(match_id, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        checks = self.stats["checks"]
+        return {
+            "matches": len(self._hashes),
+            "skip_rate": round(self.stats["unchanged"] / checks, 3) if checks else 0.0,
+            "section_changes": dict(self.section_changes),
+            **self.stats
+        }
+
+
+# Instância global
+snapshot_change_detector = SnapshotChangeDetector()
@@ -0,0 +1,183 @@
+"""
+Simplificação Incremental dos Snapshots ao Vivo
+A cada ciclo o snapshot bruto inteiro (basic_info, statistics, timeline, lineups, shotmap,
+player_statistics) era simplificado do zero, embora as escalações quase não mudem e a timeline
+só cresça; aqui cada partida guarda o hash de cada seção e a última visão simplificada, só as
+seções com hash diferente são recalculadas e incidentes novos são acrescentados à timeline já
+simplificada. Cada atualização devolve a visão completa e o delta em relação ao snapshot anterior
+"""
+
+import os
+from collections import OrderedDict
+from datetime import datetime
+from typing import Optional, Dict, Any, List
+
+from important_scripts.simplify_match_data import MatchDataSimplifier, RAW_SECTIONS
+from important_scripts.snapshot_changes import content_hash
+
+
+class MatchSimplificationState:
+    """Hashes das seções, hashes dos incidentes (na ordem da timeline) e última visão de uma partida"""
+
+    def __init__(self):
+        self.section_hashes: Dict[str, str] = {}
+        self.incident_hashes: List[str] = []
+        self.view: Dict[str, Any] = {}
+        self.updates = 0
+        self.updated_at: Optional[str] = None
+
+
+class IncrementalSimplifier:
+    """Simplificador com estado por partida (LRU limitado)"""
+
+    def __init__(self, simplifier: MatchDataSimplifier = None, max_matches: int = None):
+        self.simplifier = simplifier or MatchDataSimplifier()
+        self.enabled = os.getenv('INCREMENTAL_SIMPLIFIER_ENABLED', 'true').lower() == 'true'
+        self.max_matches = max_matches or int(os.getenv('INCREMENTAL_SIMPLIFIER_MAX_MATCHES', '200'))
+        self._states: "OrderedDict[str, MatchSimplificationState]" = OrderedDict()
+        self.stats = {
+            "updates": 0,
+            "full_builds": 0,
+            "sections_recomputed": 0,
+            "sections_skipped": 0,
+            "incidents_appended": 0,
+            "timeline_rebuilds": 0,
+            "evictions": 0
+        }
+
+    def _state_for(self, match_id: str) -> Optional[MatchSimplificationState]:
+        state = self._states.get(match_id)
+        if state is not None:
+            self._states.move_to_end(match_id)
+        return state
+
+    def _remember(self, match_id: str, state: MatchSimplificationState):
+        self._states[match_id] = state
+        self._states.move_to_end(match_id)
+        while len(self._states) > self.max_matches:
+            self._states.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def _append_incidents(self, state: MatchSimplificationState, timeline: List[Dict[str, Any]],
+                          incident_hashes: List[str]) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+        """
+        Eventos simplificados dos incidentes novos, já mesclados na visão; None quando a timeline
+        não é a anterior mais incidentes no início ou no fim (ex: gol anulado pelo VAR) e precisa ser refeita
+        """
+        previous = state.incident_hashes
+        added = len(incident_hashes) - len(previous)
+        if added <= 0 or "events_timeline" not in state.view:
+            return None
+
+        if incident_hashes[added:] == previous:
+            # SofaScore envia os incidentes do mais recente para o mais antigo
+            new_events = self.simplifier.extract_goals_and_events(timeline[:added])
+            merged = {kind: new_events[kind] + events for kind, events in state.view["events_timeline"].items()}
+        elif incident_hashes[:len(previous)] == previous:
+            new_events = self.simplifier.extract_goals_and_events(timeline[len(previous):])
+            merged = {kind: events + new_events[kind] for kind, events in state.view["events_timeline"].items()}
+        else:
+            return None
+
+        state.view["events_timeline"] = merged
+        self.stats["incidents_appended"] += added
+        return new_events
+
+    def update(self, match_id: str, raw_data: Dict[str, Any],
+               section_hashes: Optional[Dict[str, str]] = None,
+               shot_summary: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Simplifica um snapshot da partida reaproveitando o anterior
+        (section_hashes: hashes já calculados pelo SnapshotChangeDetector, evita serializar de novo;
+        shot_summary: resumo do shotmap já calculado em lote com as outras partidas da rodada).
+        Retorna {"view": visão completa (mesmo formato de simplify_raw_data), "delta": o que mudou}
+        """
+        match_id = str(match_id)
+        state = self._state_for(match_id) if self.enabled else None
+        full_build = state is None
+        if full_build:
+            state = MatchSimplificationState()
+        # Cópia rasa: visões já devolvidas não mudam com as próximas atualizações
+        state.view = dict(state.view)
+
+        changed_sections = []
+        sections_delta: Dict[str, Any] = {}
+        new_events = None
+
+        for section in RAW_SECTIONS:
+            # Seção ausente neste snapshot (captura parcial): mantém a versão anterior
+            if section not in raw_data and not full_build:
+                self.stats["sections_skipped"] += 1
+                continue
+
+            payload = raw_data.get(section)
+            section_hash = (section_hashes or {}).get(section) or content_hash(payload)
+            if state.section_hashes.get(section) == section_hash:
+                self.stats["sections_skipped"] += 1
+                continue
+
+            state.section_hashes[section] = section_hash
+            changed_sections.append(section)
+            self.stats["sections_recomputed"] += 1
+
+            if section == "timeline":
+                incident_hashes = [content_hash(incident) for incident in payload or []]
+                if not full_build:
+                    new_events = self._append_incidents(state, payload or [], incident_hashes)
+                state.incident_hashes = incident_hashes
+                if new_events is not None:
+                    continue
+                if not full_build:
+                    self.stats["timeline_rebuilds"] += 1
+
+            outputs = self.simplifier.simplify_section(section, payload, shot_summary=shot_summary)
+            state.view.update(outputs)
+            sections_delta.update(outputs)
+
+        metadata = raw_data.get("metadata", {})
+        state.view["collection_info"] = {
+            "collected_at": metadata.get("collected_at", ""),
+            "match_id": metadata.get("match_id", "")
+        }
+
+        state.updates += 1
+        state.updated_at = datetime.now().isoformat()
+        self.stats["updates"] += 1
+        if full_build:
+            self.stats["full_builds"] += 1
+        if self.enabled:
+            self._remember(match_id, state)
+
+        return {
+            "view": state.view,
+            "delta": {
+                "match_id": match_id,
+                "full": full_build,
+                "changed_sections": changed_sections,
+                "sections": sections_delta,
+                "new_events": new_events,
+                "collected_at": state.view["collection_info"]["collected_at"]
+            }
+        }
+
+    def forget(self, match_id: str):
+        """Descarta o estado de uma partida (ex: partida encerrada)"""
+        self._states.pop(str(match_id), None)
+
+    def clear(self):
+        self._states.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        processed = self.stats["sections_recomputed"] + self.stats["sections_skipped"]
+        return {
+            "enabled": self.enabled,
+            "matches": len(self._states),
+            "max_matches": self.max_matches,
+            "skip_rate": round(self.stats["sections_skipped"] / processed, 3) if processed else 0.0,
+            **self.stats
+        }
+
+
+# Instâncias globais: uma por fluxo, para que o delta de um não seja calculado sobre o estado do outro
+incremental_simplifier = IncrementalSimplifier()         # análise via XHR capturado (services)
+live_incremental_simplifier = IncrementalSimplifier()    # snapshots da API no LiveScheduler
@@ -0,0 +1,260 @@
+"""
+Canal de Push das Partidas ao Vivo (Server-Sent Events)
+Antes, cada aba aberta em /analise-sugestoes fazia polling e podia disparar seu próprio
+POST /match/{id}/screenshot-analysis (scraping + chamada à OpenAI por aba). Aqui cada partida tem
+uma lista de assinantes: o estado vem do LiveScheduler (uma coleta por partida) e a análise é gerada
+uma vez por ciclo (single-flight) e distribuída a todos, então N espectadores custam um scraping
+"""
+
+import os
+import json
+import asyncio
+from datetime import datetime
+from typing import Optional, Dict, Any, Set, Callable, Awaitable
+
+
+def format_sse(event: str, data: Any, event_id: Optional[int] = None) -> str:
+    """Serializa um evento no formato text/event-stream"""
+    payload = json.dumps(data, ensure_ascii=False, default=str)
+    lines = [f"id: {event_id}"] if event_id is not None else []
+    lines.append(f"event: {event}")
+    lines.extend(f"data: {line}" for line in payload.splitlines() or [""])
+    return "\n".join(lines) + "\n\n"
+
+
+class Subscriber:
+    """Fila de eventos de um cliente conectado (as mais antigas são descartadas se ele não acompanhar)"""
+
+    def __init__(self, match_id: str, wants_analysis: bool, max_queue: int):
+        self.match_id = match_id
+        self.wants_analysis = wants_analysis
+        self.queue: "asyncio.Queue[str]" = asyncio.Queue(maxsize=max_queue)
+        self.connected_at = datetime.now().isoformat()
+
+
+class LiveBroadcaster:
+    """Assinantes por partida, último evento de cada tipo (reenviado na conexão) e análise compartilhada"""
+
+    def __init__(self, max_queue: int = None, analysis_interval: float = None, heartbeat: float = None):
+        self.max_queue = max_queue or int(os.getenv('LIVE_SSE_QUEUE_SIZE', '20'))
+        self.analysis_interval = analysis_interval or float(os.getenv('LIVE_ANALYSIS_INTERVAL', '60'))
+        self.heartbeat = heartbeat or float(os.getenv('LIVE_SSE_HEARTBEAT', '15'))
+
+        # Definidos pelo main.py no lifespan
+        self.scheduler = None
+        self.analysis_runner: Optional[Callable[[str], Awaitable[Dict[str, Any]]]] = None
+
+        self._subscribers: Dict[str, Set[Subscriber]] = {}
+        self._last_events: Dict[str, Dict[str, str]] = {}
+        self._event_ids: Dict[str, int] = {}
+        self._analysis_inflight: Dict[str, asyncio.Task] = {}
+        self._analysis_loops: Dict[str, asyncio.Task] = {}
+        self._analysis_identifiers: Dict[str, str] = {}
+        # Contador de eventos 'state' por partida: a análise automática só roda de novo se ele mudou
+        self._state_versions: Dict[str, int] = {}
+        # Partidas que entraram no agendador só por causa dos assinantes (saem com o último)
+        self._owned_monitors: Set[str] = set()
+
+        self.stats = {
+            "connections": 0,
+            "events_published": 0,
+            "events_delivered": 0,
+            "events_dropped": 0,
+            "analyses_run": 0,
+            "analyses_shared": 0,
+            "analysis_failures": 0,
+            "analyses_skipped_unchanged": 0
+        }
+
+    # Assinaturas
+
+    def subscribe(self, match_id: str, identifier: Optional[str] = None, wants_analysis: bool = False) -> Subscriber:
+        match_id = str(match_id)
+        subscriber = Subscriber(match_id, wants_analysis, self.max_queue)
+        subscribers = self._subscribers.setdefault(match_id, set())
+        subscribers.add(subscriber)
+        self.stats["connections"] += 1
+
+        # Estado e análise mais recentes para quem chega agora
+        for message in self._last_events.get(match_id, {}).values():
+            self._offer(subscriber, message)
+
+        if self.scheduler and self.scheduler.is_running and self.scheduler.get_match(match_id) is None \
+                and match_id.isdigit():
+            self.scheduler.add_match(match_id)
+            self._owned_monitors.add(match_id)
+
+        if wants_analysis:
+            self._analysis_identifiers.setdefault(match_id, identifier or match_id)
+            loop_task = self._analysis_loops.get(match_id)
+            if loop_task is None or loop_task.done():
+                self._analysis_loops[match_id] = asyncio.create_task(self._analysis_loop(match_id))
+
+        print(f"📡 [LIVE-SSE] Assinante conectado à partida {match_id} ({len(subscribers)} no total)")
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber):
+        match_id = subscriber.match_id
+        subscribers = self._subscribers.get(match_id, set())
+        subscribers.discard(subscriber)
+        print(f"📴 [LIVE-SSE] Assinante desconectado da partida {match_id} ({len(subscribers)} restante(s))")
+        if subscribers:
+            return
+
+        self._subscribers.pop(match_id, None)
+        self._analysis_identifiers.pop(match_id, None)
+        loop_task = self._analysis_loops.pop(match_id, None)
+        if loop_task:
+            loop_task.cancel()
+        if match_id in self._owned_monitors:
+            self._owned_monitors.discard(match_id)
+            if self.scheduler:
+                self.scheduler.remove_match(match_id)
+        if not (self.scheduler and self.scheduler.get_match(match_id)):
+            # Ninguém mais acompanha a partida: o próximo assinante recebe estado novo
+            self._last_events.pop(match_id, None)
+            self._event_ids.pop(match_id, None)
+            self._state_versions.pop(match_id, None)
+
+    def release_monitor(self, match_id: str):
+        """A partida passou a ser monitorada explicitamente (POST /monitor): não sai com o último assinante"""
+        self._owned_monitors.discard(str(match_id))
+
+    def subscriber_count(self, match_id: str) -> int:
+        return len(self._subscribers.get(str(match_id), ()))
+
+    # Publicação
+
+    def _offer(self, subscriber: Subscriber, message: str):
+        if subscriber.queue.full():
+            subscriber.queue.get_nowait()
+            self.stats["events_dropped"] += 1
+        subscriber.queue.put_nowait(message)
+        self.stats["events_delivered"] += 1
+
+    def publish(self, match_id: str, event: str, data: Any):
+        match_id = str(match_id)
+        event_id = self._event_ids.get(match_id, 0) + 1
+        self._event_ids[match_id] = event_id
+        message = format_sse(event, data, event_id)
+        self._last_events.setdefault(match_id, {})[event] = message
+        self.stats["events_published"] += 1
+        for subscriber in self._subscribers.get(match_id, ()):
+            self._offer(subscriber, message)
+
+    async def publish_snapshot(self, match_id: str, simplification: Dict[str, Any]):
+        """Callback on_snapshot do LiveScheduler: cada snapshot alterado vira um evento 'state'"""
+        self._state_versions[match_id] = self._state_versions.get(match_id, 0) + 1
+        self.publish(match_id, "state", {
+            "match_id": match_id,
+            "view": simplification["view"],
+            "delta": simplification["delta"]
+        })
+
+    # Análise compartilhada
+
+    async def run_analysis(self, match_id: str, identifier: str) -> Dict[str, Any]:
+        """
+        Gera a análise da partida uma única vez para todos os interessados: quem chega com uma
+        análise em andamento aguarda o mesmo resultado; análises bem-sucedidas são publicadas.
+        A análise roda em uma task própria: quem desiste de esperar (cliente desconectado) não
+        cancela o resultado dos demais
+        """
+        match_id = str(match_id)
+        task = self._analysis_inflight.get(match_id)
+        if task is None:
+            self.stats["analyses_run"] += 1
+            task = asyncio.create_task(self._run_shared_analysis(match_id, identifier))
+            self._analysis_inflight[match_id] = task
+            task.add_done_callback(lambda done, key=match_id: self._finish_analysis(key, done))
+        else:
+            self.stats["analyses_shared"] += 1
+
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            current = asyncio.current_task()
+            if task.cancelled() and not (current and current.cancelling()):
+                # A análise compartilhada foi interrompida (desligamento): falha comum para quem aguardava
+                raise RuntimeError(f"Análise da partida {match_id} interrompida")
+            raise
+
+    async def _run_shared_analysis(self, match_id: str, identifier: str) -> Dict[str, Any]:
+        try:
+            result = await self.analysis_runner(identifier)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._publish_analysis_error(match_id, getattr(e, "detail", None) or str(e))
+            raise
+
+        if result.get("success"):
+            self.publish(match_id, "analysis", result.get("data"))
+            # Erro anterior já superado: não é reenviado a quem conectar depois
+            self._last_events.get(match_id, {}).pop("analysis_error", None)
+        else:
+            self._publish_analysis_error(match_id, result.get("message") or "Erro na análise")
+        return result
+
+    def _finish_analysis(self, match_id: str, task: asyncio.Task):
+        if self._analysis_inflight.get(match_id) is task:
+            self._analysis_inflight.pop(match_id, None)
+        if not task.cancelled():
+            # Evita o aviso de exceção não recuperada quando ninguém mais aguardava
+            task.exception()
+
+    def _publish_analysis_error(self, match_id: str, message: str):
+        """Toda falha de análise (resultado sem sucesso ou exceção) chega uma vez aos assinantes"""
+        self.stats["analysis_failures"] += 1
+        print(f"❌ [LIVE-SSE] Erro na análise da partida {match_id}: {message}")
+        self.publish(match_id, "analysis_error", {"match_id": match_id, "message": message})
+
+    def _has_state_feed(self, match_id: str) -> bool:
+        """A partida está no LiveScheduler, então toda mudança de placar/estatística chega como 'state'"""
+        return bool(self.scheduler and self.scheduler.get_match(match_id) is not None)
+
+    async def _analysis_loop(self, match_id: str):
+        """
+        Análise automática enquanto houver assinante pedindo: no máximo uma por intervalo e, com a
+        partida no LiveScheduler, só depois de um novo evento 'state' (partida parada não gasta
+        chamada à OpenAI). Sem o agendador não há sinal de mudança e a análise roda a cada intervalo
+        """
+        analyzed_version = None
+        while any(subscriber.wants_analysis for subscriber in self._subscribers.get(match_id, ())):
+            version = self._state_versions.get(match_id, 0)
+            if analyzed_version is not None and version == analyzed_version and self._has_state_feed(match_id):
+                self.stats["analyses_skipped_unchanged"] += 1
+            else:
+                analyzed_version = version
+                try:
+                    await self.run_analysis(match_id, self._analysis_identifiers.get(match_id, match_id))
+                except asyncio.CancelledError:
+                    # Só o cancelamento do próprio loop chega aqui (a análise compartilhada
+                    # interrompida vira RuntimeError em run_analysis)
+                    raise
+                except Exception:
+                    # Já publicado como analysis_error em run_analysis
+                    pass
+            await asyncio.sleep(self.analysis_interval)
+
+    async def stop(self):
+        tasks = list(self._analysis_loops.values()) + list(self._analysis_inflight.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._analysis_loops.clear()
+        self._analysis_inflight.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "matches": len(self._subscribers),
+            "subscribers": sum(len(subscribers) for subscribers in self._subscribers.values()),
+            "analysis_loops": len(self._analysis_loops),
+            "owned_monitors": len(self._owned_monitors),
+            "analysis_interval": self.analysis_interval,
+            **self.stats
+        }
+
+
+# Instância global
+live_broadcaster = LiveBroadcaster()
@@ -0,0 +1,452 @@
+"""
+Agendador de Monitoramento ao Vivo (várias partidas)
+Substitui o collect_live_data_loop (uma partida por processo, while True + asyncio.sleep) por uma
+fila de prioridade (próxima coleta, match_id) com todas as partidas acompanhadas: um único laço
+despacha as coletas vencidas em rodadas (os shotmaps alterados da rodada são analisados em lote)
+com limite global de concorrência, intervalo próprio por partida e navegadores/contextos HTTP
+compartilhados (pool do lifespan). Partidas podem entrar e sair em tempo de execução
+
+Uso avulso (a partir da pasta Scrapper):
+    python live_scheduler.py <match_id> [<match_id> ...] [--interval 30] [--concurrency 8]
+
+Sem --interval, cada partida usa o intervalo adaptativo da PollingPolicy
+"""
+
+import os
+import sys
+import heapq
+import asyncio
+import itertools
+from datetime import datetime
+from typing import Optional, Dict, Any, List, Set, Tuple, Callable, Awaitable
+
+from incremental_simplifier import live_incremental_simplifier
+from important_scripts.polling_policy import PollingPolicy, polling_policy
+from important_scripts.shot_analytics import analyze_shotmaps
+from important_scripts.snapshot_changes import SnapshotCheck, snapshot_change_detector
+
+FINISHED_STATUS_TYPES = ("finished", "canceled", "postponed")
+
+
+class MonitoredMatch:
+    """Estado de monitoramento de uma partida"""
+
+    def __init__(self, match_id: str, interval: float, adaptive: bool = False):
+        self.match_id = match_id
+        self.interval = interval
+        self.adaptive = adaptive         # intervalo recalculado pela PollingPolicy a cada coleta
+        self.phase: Optional[str] = None
+        self.interval_reason: Optional[str] = None
+        self.next_due = 0.0              # relógio do event loop (loop.time())
+        self.running = False
+        self.ticks = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.last_tick_at: Optional[str] = None
+        self.last_changed_at: Optional[str] = None
+        self.last_tick_seconds: Optional[float] = None
+        self.total_tick_seconds = 0.0
+        self.last_error: Optional[str] = None
+        self.last_delta: Optional[Dict[str, Any]] = None
+        self.latest_view: Optional[Dict[str, Any]] = None
+        self.added_at = datetime.now().isoformat()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "match_id": self.match_id,
+            "interval_seconds": self.interval,
+            "adaptive": self.adaptive,
+            "phase": self.phase,
+            "interval_reason": self.interval_reason,
+            "running": self.running,
+            "ticks": self.ticks,
+            "failures": self.failures,
+            "consecutive_failures": self.consecutive_failures,
+            "last_tick_at": self.last_tick_at,
+            "last_changed_at": self.last_changed_at,
+            "last_tick_seconds": self.last_tick_seconds,
+            "avg_tick_seconds": round(self.total_tick_seconds / self.ticks, 3) if self.ticks else None,
+            "last_error": self.last_error,
+            "last_changed_sections": (self.last_delta or {}).get("changed_sections"),
+            "added_at": self.added_at
+        }
+
+
+class RoundTick:
+    """Resultado da coleta de uma partida dentro de uma rodada do agendador"""
+
+    def __init__(self, match: MonitoredMatch, started: float):
+        self.match = match
+        self.started = started           # relógio do event loop no início da coleta
+        self.raw_data: Optional[Dict[str, Any]] = None
+        self.check: Optional[SnapshotCheck] = None
+        self.error: Optional[Exception] = None
+
+
+class LiveScheduler:
+    """Fila de prioridade de coletas ao vivo com concorrência global limitada"""
+
+    def __init__(self, collector, max_concurrent: int = None, default_interval: float = None,
+                 max_failures: int = None, policy: Optional[PollingPolicy] = None, database=None,
+                 on_snapshot: Optional[Callable[[str, Dict[str, Any]], Awaitable[None]]] = None):
+        # collector: qualquer objeto com get_live_match_data_api(match_id) (ex: SofaScoreLiveCollectorAPI)
+        self.collector = collector
+        self.max_concurrent = max_concurrent or int(os.getenv('LIVE_MAX_CONCURRENT', '8'))
+        self.default_interval = default_interval or float(os.getenv('LIVE_DEFAULT_INTERVAL', '30'))
+        self.max_failures = max_failures or int(os.getenv('LIVE_MAX_CONSECUTIVE_FAILURES', '5'))
+        self.on_snapshot = on_snapshot
+        # DatabaseService opcional: snapshots alterados vão para match_data e o status do
+        # monitoramento fica em match_info (retomado por resume_from_database)
+        self.database = database
+        self.save_snapshots = os.getenv('LIVE_SAVE_SNAPSHOTS', 'true').lower() == 'true'
+        if policy is None and os.getenv('LIVE_ADAPTIVE_INTERVALS', 'true').lower() == 'true':
+            policy = polling_policy
+        self.policy = policy
+
+        self._matches: Dict[str, MonitoredMatch] = {}
+        # (next_due, seq, match_id); entradas obsoletas (partida removida/reagendada) são descartadas ao sair
+        self._heap: List[Tuple[float, int, str]] = []
+        self._seq = itertools.count()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+        # Rodadas em andamento (cada uma com as partidas que venceram juntas)
+        self._running_ticks: Set[asyncio.Task] = set()
+
+        self.stats = {
+            "ticks": 0,
+            "failures": 0,
+            "unchanged_ticks": 0,
+            "snapshots_saved": 0,
+            "late_ticks": 0,
+            "max_lateness_seconds": 0.0,
+            "finished_removed": 0,
+            "failing_removed": 0,
+            "rounds": 0,
+            "max_round_size": 0,
+            "shotmap_batches": 0,
+            "shotmaps_batched": 0
+        }
+
+    @property
+    def is_running(self) -> bool:
+        return self._dispatcher is not None and not self._dispatcher.done()
+
+    def _push(self, match: MonitoredMatch):
+        heapq.heappush(self._heap, (match.next_due, next(self._seq), match.match_id))
+        if self._wakeup:
+            self._wakeup.set()
+
+    def add_match(self, match_id: str, interval: float = None, start_in: float = 0.0) -> MonitoredMatch:
+        """
+        Passa a monitorar a partida (se já monitorada, só atualiza o intervalo).
+        Sem intervalo fixo, a PollingPolicy define o intervalo a partir de cada coleta
+        """
+        match_id = str(match_id)
+        match = self._matches.get(match_id)
+        if match:
+            if interval:
+                match.interval = interval
+                match.adaptive = False
+            return match
+
+        match = MonitoredMatch(match_id, interval or self.default_interval,
+                               adaptive=interval is None and self.policy is not None)
+        match.next_due = asyncio.get_running_loop().time() + start_in
+        self._matches[match_id] = match
+        self._push(match)
+        mode = "adaptativo" if match.adaptive else f"{match.interval:.0f}s"
+        print(f"➕ [LIVE-SCHEDULER] Partida {match_id} adicionada (intervalo {mode}, "
+              f"{len(self._matches)} monitorada(s))")
+        return match
+
+    def remove_match(self, match_id: str) -> bool:
+        """Para de monitorar a partida (uma coleta em andamento termina, mas não é reagendada)"""
+        match = self._matches.pop(str(match_id), None)
+        if match is None:
+            return False
+        live_incremental_simplifier.forget(match.match_id)
+        snapshot_change_detector.forget(match.match_id)
+        print(f"➖ [LIVE-SCHEDULER] Partida {match.match_id} removida ({len(self._matches)} monitorada(s))")
+        return True
+
+    def get_match(self, match_id: str) -> Optional[MonitoredMatch]:
+        return self._matches.get(str(match_id))
+
+    def list_matches(self) -> List[MonitoredMatch]:
+        return list(self._matches.values())
+
+    async def start(self):
+        if self.is_running:
+            return
+        self._wakeup = asyncio.Event()
+        self._slots = asyncio.Semaphore(self.max_concurrent)
+        self._dispatcher = asyncio.create_task(self._dispatch_loop())
+        print(f"🗓️ [LIVE-SCHEDULER] Iniciado (até {self.max_concurrent} coleta(s) simultânea(s), "
+              f"intervalo padrão {self.default_interval:.0f}s)")
+
+    async def stop(self):
+        if self._dispatcher:
+            self._dispatcher.cancel()
+            await asyncio.gather(self._dispatcher, return_exceptions=True)
+            self._dispatcher = None
+        ticks = list(self._running_ticks)
+        for task in ticks:
+            task.cancel()
+        await asyncio.gather(*ticks, return_exceptions=True)
+        print("✅ [LIVE-SCHEDULER] Encerrado")
+
+    async def _dispatch_loop(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            if not self._heap:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            due, _, match_id = self._heap[0]
+            delay = due - loop.time()
+            if delay > 0:
+                # Acorda antes se uma partida nova/reagendada entrar na frente da fila
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            # Todas as partidas vencidas formam uma rodada (shotmaps analisados em lote)
+            now = loop.time()
+            batch: List[MonitoredMatch] = []
+            while self._heap and self._heap[0][0] <= now:
+                due, _, match_id = heapq.heappop(self._heap)
+                match = self._matches.get(match_id)
+                if match is None or match.running or match.next_due != due:
+                    continue  # entrada obsoleta
+                match.running = True
+                batch.append(match)
+
+            if batch:
+                self.stats["rounds"] += 1
+                self.stats["max_round_size"] = max(self.stats["max_round_size"], len(batch))
+                task = asyncio.create_task(self._run_round(batch))
+                self._running_ticks.add(task)
+                task.add_done_callback(self._running_ticks.discard)
+
+    async def _run_round(self, matches: List[MonitoredMatch]):
+        """
+        Coleta as partidas da rodada (limite global de concorrência), analisa de uma vez os
+        shotmaps alterados de todas elas e então simplifica, grava, publica e reagenda cada uma
+        """
+        ticks = await asyncio.gather(*(self._collect(match) for match in matches))
+        shot_summaries = self._analyze_round_shotmaps(ticks)
+        await asyncio.gather(*(self._finish_tick(tick, shot_summaries.get(tick.match.match_id))
+                               for tick in ticks))
+
+    async def _collect(self, match: MonitoredMatch) -> "RoundTick":
+        loop = asyncio.get_running_loop()
+        async with self._slots:
+            tick = RoundTick(match, loop.time())
+            lateness = tick.started - match.next_due
+            if lateness > 1.0:
+                self.stats["late_ticks"] += 1
+            self.stats["max_lateness_seconds"] = round(max(self.stats["max_lateness_seconds"], lateness), 3)
+
+            try:
+                raw_data = await self.collector.get_live_match_data_api(match.match_id)
+                if not raw_data or "basic_info" not in raw_data:
+                    raise RuntimeError("coleta sem dados básicos")
+                tick.raw_data = raw_data
+                tick.check = snapshot_change_detector.check(match.match_id, raw_data)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                tick.error = e
+        return tick
+
+    def _analyze_round_shotmaps(self, ticks: List["RoundTick"]) -> Dict[str, Dict[str, Any]]:
+        """Um único analyze_shotmaps para os shotmaps alterados de todas as partidas da rodada"""
+        shotmaps = {
+            tick.match.match_id: tick.raw_data["shotmap"]
+            for tick in ticks
+            if tick.check and "shotmap" in tick.check.changed_sections and tick.raw_data.get("shotmap")
+        }
+        if not shotmaps:
+            return {}
+        try:
+            summaries = analyze_shotmaps(shotmaps)
+        except Exception as e:
+            # Cada partida volta a calcular o próprio resumo na simplificação
+            print(f"⚠️ [LIVE-SCHEDULER] Análise em lote dos shotmaps falhou: {e}")
+            return {}
+        self.stats["shotmap_batches"] += 1
+        self.stats["shotmaps_batched"] += len(summaries)
+        return summaries
+
+    async def _handle_changed_snapshot(self, match: MonitoredMatch, raw_data: Dict[str, Any],
+                                       hashes: Dict[str, str], shot_summary: Optional[Dict[str, Any]] = None):
+        simplification = live_incremental_simplifier.update(match.match_id, raw_data, hashes,
+                                                            shot_summary=shot_summary)
+        match.latest_view = simplification["view"]
+        match.last_delta = simplification["delta"]
+
+        if self.database and self.save_snapshots:
+            record_id = await self.database.save_match_data(match.match_id, raw_data,
+                                                            simplified_data=simplification["view"])
+            if not record_id:
+                raise RuntimeError("falha ao gravar o snapshot em match_data")
+            self.stats["snapshots_saved"] += 1
+
+        if self.on_snapshot:
+            await self.on_snapshot(match.match_id, simplification)
+
+    async def _finish_tick(self, tick: "RoundTick", shot_summary: Optional[Dict[str, Any]] = None):
+        loop = asyncio.get_running_loop()
+        match = tick.match
+        finished = False
+        try:
+            if tick.error is not None:
+                raise tick.error
+
+            raw_data, check = tick.raw_data, tick.check
+            match.consecutive_failures = 0
+            match.last_error = None
+
+            if self.policy:
+                next_interval, match.phase, match.interval_reason = self.policy.next_interval(raw_data)
+                finished = next_interval is None
+                if match.adaptive and next_interval:
+                    match.interval = next_interval
+            else:
+                status_type = raw_data["basic_info"].get("status", {}).get("type", "")
+                finished = status_type in FINISHED_STATUS_TYPES
+
+            if check.changed:
+                await self._handle_changed_snapshot(match, raw_data, check.hashes, shot_summary)
+                # Só depois de simplificar, gravar e publicar: se algo falhar, a próxima coleta reprocessa
+                match.last_changed_at = snapshot_change_detector.commit(match.match_id, check.hashes,
+                                                                        check.changed_sections)
+            else:
+                # Nada mudou: só a "última verificação" (last_tick_at) avança
+                self.stats["unchanged_ticks"] += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            match.failures += 1
+            match.consecutive_failures += 1
+            match.last_error = f"{type(e).__name__}: {e}"
+            self.stats["failures"] += 1
+            print(f"❌ [LIVE-SCHEDULER] Partida {match.match_id}: {match.last_error}")
+        finally:
+            match.running = False
+            match.ticks += 1
+            match.last_tick_seconds = round(loop.time() - tick.started, 3)
+            match.total_tick_seconds += match.last_tick_seconds
+            match.last_tick_at = datetime.now().isoformat()
+            self.stats["ticks"] += 1
+
+        if finished:
+            self.stats["finished_removed"] += 1
+            print(f"🏁 [LIVE-SCHEDULER] Partida {match.match_id} encerrada")
+            self.remove_match(match.match_id)
+            await self._persist_monitor_stop(match.match_id, "finished")
+        elif match.consecutive_failures >= self.max_failures:
+            self.stats["failing_removed"] += 1
+            print(f"⚠️ [LIVE-SCHEDULER] Partida {match.match_id} falhou {match.consecutive_failures}x seguidas")
+            self.remove_match(match.match_id)
+            await self._persist_monitor_stop(match.match_id, "failed")
+        elif self._matches.get(match.match_id) is match:
+            # Ritmo fixo a partir do início da coleta, sem sobrepor coletas da mesma partida
+            match.next_due = max(tick.started + match.interval, loop.time())
+            self._push(match)
+
+    async def _persist_monitor_stop(self, match_id: str, monitor_state: str):
+        if self.database:
+            await self.database.stop_match_monitoring(match_id, monitor_state)
+
+    async def resume_from_database(self) -> int:
+        """Volta a monitorar as partidas ativas com match_info.monitoring_enabled"""
+        if not self.database:
+            return 0
+        rows = await self.database.get_monitored_matches()
+        for index, row in enumerate(rows):
+            # Espalha as primeiras coletas para não abrir todas as partidas ao mesmo tempo
+            self.add_match(row["match_id"], start_in=index * 0.5)
+        if rows:
+            print(f"🔁 [LIVE-SCHEDULER] {len(rows)} monitoramento(s) retomado(s) de match_info")
+        return len(rows)
+
+    def _phase_counts(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for match in self._matches.values():
+            counts[match.phase or "unknown"] = counts.get(match.phase or "unknown", 0) + 1
+        return counts
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "running": self.is_running,
+            "matches": len(self._matches),
+            "in_flight": sum(1 for match in self._matches.values() if match.running),
+            "rounds_in_flight": len(self._running_ticks),
+            "max_concurrent": self.max_concurrent,
+            "default_interval": self.default_interval,
+            "adaptive_intervals": self.policy is not None,
+            "phases": self._phase_counts(),
+            "skip_rate": round(self.stats["unchanged_ticks"] / self.stats["ticks"], 3) if self.stats["ticks"] else 0.0,
+            **self.stats
+        }
+
+
+async def _run_standalone(match_ids: List[str], interval: Optional[float], concurrency: int):
+    from browser_pool import BrowserPool
+    from services import SofaScoreLiveCollectorAPI
+
+    browser_pool = BrowserPool()
+    await browser_pool.start()
+    scheduler = None
+
+    async def print_snapshot(match_id: str, simplification: Dict[str, Any]):
+        summary = simplification["view"].get("match_summary", {})
+        score = summary.get("score", {})
+        changed = simplification["delta"]["changed_sections"]
+        print(f"⚽ [{datetime.now().strftime('%H:%M:%S')}] {match_id}: {summary.get('home_team')} "
+              f"{score.get('home', 0)} x {score.get('away', 0)} {summary.get('away_team')} "
+              f"({summary.get('status')}) - alterado: {', '.join(changed) or 'nada'}")
+        match = scheduler.get_match(match_id)
+        if match and match.interval_reason:
+            print(f"   ⏳ Próxima coleta em {match.interval:.0f}s ({match.interval_reason})")
+
+    try:
+        scheduler = LiveScheduler(SofaScoreLiveCollectorAPI(browser_pool=browser_pool),
+                                  max_concurrent=concurrency, default_interval=interval,
+                                  on_snapshot=print_snapshot)
+        await scheduler.start()
+        for match_id in match_ids:
+            scheduler.add_match(match_id, interval=interval)
+        while scheduler.list_matches():
+            await asyncio.sleep(1)
+        print("🏁 Todas as partidas monitoradas terminaram")
+    finally:
+        if scheduler:
+            await scheduler.stop()
+        await browser_pool.stop()
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("match_ids", nargs="+")
+    parser.add_argument("--interval", type=float, default=None, help="intervalo fixo em segundos")
+    parser.add_argument("--concurrency", type=int, default=int(os.getenv('LIVE_MAX_CONCURRENT', '8')))
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(_run_standalone(args.match_ids, args.interval, args.concurrency))
+    except KeyboardInterrupt:
+        print("\n⏹️ Monitoramento interrompido")
+        sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
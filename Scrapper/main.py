@@ -20,11 +20,11 @@ if platform.system() == "Windows":
 
 import os
 from datetime import datetime
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from contextlib import asynccontextmanager
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from urllib.parse import unquote
 
 # Importar modelos e serviços
@@ -45,7 +45,9 @@ from models import (
     DatabaseStatsResponse,
     MatchInfoResponse,
     MatchInfoListResponse,
-    MatchStatusUpdateResponse
+    MatchStatusUpdateResponse,
+    MonitorResponse,
+    MonitorListResponse
 )
 from services import (
     MatchDataService, 
@@ -55,6 +57,21 @@ from services import (
     MatchDataScrapingService  # Novo serviço para análise de dados
 )
 from database_service import DatabaseService
+from browser_pool import BrowserPool, PagePool
+from resource_blocking import resource_blocker
+from consent_state import consent_store
+from browser_supervisor import BrowserSupervisor, BrowserCrashError
+from scraping_workers import ScrapingWorkerPool, WorkerPoolFullError, WorkerPoolClosedError, WorkerJobError
+from wait_strategies import readiness_waiter
+from important_scripts.api_fetcher import get_fetch_stats
+from page_extractors import get_extractor_stats
+from team_index import team_index
+from match_parse_cache import match_parse_cache
+from incremental_simplifier import incremental_simplifier, live_incremental_simplifier
+from important_scripts.snapshot_changes import snapshot_change_detector
+from live_scheduler import LiveScheduler
+from live_broadcaster import live_broadcaster
+from executors import executors
 
 # Variáveis globais para serviços (inicializadas no lifespan)
 match_service = None
@@ -63,15 +80,23 @@ analysis_service = None  # Agora será MatchDataScrapingService
 links_service = None
 screenshot_service = None
 database_service = None
+browser_pool = None
+page_pool = None
+browser_supervisor = None
+scraping_workers = None
+live_scheduler = None
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Gerencia o ciclo de vida da aplicação"""
-    global match_service, simplifier_service, analysis_service, links_service, screenshot_service, database_service
+    global match_service, simplifier_service, analysis_service, links_service, screenshot_service, database_service, browser_pool, page_pool, browser_supervisor, scraping_workers, live_scheduler
     
     print("🚀 Inicializando serviços da aplicação...")
     
     try:
+        # Pools de CPU (processos) e I/O (threads) usados pelos serviços
+        executors.start()
+        
         # Inicializar DatabaseService
         print("💾 Inicializando DatabaseService...")
         database_service = DatabaseService()
@@ -84,12 +109,61 @@ async def lifespan(app: FastAPI):
             print(f"⚠️ Erro ao inicializar DatabaseService: {e}")
             print("⚠️ Aplicação continuará sem banco de dados")
         
+        # Inicializar pool de navegadores compartilhado
+        if os.getenv('BROWSER_POOL_ENABLED', 'true').lower() == 'true':
+            try:
+                print("🌐 Inicializando pool de navegadores...")
+                browser_pool = BrowserPool()
+                if os.getenv('BROWSER_SUPERVISOR_ENABLED', 'true').lower() == 'true':
+                    browser_supervisor = BrowserSupervisor(browser_pool)
+                await browser_pool.start()
+                if browser_supervisor:
+                    await browser_supervisor.start()
+                if os.getenv('PAGE_POOL_ENABLED', 'true').lower() == 'true':
+                    page_pool = PagePool(browser_pool)
+                    page_pool.preserve_storage_keys = consent_store.storage_keys
+            except Exception as e:
+                print(f"⚠️ Erro ao iniciar pool de navegadores: {e}")
+                print("⚠️ Serviços usarão um navegador por requisição")
+                browser_pool = None
+                browser_supervisor = None
+        
         # Inicializar outros serviços
         print("🔧 Inicializando serviços principais...")
         match_service = MatchDataService()
-        analysis_service = MatchDataScrapingService()  # Novo serviço de scraping
-        links_service = SofaScoreLinksService()
-        screenshot_service = SofaScoreScreenshotService()
+        analysis_service = MatchDataScrapingService(browser_pool=browser_pool, page_pool=page_pool)  # Novo serviço de scraping
+        links_service = SofaScoreLinksService(browser_pool=browser_pool)
+        screenshot_service = SofaScoreScreenshotService(browser_pool=browser_pool, page_pool=page_pool)
+        
+        # Aquecer abas dos perfis registrados pelos serviços
+        if page_pool:
+            await page_pool.warm_up()
+        
+        # Processos de scraping (opcional): cada um com seus próprios navegadores
+        workers = int(os.getenv('SCRAPING_WORKERS', '0'))
+        if workers > 0:
+            try:
+                scraping_workers = ScrapingWorkerPool(workers=workers)
+                scraping_workers.start()
+            except Exception as e:
+                print(f"⚠️ Erro ao iniciar processos de scraping: {e}")
+                print("⚠️ Scraping continuará no processo da API")
+                scraping_workers = None
+        
+        # Monitoramento ao vivo de várias partidas (coletas via API com os navegadores compartilhados)
+        if os.getenv('LIVE_SCHEDULER_ENABLED', 'true').lower() == 'true':
+            live_scheduler = LiveScheduler(SofaScoreLiveCollectorAPI(browser_pool=browser_pool),
+                                           database=database_service,
+                                           on_snapshot=live_broadcaster.publish_snapshot)
+            await live_scheduler.start()
+            live_broadcaster.scheduler = live_scheduler
+            # Retomar as partidas que estavam sendo monitoradas antes do reinício
+            await live_scheduler.resume_from_database()
+        
+        # Análises compartilhadas entre os assinantes do canal SSE (/monitor/{match_id}/stream)
+        live_broadcaster.analysis_runner = lambda identifier: run_scraping_job(
+            "screenshot_analysis", analysis_service.analyze_match_from_scraping, identifier
+        )
         
         print("✅ Todos os serviços inicializados com sucesso!")
         
@@ -101,6 +175,18 @@ async def lifespan(app: FastAPI):
     finally:
         print("🔄 Finalizando serviços...")
         # Cleanup quando a aplicação for encerrada
+        await live_broadcaster.stop()
+        if live_scheduler:
+            await live_scheduler.stop()
+        if scraping_workers:
+            await scraping_workers.stop()
+        if browser_supervisor:
+            await browser_supervisor.stop()
+        if page_pool:
+            await page_pool.close()
+        if browser_pool:
+            await browser_pool.stop()
+        executors.shutdown()
 
 # Criar aplicação FastAPI
 app = FastAPI(
@@ -178,7 +264,11 @@ async def root():
             "screenshot": "/match/{match_identifier}/screenshot",
             "screenshot_analysis": "/match/{match_identifier}/screenshot-analysis",
             "list_analyses": "/match/{match_id}/screenshot-analyses",
-            "latest_analysis": "/match/{match_id}/screenshot-analysis/latest"
+            "latest_analysis": "/match/{match_id}/screenshot-analysis/latest",
+            "start_monitor": "POST /monitor/{match_id}",
+            "stop_monitor": "DELETE /monitor/{match_id}",
+            "list_monitors": "GET /monitor",
+            "match_stream": "GET /monitor/{match_id}/stream (SSE)"
         },
         "disabled_endpoints": {
             "full_data": "/match/{match_id}/full-data [DESABILITADA]",
@@ -215,7 +305,26 @@ async def health_check():
             "timestamp": datetime.now(),
             "services": {
                 "database": "✅ Connected" if db_connected else "❌ Connection failed",
-                "ai_assistant": "✅ Available" if match_service.assistant else "⚠️ Not configured"
+                "ai_assistant": "✅ Available" if match_service.assistant else "⚠️ Not configured",
+                "browser_pool": browser_pool.get_stats() if browser_pool else "⚠️ Disabled",
+                "page_pool": page_pool.get_stats() if page_pool else "⚠️ Disabled",
+                "browser_supervisor": browser_supervisor.get_stats() if browser_supervisor else "⚠️ Disabled",
+                "scraping_workers": scraping_workers.get_stats() if scraping_workers else "⚠️ Disabled (in-process)",
+                "live_scheduler": live_scheduler.get_stats() if live_scheduler else "⚠️ Disabled",
+                "live_broadcaster": live_broadcaster.get_stats(),
+                "resource_blocking": resource_blocker.get_stats(),
+                "consent_state": consent_store.get_stats(),
+                "wait_strategies": readiness_waiter.get_stats(),
+                "api_fetcher": get_fetch_stats(),
+                "page_extractors": get_extractor_stats(),
+                "team_index": team_index.get_stats(),
+                "match_parse_cache": match_parse_cache.get_stats(),
+                "incremental_simplifier": {
+                    "analysis": incremental_simplifier.get_stats(),
+                    "live": live_incremental_simplifier.get_stats()
+                },
+                "snapshot_changes": snapshot_change_detector.get_stats(),
+                "executors": executors.get_stats()
             }
         }
     except Exception as e:
@@ -491,7 +600,8 @@ async def collect_links():
     - 🔴 **in_progress**: Partida em andamento (mostra minuto atual e placar)
     - ⏳ **not_started**: Partida não iniciada (placares 0-0)
     - ✅ **finished**: Partida finalizada (placar final)
-    - ⏸️ **postponed**: Partida adiada
+    - ⏸️ **postponed**: Partida adiada (sem placar)
+    - 🚫 **canceled** / **interrupted**: Partida cancelada ou interrompida (sem placar)
     
     **MELHORIAS IMPLEMENTADAS:**
     - ✅ Múltiplos seletores CSS para diferentes tipos de partida
@@ -541,7 +651,7 @@ async def collect_links():
         
         # Coletar informações detalhadas das partidas (apenas futebol)
         print("🔄 [COLLECT-LINKS] Chamando links_service.collect_and_filter_links()...")
-        result = await links_service.collect_and_filter_links()
+        result = await run_scraping_job("collect_links", links_service.collect_and_filter_links)
         
         print(f"✅ [COLLECT-LINKS] Resultado recebido: success={result.get('success', 'N/A')}")
         
@@ -672,7 +782,7 @@ async def take_match_screenshot(match_identifier: str):
         print(f"📸 Iniciando captura de screenshot para: {match_identifier}")
         
         # Capturar screenshot
-        result = await screenshot_service.take_match_screenshot(match_identifier)
+        result = await run_scraping_job("screenshot", screenshot_service.take_match_screenshot, match_identifier)
         
         if result["success"]:
             return ScreenshotResponse(**result)
@@ -726,14 +836,18 @@ async def take_match_screenshot(match_identifier: str):
           - Partida ativa ou recente no SofaScore
           
           **Nota:** Esta análise é baseada em dados reais extraídos da página da partida no momento da consulta.
+          
+          Requisições simultâneas para a mesma partida compartilham uma única análise, que também é
+          enviada aos assinantes de `GET /monitor/{match_id}/stream`.
           """)
 async def analyze_match_from_scraping(match_identifier: str):
     """Análise técnica da partida baseada em scrapping de dados em tempo real"""
     try:
         print(f"🤖 Iniciando análise técnica via scrapping para: {match_identifier}")
         
-        # Gerar análise a partir dos dados extraídos
-        result = await analysis_service.analyze_match_from_scraping(match_identifier)
+        # Gerar análise a partir dos dados extraídos (uma por vez por partida, publicada no canal SSE)
+        match_key = screenshot_service.extract_match_id_from_identifier(unquote(match_identifier))
+        result = await live_broadcaster.run_analysis(match_key, match_identifier)
         
         if result["success"]:
             return ScreenshotAnalysisResponse(**result)
@@ -868,6 +982,155 @@ async def get_all_data_analyses(limit: int = 50):
             detail=f"Erro ao buscar análises: {str(e)}"
         )
 
+def require_live_scheduler():
+    if not live_scheduler or not live_scheduler.is_running:
+        raise HTTPException(status_code=503, detail="Monitoramento ao vivo desabilitado (LIVE_SCHEDULER_ENABLED)")
+    return live_scheduler
+
+@app.post("/monitor/{match_id}",
+          response_model=MonitorResponse,
+          tags=["Monitoramento ao Vivo"],
+          summary="Iniciar Monitoramento ao Vivo",
+          description="""
+          Passa a acompanhar a partida no agendador da API (coletas via API do SofaScore com os
+          navegadores compartilhados, simplificação incremental e gravação só quando algo muda).
+          
+          - Sem `interval`, o intervalo é adaptativo (fase da partida, horário de início, ritmo de incidentes)
+          - A partida sai sozinha do monitoramento ao terminar
+          - O monitoramento é retomado se a API reiniciar (`match_info.monitoring_enabled`)
+          """)
+async def start_monitor(match_id: str, interval: Optional[float] = None):
+    """Inicia (ou ajusta) o monitoramento ao vivo de uma partida"""
+    scheduler = require_live_scheduler()
+    if not match_id.isdigit():
+        raise HTTPException(status_code=400, detail="match_id deve ser o ID numérico da partida no SofaScore")
+    if interval is not None and interval < 5:
+        raise HTTPException(status_code=400, detail="interval mínimo: 5 segundos")
+    
+    already_monitored = scheduler.get_match(match_id) is not None
+    match = scheduler.add_match(match_id, interval=interval)
+    # Monitoramento explícito continua mesmo sem assinantes no canal SSE
+    live_broadcaster.release_monitor(match_id)
+    persisted = False
+    if database_service:
+        persisted = await database_service.start_match_monitoring(
+            match_id, f"https://www.sofascore.com/match/{match_id}"
+        )
+    
+    return MonitorResponse(
+        success=True,
+        message=f"Partida {match_id} {'já estava' if already_monitored else 'passou a ser'} monitorada"
+                + ("" if persisted else " (sem persistência no banco)"),
+        data=match.to_dict(),
+        timestamp=datetime.now()
+    )
+
+@app.delete("/monitor/{match_id}",
+            response_model=MonitorResponse,
+            tags=["Monitoramento ao Vivo"],
+            summary="Parar Monitoramento ao Vivo")
+async def stop_monitor(match_id: str):
+    """Para o monitoramento ao vivo de uma partida"""
+    scheduler = require_live_scheduler()
+    match = scheduler.get_match(match_id)
+    if match is None:
+        raise HTTPException(status_code=404, detail=f"Partida {match_id} não está sendo monitorada")
+    
+    scheduler.remove_match(match_id)
+    if database_service:
+        await database_service.stop_match_monitoring(match_id, "stopped")
+    
+    return MonitorResponse(
+        success=True,
+        message=f"Monitoramento da partida {match_id} encerrado",
+        data=match.to_dict(),
+        timestamp=datetime.now()
+    )
+
+@app.get("/monitor",
+         response_model=MonitorListResponse,
+         tags=["Monitoramento ao Vivo"],
+         summary="Listar Monitoramentos ao Vivo",
+         description="""
+         Lista as partidas monitoradas com fase, intervalo atual, última coleta, latência
+         (última e média) e contagem de erros, além das estatísticas do agendador.
+         """)
+async def list_monitors():
+    """Lista os monitoramentos ao vivo ativos"""
+    scheduler = require_live_scheduler()
+    monitors = [match.to_dict() for match in scheduler.list_matches()]
+    
+    return MonitorListResponse(
+        success=True,
+        message=f"{len(monitors)} partida(s) monitorada(s)",
+        data=monitors,
+        total_monitors=len(monitors),
+        scheduler=scheduler.get_stats(),
+        timestamp=datetime.now()
+    )
+
+@app.get("/monitor/{match_id}/stream",
+         tags=["Monitoramento ao Vivo"],
+         summary="Canal ao Vivo da Partida (SSE)",
+         description="""
+         Canal Server-Sent Events (`text/event-stream`) com as atualizações da partida, no lugar do
+         polling do frontend. Todos os assinantes da mesma partida compartilham uma coleta e uma análise.
+         
+         **Eventos:**
+         - `state`: snapshot simplificado alterado (`view`) e o que mudou (`delta`), vindo do agendador
+         - `analysis`: nova análise técnica (mesmo formato de `data` em `/screenshot-analysis`)
+         - `analysis_error`: falha na análise automática
+         
+         **Parâmetros:**
+         - identifier: URL/slug da partida usado na análise (padrão: o próprio match_id)
+         - analysis: `true` para gerar análises automáticas a cada `LIVE_ANALYSIS_INTERVAL` segundos
+         
+         Ao conectar, o último `state` e a última `analysis` são reenviados. Sem monitoramento ativo,
+         a partida entra no agendador com o primeiro assinante e sai com o último.
+         """)
+async def stream_match(match_id: str, request: Request, identifier: Optional[str] = None, analysis: bool = False):
+    """Canal SSE de uma partida"""
+    if analysis and not analysis_service:
+        raise HTTPException(status_code=503, detail="Serviço de análise indisponível")
+    
+    subscriber = live_broadcaster.subscribe(match_id, identifier=identifier, wants_analysis=analysis)
+    
+    async def event_stream():
+        try:
+            yield f"retry: 5000\n: conectado à partida {match_id}\n\n"
+            while not await request.is_disconnected():
+                try:
+                    yield await asyncio.wait_for(subscriber.queue.get(), timeout=live_broadcaster.heartbeat)
+                except asyncio.TimeoutError:
+                    # Comentário SSE mantém a conexão aberta em proxies
+                    yield ": heartbeat\n\n"
+        finally:
+            live_broadcaster.unsubscribe(subscriber)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+async def run_scraping_job(kind: str, service_method, match_identifier: Optional[str] = None):
+    """Executa um job de scraping nos processos dedicados (se ativos) ou no processo da API"""
+    args = (match_identifier,) if match_identifier is not None else ()
+    try:
+        if scraping_workers and scraping_workers.is_running:
+            return await scraping_workers.submit(kind, *args, key=match_identifier)
+        return await service_method(*args)
+    except BrowserCrashError as e:
+        # Navegador caiu duas vezes: o pool já relança um novo, então o cliente pode repetir a requisição
+        raise HTTPException(status_code=503, detail=f"Navegador de scraping reiniciado, tente novamente: {e}")
+    except (WorkerPoolFullError, WorkerPoolClosedError) as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except WorkerJobError as e:
+        # Falha dentro do processo de scraping (erro do job ou processo que morreu)
+        raise HTTPException(status_code=502, detail=f"Erro no processo de scraping: {e}")
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail="Tempo limite do job de scraping excedido")
+
 # Handler de erros global
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
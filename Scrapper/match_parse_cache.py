@@ -0,0 +1,71 @@
+"""
+Cache dos Containers de Partida entre Coletas
+Com coletas a cada 30-60s, os textos das partidas agendadas e finalizadas da página inicial
+se repetem byte a byte; este LRU guarda o dicionário já validado por (href, texto do container)
+para que só os containers novos ou alterados (partidas ao vivo) sejam analisados de novo
+"""
+
+import os
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple
+
+# Partidas ao vivo mudam a cada coleta (minuto/placar): não vale a pena guardar
+UNCACHED_STATUSES = ("in_progress", "halftime")
+
+
+class MatchParseCache:
+    """LRU limitado de (href, texto) -> dicionário da partida validado"""
+
+    def __init__(self, max_entries: int = None):
+        self.enabled = os.getenv('PARSE_CACHE_ENABLED', 'true').lower() == 'true'
+        self.max_entries = max_entries or int(os.getenv('PARSE_CACHE_SIZE', '2000'))
+        self._entries: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "skipped_live": 0,
+            "evictions": 0
+        }
+
+    def get(self, href: str, text: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Cópia do dicionário guardado, ou None (miss)"""
+        if not self.enabled:
+            return None
+        key = (href, text or "")
+        cached = self._entries.get(key)
+        if cached is None:
+            self.stats["misses"] += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats["hits"] += 1
+        return dict(cached)
+
+    def put(self, href: str, text: Optional[str], match_details: Dict[str, Any]):
+        if not self.enabled:
+            return
+        if match_details.get("match_status") in UNCACHED_STATUSES:
+            self.stats["skipped_live"] += 1
+            return
+        key = (href, text or "")
+        self._entries[key] = dict(match_details)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def clear(self):
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hit_rate": round(self.stats["hits"] / lookups, 3) if lookups else 0.0,
+            **self.stats
+        }
+
+
+# Instância global
+match_parse_cache = MatchParseCache()
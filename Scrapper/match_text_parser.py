@@ -0,0 +1,368 @@
+"""
+Parser do Texto dos Containers de Partida
+Padrões pré-compilados combinados em uma única alternância com grupos nomeados: uma busca por
+container identifica o formato (adiada/cancelada, finalizada, ao vivo, placar, agendada, simples, compacta) e um
+classificador determinístico define o status. Funções puras, sem I/O nem estado
+"""
+
+import re
+from typing import Optional, Dict, Any, List, Tuple
+
+# Uma única expressão para todos os formatos, na ordem de prioridade do parser antigo.
+# Cada alternativa é envolvida por um grupo nomeado com o formato (match.lastgroup),
+# e o prefixo ".*?" reproduz o re.search não ancorado dos padrões antigos.
+MATCH_TEXT_PATTERN = re.compile(r"""
+    ^(?:
+        # Sem jogo: "AdiadoAjaxPSV", "20:00CanceladoFlamengoVasco" (o rótulo define o status, sem placar)
+        (?P<halted>(?:\d{1,2}:\d{2})?\s*(?P<halted_label>Adiad[oa]|Cancelad[oa]|Interrompid[oa]|Abandonad[oa]
+            |Postponed|Cancell?ed|Interrupted|Abandoned)\s*(?P<halted_teams>.+?)$)
+      | # Finalizada: "19:30F2°TVolta RedondaAvaí1111", "FTMonterreyInter2100"
+        (?P<finished>.*?(?:\d{1,2}:\d{2})?F(?:\d+[°º]?)?T
+            (?P<fin_teams>.+?)(?P<fin_home>\d)(?P<fin_away>\d)\d\d$)
+      | # Ao vivo: "22:0024'MonterreyInter0000", "24'MonterreyInter0000"
+        (?P<live>.*?(?:\d{1,2}:\d{2}(?=\d+['"]))?(?P<live_minute>\d+)['"]
+            (?P<live_teams>.+?)(?P<live_home>\d)(?P<live_away>\d)\d\d$)
+      | # Placar explícito: "Fluminense 2 - 1 Botafogo", "Fluminense2x1Botafogo"
+        (?P<score>(?P<sc_home_team>.+?)\s*(?P<sc_home>\d+)\s*[-x]\s*(?P<sc_away>\d+)\s*(?P<sc_away_team>.+?)$)
+      | # Agendada: "23:30-CanadáHonduras", "23:30 Canadá x Honduras"
+        (?P<scheduled>.*?(?P<sched_time>\d{1,2}:\d{2})(?:-|\s+|\s*(?:x|vs)\s*)(?P<sched_teams>.+)$)
+      | # Simples: "Time A vs Time B", "Time A - Time B"
+        (?P<simple>(?P<simple_home>[A-Za-zÀ-ÿ\s.]+?)\s*(?:-|\s(?i:vs|x)\s)\s*(?P<simple_away>[A-Za-zÀ-ÿ\s.]+)$)
+      | # Compacta: "FluminenseBotafogo"
+        (?P<compact>[^\W\d_]{7,}$)
+    )
+""", re.VERBOSE)
+
+# Formato -> status (o formato "score" depende dos marcadores de jogo ao vivo)
+STATE_BY_FORM = {
+    "finished": "finished",
+    "live": "in_progress",
+    "scheduled": "scheduled",
+    "simple": "not_started",
+    "compact": "not_started"
+}
+
+# Rótulo de partida sem jogo -> status
+HALTED_STATE_BY_LABEL = {
+    "adiad": "postponed",
+    "postponed": "postponed",
+    "cancel": "canceled",
+    "interr": "interrupted",
+    "abandon": "canceled"
+}
+
+LIVE_MARKER_PATTERN = re.compile(r"ao vivo|live|['\"]", re.IGNORECASE)
+
+# Separadores explícitos entre os times
+TEAM_SEPARATOR_PATTERN = re.compile(r"\s+(?:vs|x)\s+|\s+-\s+", re.IGNORECASE)
+# Minúscula seguida de maiúscula: "Volta RedondaAvaí" -> "Volta Redonda" | "Avaí"
+CAMEL_BOUNDARY_PATTERN = re.compile(r"(?<=[a-zß-öø-ÿ])(?=[A-ZÀ-ÖØ-Þ])")
+# Sigla seguida de nome: "CSANáutico" -> "CSA" | "Náutico", "Daegu FCPohang" -> "Daegu FC" | "Pohang"
+ACRONYM_BOUNDARY_PATTERN = re.compile(r"(?<=[A-ZÀ-ÖØ-Þ])(?=[A-ZÀ-ÖØ-Þ][a-zß-öø-ÿ])")
+
+MIN_TEAM_LENGTH = 3
+
+# Nomes concatenados conhecidos do SofaScore (sem espaços) -> [casa, visitante]
+SPECIFIC_CASES = {
+    # Casos brasileiros
+    'VoltaRedondaAvaí': ['Volta Redonda', 'Avaí'],
+    'PaysanduBotafogo': ['Paysandu', 'Botafogo'],
+    'PaysanduBotafogoSP': ['Paysandu', 'Botafogo-SP'],
+    'FluminenseBotafogo': ['Fluminense', 'Botafogo'],
+    'FlamengoVasco': ['Flamengo', 'Vasco'],
+    'CorintiansFlamengo': ['Corinthians', 'Flamengo'],
+    'PalmeirasFlamengo': ['Palmeiras', 'Flamengo'],
+    'SantosSãoPaulo': ['Santos', 'São Paulo'],
+    'SãoPauloCorinthians': ['São Paulo', 'Corinthians'],
+    'GrêmioInternacional': ['Grêmio', 'Internacional'],
+    'AtléticoMGCruzeiro': ['Atlético-MG', 'Cruzeiro'],
+    'BahiaVitória': ['Bahia', 'Vitória'],
+    'FortalezaCeará': ['Fortaleza', 'Ceará'],
+    'SportNáutico': ['Sport', 'Náutico'],
+    'CriciúmaAvaí': ['Criciúma', 'Avaí'],
+    'ChapecoenseCriciúma': ['Chapecoense', 'Criciúma'],
+    'GoiásVilaNova': ['Goiás', 'Vila Nova'],
+    'CuiabáAméricaMG': ['Cuiabá', 'América-MG'],
+    'BragantinoPalmeiras': ['Bragantino', 'Palmeiras'],
+    'AtléticoGOGoiânia': ['Atlético-GO', 'Goiânia'],
+    'JuventudeGrêmio': ['Juventude', 'Grêmio'],
+    'OperárioLondrina': ['Operário', 'Londrina'],
+    'TombenseVila': ['Tombense', 'Vila'],
+    'CSANáutico': ['CSA', 'Náutico'],
+    'SampaioVitória': ['Sampaio', 'Vitória'],
+    'BotafogoSPPonte': ['Botafogo-SP', 'Ponte'],
+    'GuaraniPonte': ['Guarani', 'Ponte'],
+    'CRBNáutico': ['CRB', 'Náutico'],
+    'VitóriaBahia': ['Vitória', 'Bahia'],
+    'CearáFortaleza': ['Ceará', 'Fortaleza'],
+    'NáuticoSport': ['Náutico', 'Sport'],
+    'AvaíFigueirense': ['Avaí', 'Figueirense'],
+    'CriciúmaChapecoense': ['Criciúma', 'Chapecoense'],
+    'VilaNovaCrac': ['Vila Nova', 'Crac'],
+    'AméricaMGCruzeiro': ['América-MG', 'Cruzeiro'],
+    'PalmeirasCorinthians': ['Palmeiras', 'Corinthians'],
+    'SantosFlamengo': ['Santos', 'Flamengo'],
+    'VascoFluminense': ['Vasco', 'Fluminense'],
+    'InternacionalGrêmio': ['Internacional', 'Grêmio'],
+    'CruzeiroAtléticoMG': ['Cruzeiro', 'Atlético-MG'],
+
+    # Casos internacionais
+    'RiverPlateUrawaReds': ['River Plate', 'Urawa Reds'],
+    'MonterreyInter': ['Monterrey', 'Inter'],
+    'FluminenseDortmund': ['Fluminense', 'Dortmund'],
+    'UlsanSundowns': ['Ulsan', 'Sundowns'],
+    'CuraçaoElSalvador': ['Curaçao', 'El Salvador'],
+    'CanadáHonduras': ['Canadá', 'Honduras'],
+    'DaeguFCPohangSteelers': ['Daegu FC', 'Pohang Steelers'],
+    'FCSeoulGangwon': ['FC Seoul', 'Gangwon'],
+    'JeonbukSuwonFC': ['Jeonbuk', 'Suwon FC'],
+    'ChlefMCAlger': ['Chlef', 'MC Alger'],
+    'BelouizdadOran': ['Belouizdad', 'Oran'],
+    'ESMostaganemKabylie': ['ES Mostaganem', 'Kabylie'],
+    'ElBayadhOlympiqueAkbou': ['El Bayadh', 'Olympique Akbou'],
+    'MagraConstantine': ['Magra', 'Constantine'],
+    'SaouraParadou': ['Saoura', 'Paradou'],
+    'OrshaDynamoBrest': ['Orsha', 'Dynamo Brest'],
+    'KuressaareTammeka': ['Kuressaare', 'Tammeka'],
+    'WestChesterUnitedLehighValleyUnited': ['West Chester United', 'Lehigh Valley United'],
+    'MarinFCAllianceOaklandSoul': ['Marin FC Alliance', 'Oakland Soul'],
+    'BeijingQingdao': ['Beijing', 'Qingdao'],
+    'ColoColoCobresal': ['Colo Colo', 'Cobresal'],
+    'BarcelonaRealMadrid': ['Barcelona', 'Real Madrid'],
+    'RealMadridAtléticoMadrid': ['Real Madrid', 'Atlético Madrid'],
+    'ManchesterUnitedManchesterCity': ['Manchester United', 'Manchester City'],
+    'ChelseaArsenal': ['Chelsea', 'Arsenal'],
+    'LiverpoolTottenham': ['Liverpool', 'Tottenham'],
+    'BayernMunichBorussiaDortmund': ['Bayern Munich', 'Borussia Dortmund'],
+    'JuventusMilan': ['Juventus', 'Milan'],
+    'InterMilan': ['Inter', 'Milan'],
+    'PSGMarseille': ['PSG', 'Marseille'],
+    'AjaxPSV': ['Ajax', 'PSV'],
+    'PortoSporting': ['Porto', 'Sporting'],
+    'BenficaPorto': ['Benfica', 'Porto'],
+    'CelticRangers': ['Celtic', 'Rangers'],
+    'FenerbahçeGalatasaray': ['Fenerbahçe', 'Galatasaray'],
+    'OlympiacosPanathinaikos': ['Olympiacos', 'Panathinaikos'],
+    'SpartakDynamo': ['Spartak', 'Dynamo'],
+    'ZenitCSKA': ['Zenit', 'CSKA'],
+    'RiverBoca': ['River', 'Boca'],
+    'SanLorenzoRacing': ['San Lorenzo', 'Racing'],
+    'FlamengoSantos': ['Flamengo', 'Santos'],
+    'BocaRiver': ['Boca', 'River'],
+    'RacingIndependiente': ['Racing', 'Independiente'],
+    'EstudiantesGimnasia': ['Estudiantes', 'Gimnasia'],
+    'TigreBanfield': ['Tigre', 'Banfield'],
+    'LanúsArsenal': ['Lanús', 'Arsenal'],
+    'VélezHuracán': ['Vélez', 'Huracán'],
+    'NewellsRosario': ['Newell\'s', 'Rosario'],
+    'TalleresGodoy': ['Talleres', 'Godoy'],
+    'UnionColón': ['Union', 'Colón'],
+    'AldosiviPlatense': ['Aldosivi', 'Platense'],
+    'BarracasCentral': ['Barracas', 'Central'],
+    'DefensaJusticia': ['Defensa', 'Justicia'],
+    'PatronatoSarmiento': ['Patronato', 'Sarmiento'],
+    'ArsenalSarmiento': ['Arsenal', 'Sarmiento'],
+    'CentralCórdoba': ['Central', 'Córdoba'],
+    'GimnasiaRiestra': ['Gimnasia', 'Riestra'],
+    'IndependienteRivadavia': ['Independiente', 'Rivadavia'],
+    'InstitutoDeportivo': ['Instituto', 'Deportivo'],
+    'RivaraviaGodoy': ['Rivaravia', 'Godoy'],
+    'TigreBelgrano': ['Tigre', 'Belgrano'],
+    'BanfieldSan': ['Banfield', 'San'],
+    'HuracánPlatense': ['Huracán', 'Platense'],
+    'RosarioCentral': ['Rosario', 'Central'],
+    'GodoyTalleres': ['Godoy', 'Talleres'],
+    'ColónUnión': ['Colón', 'Unión'],
+    'PlatenseAldosivi': ['Platense', 'Aldosivi'],
+    'CentralBarracas': ['Central', 'Barracas'],
+    'JusticiaDefensa': ['Justicia', 'Defensa'],
+    'SarmientoPatronato': ['Sarmiento', 'Patronato'],
+    'SarmientoArsenal': ['Sarmiento', 'Arsenal'],
+    'CórdobaCentral': ['Córdoba', 'Central'],
+    'RiestraGimnasia': ['Riestra', 'Gimnasia'],
+    'RivadaviaIndependiente': ['Rivadavia', 'Independiente'],
+    'DeportivoInstituto': ['Deportivo', 'Instituto'],
+    'GodoyRivaravia': ['Godoy', 'Rivaravia'],
+    'BelgranoTigre': ['Belgrano', 'Tigre'],
+    'SanBanfield': ['San', 'Banfield'],
+    'PlatenseHuracán': ['Platense', 'Huracán']
+}
+
+
+def empty_match_details() -> Dict[str, str]:
+    return {
+        "home_team": "N/A",
+        "away_team": "N/A",
+        "home_score": "N/A",
+        "away_score": "N/A",
+        "match_time": "N/A",
+        "match_status": "N/A"
+    }
+
+
+def _split_at_boundary(teams_str: str, pattern) -> Optional[List[str]]:
+    """Primeira fronteira do padrão que deixa os dois lados com tamanho de nome de time"""
+    for boundary in pattern.finditer(teams_str):
+        home = teams_str[:boundary.start()].strip()
+        away = teams_str[boundary.end():].strip()
+        if len(home) >= MIN_TEAM_LENGTH and len(away) >= MIN_TEAM_LENGTH:
+            return [home, away]
+    return None
+
+
+def split_team_names(teams_str: Optional[str], team_index=None) -> Optional[List[str]]:
+    """
+    Separa os nomes dos times de uma string compacta ("Volta RedondaAvaí" -> ["Volta Redonda", "Avaí"]).
+    Com um TeamNameIndex, times já vistos são separados pelo índice; as heurísticas ficam para nomes inéditos
+    """
+    if not teams_str:
+        return None
+    teams_str = teams_str.strip()
+
+    # 1. Separadores explícitos (vs, x, hífen com espaços)
+    parts = TEAM_SEPARATOR_PATTERN.split(teams_str)
+    if len(parts) == 2 and all(part.strip() for part in parts):
+        return [parts[0].strip(), parts[1].strip()]
+
+    # 2. Times conhecidos: índice de nomes, depois casos específicos
+    known = (team_index.split(teams_str) if team_index is not None else None) \
+        or SPECIFIC_CASES.get(teams_str.replace(' ', ''))
+    if known:
+        return list(known)
+
+    # 3. Minúscula seguida de maiúscula, depois sigla seguida de nome
+    return (_split_at_boundary(teams_str, CAMEL_BOUNDARY_PATTERN)
+            or _split_at_boundary(teams_str, ACRONYM_BOUNDARY_PATTERN)
+            or _split_words(teams_str))
+
+
+def _split_words(teams_str: str) -> Optional[List[str]]:
+    """Último recurso para nomes já separados por espaços: divide as palavras ao meio"""
+    words = teams_str.split()
+    if len(words) < 2:
+        return None
+    mid = len(words) // 2
+    home, away = ' '.join(words[:mid]), ' '.join(words[mid:])
+    if len(home) >= MIN_TEAM_LENGTH and len(away) >= MIN_TEAM_LENGTH:
+        return [home, away]
+    return None
+
+
+def classify_state(form: str, text: str, label: Optional[str] = None) -> str:
+    """Status da partida a partir do formato reconhecido (marcadores ao vivo no placar, rótulo nas sem jogo)"""
+    if form == "score":
+        return "in_progress" if LIVE_MARKER_PATTERN.search(text) else "finished"
+    if form == "halted":
+        label = (label or "").lower()
+        return next((state for prefix, state in HALTED_STATE_BY_LABEL.items() if label.startswith(prefix)), "N/A")
+    return STATE_BY_FORM.get(form, "N/A")
+
+
+def _teams_from_spans(span_texts: Optional[List[str]]) -> Optional[List[str]]:
+    potential_teams = [text for text in (span_texts or [])
+                       if len(text) > 2 and not any(char.isdigit() for char in text)]
+    return potential_teams[:2] if len(potential_teams) >= 2 else None
+
+
+def parse_match_text(container_text: Optional[str], span_texts: Optional[List[str]] = None,
+                     team_index=None) -> Dict[str, Any]:
+    """
+    Extrai times, placar, tempo e status do texto de um container de partida da página inicial.
+    Sem formato reconhecido, usa os textos dos spans do container; sem nada, devolve tudo "N/A"
+    """
+    details = empty_match_details()
+    text = (container_text or "").strip()
+    match = MATCH_TEXT_PATTERN.match(text) if text else None
+
+    if match:
+        form = match.lastgroup
+        status = classify_state(form, text, match.group("halted_label"))
+
+        if form == "halted":
+            teams = split_team_names(match.group("halted_teams"), team_index)
+            scores = None
+            match_time = None
+        elif form == "finished":
+            teams = split_team_names(match.group("fin_teams"), team_index)
+            scores = (match.group("fin_home"), match.group("fin_away"))
+            match_time = "FT"
+        elif form == "live":
+            teams = split_team_names(match.group("live_teams"), team_index)
+            scores = (match.group("live_home"), match.group("live_away"))
+            match_time = f"{match.group('live_minute')}'"
+        elif form == "score":
+            teams = [match.group("sc_home_team").strip(), match.group("sc_away_team").strip()]
+            if min(len(teams[0]), len(teams[1])) < MIN_TEAM_LENGTH:
+                teams = None
+            scores = (match.group("sc_home"), match.group("sc_away"))
+            match_time = "Live" if status == "in_progress" else "FT"
+        elif form == "scheduled":
+            teams = split_team_names(match.group("sched_teams"), team_index)
+            scores = None
+            match_time = match.group("sched_time")
+        elif form == "simple":
+            teams = [match.group("simple_home").strip(), match.group("simple_away").strip()]
+            if min(len(teams[0]), len(teams[1])) < MIN_TEAM_LENGTH:
+                teams = None
+            scores = ("0", "0")
+            match_time = None
+        else:
+            teams = split_team_names(text, team_index)
+            scores = ("0", "0")
+            match_time = None
+
+        if teams:
+            details["home_team"], details["away_team"] = teams
+            if scores:
+                details["home_score"], details["away_score"] = scores
+            if match_time:
+                details["match_time"] = match_time
+            details["match_status"] = status
+            return details
+
+    teams = _teams_from_spans(span_texts)
+    if teams:
+        details.update({
+            "home_team": teams[0],
+            "away_team": teams[1],
+            "home_score": "0",
+            "away_score": "0",
+            "match_status": "not_started"
+        })
+    return details
+
+
+VALID_STATUSES = ("not_started", "in_progress", "finished", "postponed", "canceled", "interrupted",
+                  "halftime", "scheduled", "N/A")
+_TEAM_NAME_INVALID_CHARS = re.compile(r"[^\w\s-]")
+
+
+def clean_match_details(match_details: Dict[str, Any]) -> Dict[str, Any]:
+    """Valida e limpa os dados extraídos da partida (nomes, tempo e status)"""
+    for side in ("home_team", "away_team"):
+        if match_details[side] != "N/A":
+            match_details[side] = _TEAM_NAME_INVALID_CHARS.sub('', match_details[side])[:50].strip()
+
+    match_time = match_details.get("match_time", "N/A")
+    if match_time != "N/A" and len(match_time) > 10:
+        match_details["match_time"] = "N/A"
+
+    if match_details.get("match_status") not in VALID_STATUSES:
+        match_details["match_status"] = "N/A"
+
+    return match_details
+
+
+def parse_containers(containers: List[Tuple[Optional[str], Optional[List[str]]]],
+                     team_index=None) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """
+    Analisa e limpa um lote de (texto, spans) de uma vez (tarefa do pool de processos).
+    Devolve também os contadores do índice de times, que no processo filho são de uma cópia
+    """
+    results = []
+    for container_text, span_texts in containers:
+        try:
+            results.append(clean_match_details(parse_match_text(container_text, span_texts, team_index)))
+        except Exception:
+            results.append(empty_match_details())
+    return results, (dict(team_index.stats) if team_index is not None else None)
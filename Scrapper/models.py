@@ -119,7 +119,7 @@ class DetailedMatch(BaseModel):
     home_score: str = Field(description="Placar do time da casa")
     away_score: str = Field(description="Placar do time visitante")
     match_time: str = Field(description="Horário da partida ou tempo atual do jogo")
-    match_status: str = Field(description="Status da partida: not_started, in_progress, finished, postponed")
+    match_status: str = Field(description="Status da partida: not_started, in_progress, finished, postponed, canceled, interrupted")
     url: str = Field(description="URL da partida no SofaScore")
 
 class LinksCollectionResponse(BaseModel):
@@ -199,4 +199,20 @@ class ScreenshotAnalysisDetailResponse(BaseModel):
     message: str
     analysis_data: Optional[Dict[str, Any]] = None
     match_info: Optional[Dict[str, Any]] = None
-    timestamp: datetime 
\ No newline at end of file
+    timestamp: datetime 
+
+class MonitorResponse(BaseModel):
+    """Modelo para resposta de início/fim do monitoramento ao vivo de uma partida"""
+    success: bool
+    message: str
+    data: Optional[Dict[str, Any]] = None
+    timestamp: datetime
+
+class MonitorListResponse(BaseModel):
+    """Modelo para resposta da lista de monitoramentos ao vivo ativos"""
+    success: bool
+    message: str
+    data: Optional[List[Dict[str, Any]]] = None
+    total_monitors: Optional[int] = None
+    scheduler: Optional[Dict[str, Any]] = None
+    timestamp: datetime
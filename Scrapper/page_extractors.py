@@ -0,0 +1,235 @@
+"""
+Extratores em Página Versionados
+Scripts JavaScript executados de uma vez na página (um único page.evaluate) que devolvem
+os dados estruturados como JSON, com registro de versões e tempos de execução
+"""
+
+import os
+import json
+import time
+from typing import Optional, Dict, Any, Tuple
+
+# nome -> {versão: script}
+_EXTRACTORS: Dict[str, Dict[int, str]] = {}
+# nome -> versão padrão
+_DEFAULT_VERSIONS: Dict[str, int] = {}
+# "nome@versão" -> contadores
+extractor_stats: Dict[str, Dict[str, Any]] = {}
+
+
+def register_extractor(name: str, version: int, script: str, default: bool = True):
+    """Registra uma versão de extrator; a mais recente registrada com default=True vira a padrão"""
+    _EXTRACTORS.setdefault(name, {})[version] = script
+    if default:
+        _DEFAULT_VERSIONS[name] = version
+
+
+def _version_overrides() -> Dict[str, int]:
+    """Permite fixar versões via EXTRACTOR_VERSIONS (JSON), ex: {"match_page": 1}"""
+    raw = os.getenv('EXTRACTOR_VERSIONS')
+    if not raw:
+        return {}
+    try:
+        return {name: int(version) for name, version in json.loads(raw).items()}
+    except Exception as e:
+        print(f"⚠️ [EXTRACTORS] EXTRACTOR_VERSIONS inválido: {e}")
+        return {}
+
+
+def get_extractor(name: str, version: Optional[int] = None) -> Tuple[int, str]:
+    """Retorna (versão, script) do extrator"""
+    versions = _EXTRACTORS.get(name)
+    if not versions:
+        raise KeyError(f"Extrator não registrado: {name}")
+    version = version or _version_overrides().get(name) or _DEFAULT_VERSIONS[name]
+    if version not in versions:
+        raise KeyError(f"Versão {version} do extrator '{name}' não registrada")
+    return version, versions[version]
+
+
+def list_extractors() -> Dict[str, Any]:
+    return {
+        name: {"versions": sorted(versions), "default": _DEFAULT_VERSIONS.get(name)}
+        for name, versions in _EXTRACTORS.items()
+    }
+
+
+async def run_extractor(page, name: str, version: Optional[int] = None) -> Dict[str, Any]:
+    """Executa o extrator na página em uma única ida ao navegador"""
+    version, script = get_extractor(name, version)
+    stats = extractor_stats.setdefault(f"{name}@{version}", {
+        "runs": 0,
+        "failures": 0,
+        "total_ms": 0.0,
+        "last_ms": 0.0
+    })
+
+    started = time.perf_counter()
+    try:
+        result = await page.evaluate(script)
+    except Exception:
+        stats["failures"] += 1
+        raise
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    stats["runs"] += 1
+    stats["total_ms"] += elapsed_ms
+    stats["last_ms"] = round(elapsed_ms, 2)
+    print(f"⚡ [EXTRACTORS] {name}@{version} executado em {elapsed_ms:.1f}ms")
+
+    result = result or {}
+    result["extractor"] = f"{name}@{version}"
+    return result
+
+
+def get_extractor_stats() -> Dict[str, Any]:
+    return {
+        "registered": list_extractors(),
+        "runs": {
+            key: {**stats, "avg_ms": round(stats["total_ms"] / stats["runs"], 2) if stats["runs"] else 0.0,
+                  "total_ms": round(stats["total_ms"], 2)}
+            for key, stats in extractor_stats.items()
+        }
+    }
+
+
+# Versão 1 da página de partida: mesmos seletores de _extract_match_data (placar, status,
+# estatísticas da "Visão geral da partida", posse, eventos e nomes dos times)
+MATCH_PAGE_EXTRACTOR_V1 = r"""() => {
+    const text = el => (el && el.textContent ? el.textContent.trim() : '');
+    const result = { score: null, match_status: '', statistics: {}, events: [], team_names: null };
+
+    // Placar
+    const scoreSelectors = [
+        '.textStyle_display\\.extraLarge.c_neutrals\\.nLv1',
+        'span[style*="color: var(--colors-status-live)"]',
+        '.textStyle_display\\.extraLarge'
+    ];
+    for (const selector of scoreSelectors) {
+        const elements = document.querySelectorAll(selector);
+        if (elements.length >= 2) {
+            const home = text(elements[0]);
+            const away = text(elements[1]);
+            if (/^\d+$/.test(home) && /^\d+$/.test(away)) {
+                result.score = `${home} - ${away}`;
+                break;
+            }
+        }
+    }
+
+    // Status
+    const liveStatus = document.querySelector('.textStyle_body\\.medium.c_status\\.live');
+    const statusSpan = Array.from(document.querySelectorAll('span'))
+        .find(span => /Intervalo|Tempo adicional/.test(span.textContent || ''));
+    const statusElement = liveStatus || statusSpan || document.querySelector('.c_status\\.live');
+    if (statusElement && text(statusElement)) {
+        result.match_status = text(statusElement);
+    }
+
+    // Estatísticas da "Visão geral da partida"
+    const overview = document.evaluate(
+        "//*[contains(text(), 'Visão geral da partida')]", document, null,
+        XPathResult.FIRST_ORDERED_NODE_TYPE, null
+    ).singleNodeValue;
+    if (overview && overview.closest('.bg_surface, [class*=bg_surface]')) {
+        const rows = document.querySelectorAll('.Box.Flex.dsybxc, [class*="Box Flex"][class*="dsybxc"]');
+        for (const row of rows) {
+            const name = text(row.querySelector('.Text.lluFbU'));
+            if (!name) continue;
+            const numbers = Array.from(row.querySelectorAll('.Text'))
+                .map(text)
+                .filter(value => /^\d+$/.test(value) || value.includes('%'));
+            if (numbers.length >= 2) {
+                const key = name.toLowerCase().replace(/ /g, '_').replace(/[()]/g, '').replace(/-/g, '_');
+                result.statistics[key] = { home: numbers[0], away: numbers[numbers.length - 1], name: name };
+            }
+        }
+    }
+
+    // Posse de bola
+    const possession = document.querySelectorAll('span.Text.gxbNET');
+    if (possession.length >= 2) {
+        const home = text(possession[0]);
+        const away = text(possession[1]);
+        if (home.includes('%') && away.includes('%')) {
+            result.statistics['posse_de_bola'] = { home: home, away: away, name: 'Posse de bola' };
+        }
+    }
+
+    // Eventos
+    for (const container of document.querySelectorAll('.hover\\:bg_surface\\.s2.cursor_pointer')) {
+        const timeText = text(container.querySelector('.textStyle_display\\.micro'));
+        let player = '';
+        let type = '';
+        Array.from(container.querySelectorAll('.textStyle_body\\.medium')).forEach((element, index) => {
+            const value = text(element);
+            if (!value) return;
+            if (index === 0 && !['falta', 'cartão', 'gol', 'amarelo'].some(word => value.toLowerCase().includes(word))) {
+                player = value;
+            } else if (index === 1) {
+                type = value;
+            }
+        });
+        const cardIcon = container.querySelector('svg[title*="Cartão"], svg[title*="cartão"]');
+        if (cardIcon && !type) {
+            type = cardIcon.getAttribute('title') || '';
+        }
+        if (timeText && player) {
+            const isHome = !(container.getAttribute('class') || '').includes('flex-d_row-reverse');
+            result.events.push({ time: timeText, player: player, type: type || 'Evento', team: isHome ? 'home' : 'away' });
+        }
+    }
+
+    // Nomes dos times: título, h1, alt das imagens e seletores de time
+    const splitVs = value => {
+        const parts = value.split(' vs ');
+        if (parts.length < 2) return null;
+        const home = parts[0].trim().split(' - ')[0].trim();
+        const away = parts[1].trim().split(' - ')[0].trim();
+        return home.length > 2 && away.length > 2 ? [home, away] : null;
+    };
+    result.team_names = splitVs(document.title || '');
+    if (!result.team_names) {
+        for (const h1 of document.querySelectorAll('h1')) {
+            result.team_names = splitVs(text(h1));
+            if (result.team_names) break;
+        }
+    }
+    if (!result.team_names) {
+        const generic = ['match', 'football', 'soccer', 'logo', 'icon', 'image', 'photo'];
+        const teams = [];
+        for (const img of document.querySelectorAll('img[alt]')) {
+            const alt = (img.getAttribute('alt') || '').trim();
+            if (alt.length > 2 && !generic.some(word => alt.toLowerCase().includes(word))
+                && !/\d/.test(alt) && alt.split(/\s+/).length <= 4 && !teams.includes(alt)) {
+                teams.push(alt);
+            }
+            if (teams.length === 2) break;
+        }
+        if (teams.length === 2) result.team_names = teams;
+    }
+    if (!result.team_names) {
+        const teamSelectors = ['[data-testid*="team"]', '.team-name', '[class*="team"][class*="name"]', '.participant-name'];
+        for (const selector of teamSelectors) {
+            const teams = Array.from(document.querySelectorAll(selector)).slice(0, 2)
+                .map(text).filter(value => value.length > 2);
+            if (teams.length >= 2) {
+                result.team_names = teams;
+                break;
+            }
+        }
+    }
+
+    return result;
+}"""
+
+register_extractor("match_page", 1, MATCH_PAGE_EXTRACTOR_V1)
+
+# Versão 2: chaves das estatísticas sem acentos ("Finalizações no gol" -> finalizacoes_no_gol),
+# as mesmas lidas pela análise avançada e geradas por xhr_capture.dom_statistic_key
+MATCH_PAGE_EXTRACTOR_V2 = MATCH_PAGE_EXTRACTOR_V1.replace(
+    "const key = name.toLowerCase()",
+    "const key = name.normalize('NFD').replace(/[\\u0300-\\u036f]/g, '').toLowerCase()"
+)
+
+register_extractor("match_page", 2, MATCH_PAGE_EXTRACTOR_V2)
@@ -0,0 +1,164 @@
+"""
+Bloqueio de Recursos de Rede
+Perfis de page.route para navegações de scraping: bloqueia imagens, mídia, fontes e domínios de terceiros
+"""
+
+import os
+import json
+from typing import Optional, Dict, Any
+from urllib.parse import urlparse
+
+# Domínios considerados próprios do SofaScore (nunca bloqueados por serem de terceiros)
+FIRST_PARTY_DOMAINS = ("sofascore.com", "sofascore.app", "sofascore.net")
+
+# Domínios de anúncios/analytics sempre bloqueados quando o perfil bloqueia terceiros
+THIRD_PARTY_BLOCKLIST = (
+    "googletagmanager.com", "google-analytics.com", "doubleclick.net", "googlesyndication.com",
+    "googleadservices.com", "adservice.google.com", "facebook.net", "facebook.com",
+    "hotjar.com", "scorecardresearch.com", "amazon-adsystem.com", "adnxs.com",
+    "criteo.com", "taboola.com", "outbrain.com", "quantserve.com", "onesignal.com"
+)
+
+# Palpite de tamanho médio (bytes) por tipo de recurso bloqueado. Não é medido: requisições abortadas não
+# têm resposta, e os perfis bloqueiam todos os recursos desses tipos (não há respostas permitidas para comparar).
+# Os contadores derivados são expostos como *_guess e servem só como ordem de grandeza
+GUESSED_BYTES_PER_TYPE = {
+    "image": 25_000,
+    "media": 400_000,
+    "font": 40_000,
+    "stylesheet": 30_000,
+    "script": 60_000,
+    "xhr": 5_000,
+    "fetch": 5_000,
+    "other": 10_000
+}
+
+# Perfis por endpoint
+BLOCKING_PROFILES: Dict[str, Dict[str, Any]] = {
+    # Homepage: só precisamos do texto dos containers de partidas
+    "homepage": {
+        "resource_types": ["image", "media", "font"],
+        "block_third_party": True
+    },
+    # Página da partida (screenshot e análise): DOM e XHRs JSON
+    "match_page": {
+        "resource_types": ["image", "media", "font"],
+        "block_third_party": True
+    }
+}
+
+
+def _load_profile_overrides():
+    """Permite sobrescrever perfis via RESOURCE_BLOCKING_PROFILES (JSON)"""
+    raw = os.getenv('RESOURCE_BLOCKING_PROFILES')
+    if not raw:
+        return
+    try:
+        overrides = json.loads(raw)
+        for name, profile in overrides.items():
+            BLOCKING_PROFILES[name] = {**BLOCKING_PROFILES.get(name, {}), **profile}
+    except Exception as e:
+        print(f"⚠️ [RESOURCE-BLOCKING] RESOURCE_BLOCKING_PROFILES inválido: {e}")
+
+
+_load_profile_overrides()
+
+
+class ResourceBlocker:
+    """Aplica perfis de bloqueio via page.route e contabiliza requisições bloqueadas (e um palpite dos bytes)"""
+
+    def __init__(self, enabled: bool = None):
+        self.enabled = enabled if enabled is not None else \
+            os.getenv('RESOURCE_BLOCKING_ENABLED', 'true').lower() == 'true'
+        self._attached: Dict[int, Dict[str, Any]] = {}
+        self.stats: Dict[str, Dict[str, Any]] = {}
+
+    def _profile_stats(self, profile_name: str) -> Dict[str, Any]:
+        if profile_name not in self.stats:
+            self.stats[profile_name] = {
+                "requests_total": 0,
+                "requests_blocked": 0,
+                "bytes_saved_guess": 0,
+                "blocked_by_type": {}
+            }
+        return self.stats[profile_name]
+
+    def should_block(self, profile: Dict[str, Any], resource_type: str, url: str) -> bool:
+        """Decide se uma requisição deve ser bloqueada pelo perfil"""
+        if resource_type in profile.get("resource_types", []):
+            return True
+
+        host = urlparse(url).hostname or ""
+        if not host:
+            return False
+
+        if any(host == domain or host.endswith("." + domain) for domain in THIRD_PARTY_BLOCKLIST):
+            return profile.get("block_third_party", False)
+
+        if profile.get("block_third_party", False):
+            is_first_party = any(host == domain or host.endswith("." + domain) for domain in FIRST_PARTY_DOMAINS)
+            # O documento principal nunca é bloqueado
+            return not is_first_party and resource_type != "document"
+
+        return False
+
+    async def attach(self, page, profile_name: str):
+        """Aplica o perfil na aba (idempotente para abas reutilizadas do pool)"""
+        if not self.enabled:
+            return
+
+        profile = BLOCKING_PROFILES.get(profile_name)
+        if profile is None:
+            print(f"⚠️ [RESOURCE-BLOCKING] Perfil desconhecido: {profile_name}")
+            return
+
+        current = self._attached.get(id(page))
+        if current is not None:
+            if current["profile"] == profile_name and current["page"] is page:
+                return
+            try:
+                await current["page"].unroute("**/*", current["handler"])
+            except Exception:
+                pass
+
+        stats = self._profile_stats(profile_name)
+
+        async def handler(route):
+            request = route.request
+            stats["requests_total"] += 1
+            if self.should_block(profile, request.resource_type, request.url):
+                stats["requests_blocked"] += 1
+                stats["bytes_saved_guess"] += GUESSED_BYTES_PER_TYPE.get(request.resource_type,
+                                                                         GUESSED_BYTES_PER_TYPE["other"])
+                by_type = stats["blocked_by_type"]
+                by_type[request.resource_type] = by_type.get(request.resource_type, 0) + 1
+                await route.abort()
+            else:
+                await route.continue_()
+
+        await page.route("**/*", handler)
+        self._attached[id(page)] = {"profile": profile_name, "page": page, "handler": handler}
+        page.once("close", lambda _: self._attached.pop(id(page), None))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retorna contadores por perfil (bytes economizados são palpites por tipo, não medições)"""
+        return {
+            "enabled": self.enabled,
+            "bytes_saved_basis": "palpite por tipo de recurso (GUESSED_BYTES_PER_TYPE), não medido",
+            "profiles": {
+                name: {**stats, "mb_saved_guess": round(stats["bytes_saved_guess"] / (1024 * 1024), 2)}
+                for name, stats in self.stats.items()
+            }
+        }
+
+
+# Instância compartilhada pelos serviços
+resource_blocker = ResourceBlocker()
+
+
+async def apply_blocking_profile(page, profile_name: str):
+    """Aplica um perfil de bloqueio na aba usando a instância compartilhada"""
+    try:
+        await resource_blocker.attach(page, profile_name)
+    except Exception as e:
+        print(f"⚠️ [RESOURCE-BLOCKING] Não foi possível aplicar perfil '{profile_name}': {e}")
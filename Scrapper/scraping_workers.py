@@ -0,0 +1,343 @@
+"""
+Pool de Processos de Scraping
+N processos do sistema operacional, cada um com seu próprio event loop, pool de navegadores e serviços,
+alimentados por filas locais a partir do main.py; os resultados voltam por IPC (multiprocessing.Queue)
+"""
+
+import os
+import time
+import zlib
+import asyncio
+import itertools
+import threading
+import multiprocessing
+import multiprocessing.connection
+from typing import Optional, Dict, Any, List
+
+from browser_supervisor import BrowserCrashError
+
+
+class WorkerPoolFullError(Exception):
+    """Todos os processos de scraping estão com a fila cheia"""
+
+
+class WorkerJobError(Exception):
+    """O job falhou dentro do processo de scraping"""
+
+
+class WorkerPoolClosedError(Exception):
+    """O pool de processos não está aceitando jobs (não iniciado ou encerrando)"""
+
+
+# Jobs aceitos pelos processos: nome -> (serviço, método)
+JOB_HANDLERS = {
+    "screenshot": ("screenshot_service", "take_match_screenshot"),
+    "screenshot_analysis": ("analysis_service", "analyze_match_from_scraping"),
+    "collect_links": ("links_service", "collect_and_filter_links")
+}
+
+
+def _worker_main(worker_id: int, job_queue, result_queue, concurrency: int):
+    """Ponto de entrada do processo de scraping"""
+    try:
+        asyncio.run(_worker_loop(worker_id, job_queue, result_queue, concurrency))
+    except KeyboardInterrupt:
+        pass
+
+
+async def _worker_loop(worker_id: int, job_queue, result_queue, concurrency: int):
+    # Imports dentro do processo filho: cada processo tem seu próprio Playwright e navegadores
+    from browser_pool import BrowserPool, PagePool
+    from browser_supervisor import BrowserSupervisor
+    from consent_state import consent_store
+    from services import MatchDataScrapingService, SofaScoreLinksService, SofaScoreScreenshotService
+
+    tag = f"[WORKER-{worker_id}]"
+    browser_pool = None
+    page_pool = None
+    supervisor = None
+    try:
+        browser_pool = BrowserPool()
+        if os.getenv('BROWSER_SUPERVISOR_ENABLED', 'true').lower() == 'true':
+            supervisor = BrowserSupervisor(browser_pool)
+        await browser_pool.start()
+        if supervisor:
+            await supervisor.start()
+        if os.getenv('PAGE_POOL_ENABLED', 'true').lower() == 'true':
+            page_pool = PagePool(browser_pool)
+            page_pool.preserve_storage_keys = consent_store.storage_keys
+    except Exception as e:
+        print(f"⚠️ {tag} Erro ao iniciar pool de navegadores, usando um navegador por job: {e}")
+        browser_pool = None
+        supervisor = None
+
+    services = {
+        "screenshot_service": SofaScoreScreenshotService(browser_pool=browser_pool, page_pool=page_pool),
+        "analysis_service": MatchDataScrapingService(browser_pool=browser_pool, page_pool=page_pool),
+        "links_service": SofaScoreLinksService(browser_pool=browser_pool)
+    }
+    if page_pool:
+        await page_pool.warm_up()
+
+    loop = asyncio.get_running_loop()
+    slots = asyncio.Semaphore(concurrency)
+    running = set()
+
+    async def run_job(job_id, kind, args):
+        try:
+            service_name, method_name = JOB_HANDLERS[kind]
+            result = await getattr(services[service_name], method_name)(*args)
+            result_queue.put((job_id, True, result))
+        except BrowserCrashError as e:
+            # Vai como a própria exceção: a API responde 503 em vez de 502
+            result_queue.put((job_id, False, BrowserCrashError(str(e))))
+        except Exception as e:
+            result_queue.put((job_id, False, f"{type(e).__name__}: {str(e)}"))
+        finally:
+            slots.release()
+
+    print(f"✅ {tag} Processo pronto (pid {os.getpid()}, {concurrency} job(s) simultâneo(s))")
+    try:
+        while True:
+            job = await loop.run_in_executor(None, job_queue.get)
+            if job is None:
+                break
+            await slots.acquire()
+            task = asyncio.create_task(run_job(*job))
+            running.add(task)
+            task.add_done_callback(running.discard)
+
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+    finally:
+        if supervisor:
+            await supervisor.stop()
+        if page_pool:
+            await page_pool.close()
+        if browser_pool:
+            await browser_pool.stop()
+        print(f"🛑 {tag} Processo encerrado")
+
+
+class ScrapingWorkerPool:
+    """Distribui jobs de scraping entre processos e devolve os resultados como awaitables"""
+
+    ROUTING_MODES = ("least_loaded", "round_robin", "match_hash")
+
+    def __init__(self, workers: int = None, concurrency: int = None, max_pending: int = None,
+                 routing: str = None, job_timeout: float = None):
+        self.workers = workers or int(os.getenv('SCRAPING_WORKERS', '0')) or os.cpu_count() or 1
+        self.concurrency = concurrency or int(os.getenv('SCRAPING_WORKER_CONCURRENCY', '2'))
+        self.max_pending = max_pending or int(os.getenv('SCRAPING_WORKER_MAX_PENDING', '10'))
+        self.routing = routing or os.getenv('SCRAPING_WORKER_ROUTING', 'least_loaded')
+        self.job_timeout = job_timeout or float(os.getenv('SCRAPING_JOB_TIMEOUT', '180'))
+        if self.routing not in self.ROUTING_MODES:
+            print(f"⚠️ [SCRAPING-WORKERS] Roteamento '{self.routing}' desconhecido, usando least_loaded")
+            self.routing = "least_loaded"
+
+        self._mp = multiprocessing.get_context("spawn")
+        self._result_queue = None
+        self._processes: List[Any] = []
+        self._job_queues: List[Any] = []
+        self._pending: List[set] = []
+        self._futures: Dict[int, asyncio.Future] = {}
+        self._job_worker: Dict[int, int] = {}
+        self._job_ids = itertools.count(1)
+        self._round_robin = itertools.count()
+        self._reader: Optional[threading.Thread] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._started = False
+
+        self.stats = {
+            "jobs_submitted": 0,
+            "jobs_completed": 0,
+            "jobs_failed": 0,
+            "jobs_timed_out": 0,
+            "rejected_backpressure": 0,
+            "worker_restarts": 0
+        }
+
+    @property
+    def is_running(self) -> bool:
+        return self._started
+
+    def start(self):
+        """Inicia os processos e a thread que lê os resultados"""
+        if self._started:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._result_queue = self._mp.Queue()
+        for index in range(self.workers):
+            self._job_queues.append(None)
+            self._processes.append(None)
+            self._pending.append(set())
+            self._spawn(index)
+
+        self._reader = threading.Thread(target=self._read_results, name="scraping-results", daemon=True)
+        self._reader.start()
+        self._started = True
+        self._watchdog = threading.Thread(target=self._watch_workers, name="scraping-watchdog", daemon=True)
+        self._watchdog.start()
+        print(f"🚀 [SCRAPING-WORKERS] {self.workers} processo(s) de scraping, roteamento {self.routing}, "
+              f"fila máxima {self.max_pending} por processo")
+
+    def _spawn(self, index: int):
+        job_queue = self._mp.Queue()
+        process = self._mp.Process(
+            target=_worker_main,
+            args=(index, job_queue, self._result_queue, self.concurrency),
+            name=f"scraping-worker-{index}",
+            daemon=True
+        )
+        process.start()
+        self._job_queues[index] = job_queue
+        self._processes[index] = process
+
+    def _read_results(self):
+        """Thread: recebe (job_id, ok, payload) dos processos e resolve os futures no event loop"""
+        while True:
+            try:
+                message = self._result_queue.get()
+            except (EOFError, OSError):
+                break
+            if message is None:
+                break
+            self._loop.call_soon_threadsafe(self._resolve, *message)
+
+    def _resolve(self, job_id: int, ok: bool, payload: Any):
+        future = self._futures.pop(job_id, None)
+        worker = self._job_worker.pop(job_id, None)
+        if worker is not None:
+            self._pending[worker].discard(job_id)
+        if future is None or future.done():
+            return
+        if ok:
+            self.stats["jobs_completed"] += 1
+            future.set_result(payload)
+        else:
+            self.stats["jobs_failed"] += 1
+            future.set_exception(payload if isinstance(payload, BrowserCrashError) else WorkerJobError(payload))
+
+    def _watch_workers(self):
+        """
+        Thread: espera o sentinel dos processos e, quando um morre, agenda _check_workers no event loop
+        (os jobs dele falham na hora, sem esperar o job_timeout)
+        """
+        reported = set()
+        while self._started:
+            sentinels = {process.sentinel: process.pid for process in self._processes
+                         if process.pid not in reported}
+            if not sentinels:
+                time.sleep(1.0)
+                continue
+            ready = multiprocessing.connection.wait(list(sentinels), timeout=1.0)
+            if not ready or not self._started:
+                continue
+            reported.update(sentinels[sentinel] for sentinel in ready)
+            try:
+                self._loop.call_soon_threadsafe(self._check_workers)
+            except RuntimeError:
+                break  # event loop encerrado
+
+    def _check_workers(self):
+        """Reinicia processos que morreram e falha os jobs que estavam com eles"""
+        if not self._started:
+            return  # encerrando: processos saindo não são reiniciados
+        for index, process in enumerate(self._processes):
+            if process.is_alive():
+                continue
+            print(f"💥 [SCRAPING-WORKERS] Processo #{index} morreu (exit {process.exitcode}), reiniciando...")
+            for job_id in list(self._pending[index]):
+                self._resolve(job_id, False, f"Processo de scraping #{index} encerrou inesperadamente")
+            self.stats["worker_restarts"] += 1
+            self._spawn(index)
+
+    def _route(self, key: Optional[str]) -> int:
+        """Escolhe o processo do job respeitando o limite de fila (backpressure)"""
+        def least_loaded():
+            return min(range(self.workers), key=lambda i: len(self._pending[i]))
+
+        if self.routing == "match_hash" and key:
+            # Mesma partida sempre no mesmo processo (abas/caches aquecidos)
+            index = zlib.crc32(key.encode('utf-8')) % self.workers
+        elif self.routing == "round_robin":
+            index = next(self._round_robin) % self.workers
+        else:
+            index = least_loaded()
+
+        if len(self._pending[index]) >= self.max_pending:
+            index = least_loaded()
+        if len(self._pending[index]) >= self.max_pending:
+            self.stats["rejected_backpressure"] += 1
+            raise WorkerPoolFullError(
+                f"Processos de scraping ocupados ({self.workers * self.max_pending} jobs na fila)"
+            )
+        return index
+
+    async def submit(self, kind: str, *args, key: Optional[str] = None) -> Any:
+        """Envia um job para um processo e aguarda o resultado"""
+        if not self._started:
+            raise WorkerPoolClosedError("Pool de processos de scraping não foi iniciado")
+        if kind not in JOB_HANDLERS:
+            raise ValueError(f"Job de scraping desconhecido: {kind}")
+
+        self._check_workers()
+        index = self._route(key)
+
+        job_id = next(self._job_ids)
+        future = self._loop.create_future()
+        self._futures[job_id] = future
+        self._job_worker[job_id] = index
+        self._pending[index].add(job_id)
+        self.stats["jobs_submitted"] += 1
+        self._job_queues[index].put((job_id, kind, args))
+
+        try:
+            return await asyncio.wait_for(future, timeout=self.job_timeout)
+        except asyncio.TimeoutError:
+            self.stats["jobs_timed_out"] += 1
+            self._futures.pop(job_id, None)
+            self._job_worker.pop(job_id, None)
+            self._pending[index].discard(job_id)
+            raise
+
+    def _join_processes(self):
+        for process in self._processes:
+            process.join(timeout=30)
+            if process.is_alive():
+                process.terminate()
+
+    async def stop(self):
+        """Pede o encerramento dos processos e aguarda terminarem (sem bloquear o event loop)"""
+        if not self._started:
+            return
+        self._started = False
+        print("🔄 [SCRAPING-WORKERS] Encerrando processos de scraping...")
+        for job_queue in self._job_queues:
+            try:
+                job_queue.put(None)
+            except Exception:
+                pass
+        await asyncio.get_running_loop().run_in_executor(None, self._join_processes)
+        try:
+            self._result_queue.put(None)
+        except Exception:
+            pass
+        for future in self._futures.values():
+            if not future.done():
+                future.set_exception(WorkerPoolClosedError("Pool de processos de scraping encerrado"))
+        self._futures.clear()
+        print("✅ [SCRAPING-WORKERS] Processos encerrados")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "running": self._started,
+            "workers": self.workers,
+            "concurrency_per_worker": self.concurrency,
+            "routing": self.routing,
+            "max_pending": self.max_pending,
+            "pending": [len(pending) for pending in self._pending],
+            "alive": [process.is_alive() for process in self._processes],
+            **self.stats
+        }
@@ -3,7 +3,9 @@ Serviços de Coleta e Análise de Dados
 Adaptação dos scripts existentes para uso em API
 """
 
+import os
 import json
+import time
 import asyncio
 import re
 from datetime import datetime
@@ -15,8 +17,21 @@ from playwright.async_api import async_playwright
 # Importar classes existentes
 from important_scripts.get_game_info import SofaScoreLiveCollector
 from important_scripts.simplify_match_data import MatchDataSimplifier
+from important_scripts.api_fetcher import fetch_json
 # from important_scripts.agent_assitant import TechnicalAssistant
 from database_service import DatabaseService
+from browser_pool import BROWSER_ARGS, browser_context, browser_page
+from resource_blocking import apply_blocking_profile
+from wait_strategies import ResponseTracker, readiness_waiter
+from consent_state import consent_store
+from browser_supervisor import is_browser_crash, retry_on_browser_crash
+from xhr_capture import MatchResponseCapture, is_capture_sufficient, to_match_data
+from page_extractors import run_extractor
+from match_text_parser import parse_match_text, parse_containers, clean_match_details
+from team_index import team_index, team_key, PLACEHOLDER_TEAM_KEYS, TEAM_SOURCE_PAGE, TEAM_SOURCE_URL, TEAM_SOURCE_PLACEHOLDER
+from match_parse_cache import match_parse_cache
+from incremental_simplifier import incremental_simplifier
+from executors import executors
 
 # Importar TechnicalAssistant com tratamento especial devido ao nome do arquivo
 try:
@@ -32,6 +47,25 @@ except Exception as e:
     print(f"⚠️ Erro ao importar TechnicalAssistant: {e}")
     TechnicalAssistant = None
 
+# Perfil do pool de abas usado nas páginas de partida (screenshot e análise)
+MATCH_PAGE_PROFILE = "match_page"
+
+# Script para mascarar automação (baseado no teste bem-sucedido)
+STEALTH_INIT_SCRIPT = """
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined,
+    });
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => [1, 2, 3, 4, 5],
+    });
+    Object.defineProperty(navigator, 'languages', {
+        get: () => ['pt-BR', 'pt', 'en'],
+    });
+    window.chrome = {
+        runtime: {}
+    };
+"""
+
 class MatchDataService:
     """Serviço principal para coleta e processamento de dados de partidas"""
     
@@ -214,36 +248,45 @@ class MatchDataService:
 class SofaScoreLiveCollectorAPI(SofaScoreLiveCollector):
     """Versão adaptada do coletor para uso em API"""
     
-    def __init__(self):
+    def __init__(self, browser_pool=None):
         super().__init__()
         # Remover inicialização do assistente para evitar conflitos
         self.assistant = None
+        self.browser_pool = browser_pool
+        # Fan-out por partida: quantos endpoints em paralelo e prazo individual de cada um
+        self.max_concurrent_endpoints = int(os.getenv('API_MAX_CONCURRENT_ENDPOINTS', '6'))
+        self.endpoint_deadline = float(os.getenv('API_ENDPOINT_DEADLINE', '15'))
+    
+    def get_context_options(self) -> Dict[str, Any]:
+        """Configurações do contexto otimizadas baseadas no teste bem-sucedido"""
+        return {
+            'viewport': {'width': 1920, 'height': 1080},
+            'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            'extra_http_headers': {
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
+                'Accept-Language': 'pt-BR,pt;q=0.9,en;q=0.8',
+                'Accept-Encoding': 'gzip, deflate, br',
+                'Cache-Control': 'no-cache',
+                'Pragma': 'no-cache',
+                'Sec-Ch-Ua': '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
+                'Sec-Ch-Ua-Mobile': '?0',
+                'Sec-Ch-Ua-Platform': '"Windows"',
+                'Sec-Fetch-Dest': 'document',
+                'Sec-Fetch-Mode': 'navigate',
+                'Sec-Fetch-Site': 'none',
+                'Sec-Fetch-User': '?1',
+                'Upgrade-Insecure-Requests': '1'
+            },
+            'ignore_https_errors': True,
+            'java_script_enabled': True
+        }
     
     async def create_browser_context(self, playwright):
         """Cria contexto do navegador otimizado baseado nos testes bem-sucedidos"""
         print(f"🔧 Configurando navegador com configurações otimizadas...")
         
         # Argumentos otimizados baseados no teste que funcionou 100%
-        browser_args = [
-            '--no-sandbox',
-            '--disable-setuid-sandbox',
-            '--disable-dev-shm-usage',
-            '--disable-gpu',
-            '--disable-extensions',
-            '--disable-blink-features=AutomationControlled',
-            '--disable-web-security',
-            '--disable-features=VizDisplayCompositor',
-            '--disable-background-timer-throttling',
-            '--disable-backgrounding-occluded-windows',
-            '--disable-renderer-backgrounding',
-            '--disable-field-trial-config',
-            '--disable-ipc-flooding-protection',
-            '--no-first-run',
-            '--no-default-browser-check',
-            '--no-pings',
-            '--password-store=basic',
-            '--use-mock-keychain'
-        ]
+        browser_args = list(BROWSER_ARGS)
         
         print(f"🚀 Iniciando navegador Chromium com {len(browser_args)} argumentos anti-detecção...")
         
@@ -251,35 +294,12 @@ class SofaScoreLiveCollectorAPI(SofaScoreLiveCollector):
             browser = await playwright.chromium.launch(
                 headless=True,
                 args=browser_args,
-                # Configurações otimizadas baseadas no teste
-                slow_mo=100,  # Reduzido para 100ms (era 500ms)
                 timeout=30000  # Reduzido para 30s (era 60s)
             )
             
             print(f"✅ Navegador iniciado com sucesso")
             
-            # Configurações do contexto otimizadas baseadas no teste bem-sucedido
-            context_options = {
-                'viewport': {'width': 1920, 'height': 1080},
-                'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'extra_http_headers': {
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-                    'Accept-Language': 'pt-BR,pt;q=0.9,en;q=0.8',
-                    'Accept-Encoding': 'gzip, deflate, br',
-                    'Cache-Control': 'no-cache',
-                    'Pragma': 'no-cache',
-                    'Sec-Ch-Ua': '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
-                    'Sec-Ch-Ua-Mobile': '?0',
-                    'Sec-Ch-Ua-Platform': '"Windows"',
-                    'Sec-Fetch-Dest': 'document',
-                    'Sec-Fetch-Mode': 'navigate',
-                    'Sec-Fetch-Site': 'none',
-                    'Sec-Fetch-User': '?1',
-                    'Upgrade-Insecure-Requests': '1'
-                },
-                'ignore_https_errors': True,
-                'java_script_enabled': True
-            }
+            context_options = self.get_context_options()
             
             print(f"🌐 Criando contexto do navegador...")
             context = await browser.new_context(**context_options)
@@ -289,20 +309,7 @@ class SofaScoreLiveCollectorAPI(SofaScoreLiveCollector):
             context.set_default_navigation_timeout(30000)  # 30 segundos
             
             # Adicionar scripts para mascarar automação (baseados no teste bem-sucedido)
-            await context.add_init_script("""
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined,
-                });
-                Object.defineProperty(navigator, 'plugins', {
-                    get: () => [1, 2, 3, 4, 5],
-                });
-                Object.defineProperty(navigator, 'languages', {
-                    get: () => ['pt-BR', 'pt', 'en'],
-                });
-                window.chrome = {
-                    runtime: {}
-                };
-            """)
+            await context.add_init_script(STEALTH_INIT_SCRIPT)
             
             print(f"✅ Contexto criado com configurações anti-detecção")
             
@@ -317,69 +324,29 @@ class SofaScoreLiveCollectorAPI(SofaScoreLiveCollector):
             print(f"   - Verificar se SHM está configurado no docker-compose (shm_size: 2gb)")
             raise e
 
-    async def fetch_api_data(self, page, endpoint):
-        """Função auxiliar otimizada para buscar dados de API endpoint"""
-        endpoint_name = endpoint.split('/')[-1] or endpoint.split('/')[-2]
+    async def fetch_api_data(self, context, endpoint):
+        """Busca o JSON do endpoint direto pelo APIRequestContext (sem renderizar página)"""
+        print(f"🔗 Acessando endpoint: {endpoint}")
+        return await fetch_json(context, endpoint, timeout=20000, max_retries=2)
+    
+    async def fetch_endpoints_concurrently(self, context, endpoints: Dict[str, str]) -> Dict[str, Any]:
+        """Busca vários endpoints em paralelo com fan-out limitado e prazo por endpoint"""
+        semaphore = asyncio.Semaphore(self.max_concurrent_endpoints)
         
-        try:
-            print(f"🔗 Acessando endpoint: {endpoint}")
-            
-            # Configurar retry otimizado (baseado no teste que funcionou)
-            max_retries = 2  # Reduzido de 3 para 2
-            for attempt in range(max_retries):
+        async def fetch_endpoint(name, endpoint):
+            async with semaphore:
                 try:
-                    print(f"🚀 Tentativa {attempt + 1}/{max_retries} - {endpoint_name}")
-                    
-                    response = await page.goto(
-                        endpoint, 
-                        wait_until='domcontentloaded',  # Comprovadamente mais rápido
-                        timeout=20000  # Reduzido de 30s para 20s baseado no teste
+                    return name, await asyncio.wait_for(
+                        self.fetch_api_data(context, endpoint), timeout=self.endpoint_deadline
                     )
-                    
-                    print(f"📡 Resposta recebida - Status: {response.status}, URL: {response.url}")
-                    
-                    if response.status == 200:
-                        content = await page.content()
-                        content_length = len(content)
-                        print(f"📄 Conteúdo recebido - Tamanho: {content_length} caracteres")
-                        
-                        json_start = content.find('{')
-                        json_end = content.rfind('}') + 1
-                        
-                        if json_start != -1 and json_end > json_start:
-                            json_content = content[json_start:json_end]
-                            json_data = json.loads(json_content)
-                            print(f"✅ JSON válido extraído - {endpoint_name} - Chaves: {list(json_data.keys())[:5]}")
-                            return json_data
-                        else:
-                            print(f"⚠️ Não foi possível extrair JSON válido do conteúdo - {endpoint_name}")
-                            print(f"📋 Primeiros 200 caracteres: {content[:200]}")
-                    else:
-                        print(f"❌ Status HTTP inválido: {response.status} - {endpoint_name}")
-                        print(f"📝 Headers da resposta: {dict(response.headers)}")
-                    
-                    if attempt < max_retries - 1:
-                        print(f"⚠️ Tentativa {attempt + 1} falhou para {endpoint_name}, tentando novamente em 1s...")
-                        await asyncio.sleep(1)  # Reduzido de 2s para 1s baseado no teste
-                    
-                except Exception as retry_error:
-                    error_type = type(retry_error).__name__
-                    print(f"❌ Erro na tentativa {attempt + 1} para {endpoint_name}: {error_type} - {str(retry_error)}")
-                    
-                    if attempt < max_retries - 1:
-                        print(f"🔄 Reentando em 1s... ({attempt + 2}/{max_retries})")
-                        await asyncio.sleep(1)
-                    else:
-                        print(f"💥 Todas as tentativas falharam para {endpoint_name}")
-                        raise retry_error
-            
-            print(f"❌ Falha definitiva em todas as tentativas para {endpoint_name}")
-            return None
-            
-        except Exception as e:
-            error_type = type(e).__name__
-            print(f"❌ Erro crítico ao buscar {endpoint_name}: {error_type} - {str(e)}")
-            return None
+                except asyncio.TimeoutError:
+                    print(f"⏰ Prazo de {self.endpoint_deadline}s esgotado para {name}")
+                except Exception as e:
+                    print(f"❌ Erro ao buscar {name}: {type(e).__name__} - {str(e)}")
+                return name, None
+        
+        results = await asyncio.gather(*[fetch_endpoint(name, endpoint) for name, endpoint in endpoints.items()])
+        return dict(results)
     
     async def get_live_match_data_api(self, match_id: str) -> Optional[Dict[str, Any]]:
         """Versão adaptada para API que retorna apenas os dados sem salvar arquivos"""
@@ -396,14 +363,10 @@ class SofaScoreLiveCollectorAPI(SofaScoreLiveCollector):
         import platform
         
         try:
-            print(f"🚀 Iniciando Playwright para coleta de dados...")
-            async with async_playwright() as playwright:
-                print(f"📱 Criando contexto do navegador...")
-                browser, context = await self.create_browser_context(playwright)
-                page = await context.new_page()
-                
-                # Navegador iniciado com sucesso
-                
+            print(f"📱 Criando contexto do navegador...")
+            async with browser_context(self.browser_pool, self.create_browser_context,
+                                       init_script=STEALTH_INIT_SCRIPT, default_timeout=30000,
+                                       **self.get_context_options()) as context:
                 try:
                     print(f"🔄 Coletando dados da partida {match_id}...")
                     
@@ -411,8 +374,20 @@ class SofaScoreLiveCollectorAPI(SofaScoreLiveCollector):
                     timestamp = datetime.now().isoformat()
                     collected_types = []
                     
+                    # Buscar todos os endpoints em paralelo (latência ~ endpoint mais lento)
+                    started = time.perf_counter()
+                    results = await self.fetch_endpoints_concurrently(context, {
+                        "basic_info": f"{self.base_url}event/{match_id}",
+                        "statistics": f"{self.base_url}event/{match_id}/statistics",
+                        "timeline": f"{self.base_url}event/{match_id}/incidents",
+                        "lineups": f"{self.base_url}event/{match_id}/lineups",
+                        "shotmap": f"{self.base_url}event/{match_id}/shotmap",
+                        "player_statistics": f"{self.base_url}event/{match_id}/player-statistics"
+                    })
+                    elapsed = time.perf_counter() - started
+                    
                     # 1. Informações básicas
-                    basic_info = await self.fetch_api_data(page, f"{self.base_url}event/{match_id}")
+                    basic_info = results["basic_info"]
                     if basic_info:
                         match_data['basic_info'] = {
                             'homeTeam': basic_info.get('event', {}).get('homeTeam', {}),
@@ -420,6 +395,7 @@ class SofaScoreLiveCollectorAPI(SofaScoreLiveCollector):
                             'homeScore': basic_info.get('event', {}).get('homeScore', {}),
                             'awayScore': basic_info.get('event', {}).get('awayScore', {}),
                             'status': basic_info.get('event', {}).get('status', {}),
+                            'time': basic_info.get('event', {}).get('time', {}),
                             'startTimestamp': basic_info.get('event', {}).get('startTimestamp'),
                             'tournament': basic_info.get('event', {}).get('tournament', {}),
                             'season': basic_info.get('event', {}).get('season', {})
@@ -432,19 +408,19 @@ class SofaScoreLiveCollectorAPI(SofaScoreLiveCollector):
                         print("❌ Falha ao obter informações básicas")
                     
                     # 2. Estatísticas
-                    stats = await self.fetch_api_data(page, f"{self.base_url}event/{match_id}/statistics")
+                    stats = results["statistics"]
                     if stats:
                         match_data['statistics'] = stats.get('statistics', [])
                         collected_types.append("statistics")
                     
                     # 3. Timeline
-                    timeline = await self.fetch_api_data(page, f"{self.base_url}event/{match_id}/incidents")
+                    timeline = results["timeline"]
                     if timeline:
                         match_data['timeline'] = timeline.get('incidents', [])
                         collected_types.append("timeline")
                     
                     # 4. Lineups
-                    lineups = await self.fetch_api_data(page, f"{self.base_url}event/{match_id}/lineups")
+                    lineups = results["lineups"]
                     if lineups:
                         match_data['lineups'] = {
                             'home': lineups.get('home', {}),
@@ -453,13 +429,13 @@ class SofaScoreLiveCollectorAPI(SofaScoreLiveCollector):
                         collected_types.append("lineups")
                     
                     # 5. Shotmap
-                    shotmap = await self.fetch_api_data(page, f"{self.base_url}event/{match_id}/shotmap")
+                    shotmap = results["shotmap"]
                     if shotmap:
                         match_data['shotmap'] = shotmap.get('shotmap', [])
                         collected_types.append("shotmap")
                     
                     # 6. Player statistics
-                    player_stats = await self.fetch_api_data(page, f"{self.base_url}event/{match_id}/player-statistics")
+                    player_stats = results["player_statistics"]
                     if player_stats:
                         match_data['player_statistics'] = player_stats
                         collected_types.append("player_statistics")
@@ -470,10 +446,11 @@ class SofaScoreLiveCollectorAPI(SofaScoreLiveCollector):
                         'match_id': match_id,
                         'collector_version': '2.0-api',
                         'collected_types': collected_types,
-                        'total_types': len(collected_types)
+                        'total_types': len(collected_types),
+                        'collection_seconds': round(elapsed, 3)
                     }
                     
-                    print(f"✅ Dados coletados: {len(collected_types)} tipos ({', '.join(collected_types)})")
+                    print(f"✅ Dados coletados: {len(collected_types)} tipos ({', '.join(collected_types)}) em {elapsed:.2f}s")
                     
                     if len(collected_types) == 0:
                         print("⚠️ Nenhum dado foi coletado")
@@ -485,10 +462,6 @@ class SofaScoreLiveCollectorAPI(SofaScoreLiveCollector):
                 except Exception as e:
                     print(f"❌ Erro na coleta: {str(e)}")
                     return None
-                    
-                finally:
-                    print(f"🔒 Fechando navegador...")
-                    await browser.close()
         
         except Exception as e:
             print(f"❌ Erro crítico do Playwright: {str(e)}")
@@ -575,54 +548,48 @@ class MatchDataSimplifierAPI(MatchDataSimplifier):
     def simplify_raw_data(self, raw_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Simplifica dados em memória sem usar arquivos"""
         try:
-            # Extrair informações básicas
-            basic_info = raw_data.get("basic_info", {})
-            
-            simplified_data = {
-                "match_summary": {
-                    "home_team": basic_info.get("homeTeam", {}).get("name", ""),
-                    "away_team": basic_info.get("awayTeam", {}).get("name", ""),
-                    "score": {
-                        "home": basic_info.get("homeScore", {}).get("current", 0),
-                        "away": basic_info.get("awayScore", {}).get("current", 0)
-                    },
-                    "status": basic_info.get("status", {}).get("description", ""),
-                    "tournament": basic_info.get("tournament", {}).get("name", ""),
-                    "managers": {
-                        "home": basic_info.get("homeTeam", {}).get("manager", {}).get("name", ""),
-                        "away": basic_info.get("awayTeam", {}).get("manager", {}).get("name", "")
-                    }
-                },
-                
-                "key_statistics": self.extract_key_statistics(raw_data.get("statistics", [])),
-                
-                "events_timeline": self.extract_goals_and_events(raw_data.get("timeline", [])),
-                
-                "tactical_setup": self.extract_formations_and_lineups(raw_data.get("lineups", {})),
-                
-                "shooting_analysis": self.extract_shot_analysis(raw_data.get("shotmap", [])),
-                
-                "collection_info": {
-                    "collected_at": raw_data.get("metadata", {}).get("collected_at", ""),
-                    "match_id": raw_data.get("metadata", {}).get("match_id", "")
-                }
-            }
-            
-            return simplified_data
+            return self.simplify_snapshot(raw_data)
             
         except Exception as e:
             print(f"❌ Erro na simplificação: {e}")
             return None 
 
+# Executado uma vez na página: devolve href, texto e textos dos spans de todos os containers de partidas
+CONTAINER_PAYLOAD_SCRIPT = """(anchors) => anchors.map(anchor => ({
+    href: anchor.getAttribute('href'),
+    text: anchor.textContent,
+    spans: Array.from(anchor.querySelectorAll('span'), span => (span.textContent || '').trim())
+        .filter(text => text.length > 2)
+}))"""
+
 class SofaScoreLinksService:
     """Serviço para coleta de links do SofaScore"""
     
-    def __init__(self):
+    def __init__(self, browser_pool=None):
         print("🔧 [LINKS-SERVICE] Inicializando SofaScoreLinksService...")
         self.website_url = "https://www.sofascore.com/"
         self.database = DatabaseService()
+        self.browser_pool = browser_pool
         print("✅ [LINKS-SERVICE] SofaScoreLinksService inicializado com sucesso!")
     
+    def get_context_options(self) -> Dict[str, Any]:
+        """Configurações realistas do contexto do navegador"""
+        return {
+            'viewport': {'width': 1920, 'height': 1080},
+            'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            'locale': 'pt-BR',
+            'timezone_id': 'America/Sao_Paulo',
+            'extra_http_headers': {
+                'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
+                'Accept-Encoding': 'gzip, deflate, br',
+                'DNT': '1',
+                'Connection': 'keep-alive',
+                'Upgrade-Insecure-Requests': '1'
+            },
+            # Estado pós-consentimento compartilhado (evita o banner de cookies)
+            **consent_store.context_options()
+        }
+    
     async def create_browser_context(self, playwright):
         """Cria contexto do navegador com configurações realistas"""
         print("🚀 [BROWSER-CONTEXT] Iniciando criação do contexto do navegador...")
@@ -645,19 +612,7 @@ class SofaScoreLinksService:
             raise
         
         try:
-            context = await browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                locale='pt-BR',
-                timezone_id='America/Sao_Paulo',
-                extra_http_headers={
-                    'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
-                    'Accept-Encoding': 'gzip, deflate, br',
-                    'DNT': '1',
-                    'Connection': 'keep-alive',
-                    'Upgrade-Insecure-Requests': '1'
-                }
-            )
+            context = await browser.new_context(**self.get_context_options())
             print("✅ [BROWSER-CONTEXT] Contexto do navegador criado com sucesso!")
         except Exception as e:
             print(f"❌ [BROWSER-CONTEXT] Erro ao criar contexto: {type(e).__name__}: {str(e)}")
@@ -666,16 +621,17 @@ class SofaScoreLinksService:
         
         return browser, context
     
+    @retry_on_browser_crash("Erro na coleta de links")
     async def collect_and_filter_links(self) -> Dict[str, Any]:
         """Acessa a página inicial do SofaScore e coleta todos os links"""
         print("🚀 [LINKS-SERVICE] Iniciando collect_and_filter_links()")
         
         try:
-            print("🎭 [LINKS-SERVICE] Inicializando Playwright...")
-            async with async_playwright() as playwright:
-                print("🌐 [LINKS-SERVICE] Criando contexto do navegador...")
-                browser, context = await self.create_browser_context(playwright)
+            print("🌐 [LINKS-SERVICE] Criando contexto do navegador...")
+            async with browser_context(self.browser_pool, self.create_browser_context,
+                                       **self.get_context_options()) as context:
                 page = await context.new_page()
+                await apply_blocking_profile(page, "homepage")
                 
                 try:
                     print("🔄 [LINKS-SERVICE] Acessando página inicial do SofaScore...")
@@ -698,73 +654,91 @@ class SofaScoreLinksService:
                     
                     print("✅ [LINKS-SERVICE] Página inicial carregada com sucesso!")
                     
-                    # Aguardar carregamento completo
-                    print("⏳ [LINKS-SERVICE] Aguardando carregamento completo (3s)...")
-                    await asyncio.sleep(3)
+                    # Aguardar os containers de partidas (antes: 3s fixos)
+                    print("⏳ [LINKS-SERVICE] Aguardando containers de partidas...")
+                    await readiness_waiter.wait_for(page, "homepage_matches")
                     
-                    # Aceitar cookies se aparecer o banner
-                    try:
-                        cookie_button = page.locator('button:has-text("Accept"), button:has-text("Aceitar"), [data-testid="cookie-accept"]')
-                        if await cookie_button.count() > 0:
-                            await cookie_button.first.click()
-                            print("🍪 Cookies aceitos")
-                            await asyncio.sleep(1)
-                    except:
-                        pass  # Ignorar se não houver banner de cookies
+                    # Aceitar cookies só se o banner voltar (estado de consentimento é carregado no contexto)
+                    await consent_store.handle_banner(page, fallback_delay=1.0)
                     
                     print("🔍 Coletando todos os links da página...")
                     
                     # Buscar especificamente elementos de partida com informações detalhadas
                     print("🔍 [LINKS-SERVICE] Buscando elementos de partidas de futebol...")
-                    match_containers = await page.locator('a[href*="/football/match/"]').all()
+                    # Uma única ida ao navegador: href, texto e spans de todos os containers
+                    match_containers = await page.eval_on_selector_all(
+                        'a[href*="/football/match/"]', CONTAINER_PAYLOAD_SCRIPT
+                    )
                     print(f"📊 [LINKS-SERVICE] Encontrados {len(match_containers)} containers de partidas")
                     
-                    detailed_matches = []
+                    # Times gravados em match_info desde a coleta anterior entram no índice de nomes
+                    await team_index.refresh(self.database)
+                    
+                    # 1ª passada: filtrar links e reaproveitar containers idênticos aos da coleta anterior
+                    slots = []  # resultado do cache ou (href, url, texto) a analisar, na ordem da página
+                    pending = []
                     processed_count = 0
-                    valid_matches_count = 0
                     
                     for match_container in match_containers:
-                        try:
-                            processed_count += 1
-                            
-                            # Extrair href e informações básicas
-                            href = await match_container.get_attribute('href')
-                            
-                            if not href or '/football/' not in href:
-                                continue
-                                
-                            # Converter para URL completa
-                            if href.startswith('/'):
-                                full_url = f"https://www.sofascore.com{href}"
-                            else:
-                                full_url = href
-                            
-                            # Extrair informações detalhadas da partida
-                            match_details = await self.extract_match_details_from_container(match_container)
-                            
-                            # VALIDAÇÃO CRÍTICA: Ignorar partidas sem nomes de times identificados
-                            if (match_details.get("home_team") == "N/A" or 
-                                match_details.get("away_team") == "N/A" or
-                                not match_details.get("home_team") or 
-                                not match_details.get("away_team")):
-                                continue
-                            
-                            # Validar e limpar os dados extraídos
-                            match_details = self.validate_and_clean_match_data(match_details)
-                            
-                            # Adicionar informações básicas
-                            match_details.update({
-                                "url": full_url
-                            })
-                            
-                            detailed_matches.append(match_details)
-                            valid_matches_count += 1
+                        processed_count += 1
+                        
+                        # Extrair href e informações básicas
+                        href = match_container.get("href")
+                        
+                        if not href or '/football/' not in href:
+                            continue
                             
-                        except Exception as e:
-                            print(f"❌ [LINKS-SERVICE] Erro ao processar container {processed_count}: {type(e).__name__}: {str(e)}")
+                        # Converter para URL completa
+                        if href.startswith('/'):
+                            full_url = f"https://www.sofascore.com{href}"
+                        else:
+                            full_url = href
+                        
+                        container_text = match_container.get("text")
+                        cached_details = match_parse_cache.get(href, container_text)
+                        if cached_details is not None:
+                            slots.append(cached_details)
+                        else:
+                            slots.append((href, full_url, container_text))
+                            pending.append((container_text, match_container.get("spans", [])))
+                    
+                    # 2ª passada: analisar os containers restantes em lote no pool de processos
+                    parsed_details = []
+                    if pending:
+                        parsed_details, index_stats = await executors.run_cpu(
+                            parse_containers, pending, team_index, name="parse_containers"
+                        )
+                        if index_stats:
+                            team_index.stats.update(index_stats)
+                    parsed_iter = iter(parsed_details)
+                    
+                    detailed_matches = []
+                    for slot in slots:
+                        if isinstance(slot, dict):
+                            detailed_matches.append(slot)
                             continue
+                        
+                        href, full_url, container_text = slot
+                        match_details = next(parsed_iter)
+                        
+                        # VALIDAÇÃO CRÍTICA: Ignorar partidas sem nomes de times identificados
+                        if (match_details.get("home_team") == "N/A" or 
+                            match_details.get("away_team") == "N/A" or
+                            not match_details.get("home_team") or 
+                            not match_details.get("away_team")):
+                            print(f"❌ [EXTRACT] Nenhum formato reconhecido para: '{(container_text or '').strip()}'")
+                            continue
+                        
+                        # Adicionar informações básicas
+                        match_details.update({
+                            "url": full_url
+                        })
+                        match_parse_cache.put(href, container_text, match_details)
+                        detailed_matches.append(match_details)
                     
-                    print(f"⚽ Processados {processed_count} containers, {valid_matches_count} partidas válidas extraídas")
+                    valid_matches_count = len(detailed_matches)
+                    print(f"⚽ Processados {processed_count} containers, {valid_matches_count} partidas válidas extraídas "
+                          f"(cache: {match_parse_cache.stats['hits']} hits / {match_parse_cache.stats['misses']} misses acumulados)")
                     
                     # Salvar no banco de dados
                     if detailed_matches:
@@ -797,6 +771,8 @@ class SofaScoreLinksService:
                     }
                     
                 except Exception as e:
+                    if is_browser_crash(e):
+                        raise
                     print(f"❌ [LINKS-SERVICE] Erro interno durante coleta: {type(e).__name__}: {str(e)}")
                     import traceback
                     print(f"📋 [LINKS-SERVICE] Traceback: {traceback.format_exc()}")
@@ -807,11 +783,9 @@ class SofaScoreLinksService:
                         "timestamp": datetime.now()
                     }
                     
-                finally:
-                    print("🔄 [LINKS-SERVICE] Fechando navegador...")
-                    await browser.close()
-                    
         except Exception as e:
+            if is_browser_crash(e):
+                raise
             print(f"💥 [LINKS-SERVICE] Erro crítico na inicialização do Playwright: {type(e).__name__}: {str(e)}")
             import traceback
             print(f"📋 [LINKS-SERVICE] Traceback completo: {traceback.format_exc()}")
@@ -834,632 +808,21 @@ class SofaScoreLinksService:
     
 
     
-    async def extract_match_details_from_container(self, match_container):
-        """Extrai informações detalhadas de uma partida do container HTML - VERSÃO MELHORADA PARA DEPLOY"""
-        
-        match_details = {
-            "home_team": "N/A",
-            "away_team": "N/A", 
-            "home_score": "N/A",
-            "away_score": "N/A",
-            "match_time": "N/A",
-            "match_status": "N/A"
-        }
-        
-        try:
-            # 1. PRIMEIRO: Tentar extrair do texto simples (mais confiável no deploy)
-            container_text = await match_container.text_content()
-            
-            if container_text:
-                clean_text = container_text.strip()
-                print(f"📝 [EXTRACT] Analisando texto: '{clean_text}'")
-                
-                # NOVO PADRÃO 1: Partidas finalizadas com pontuação específica
-                # Exemplo: "19:30F2°TVolta RedondaAvaí1111" ou "F2°TVolta RedondaAvaí1111"
-                print(f"🔍 [EXTRACT] Testando PADRÃO FINALIZADO MELHORADO...")
-                finished_patterns = [
-                    r'(\d{1,2}:\d{2})?F\d+[°º]?T(.+?)(\d)(\d)(\d)(\d)$',  # Com horário
-                    r'F\d+[°º]?T(.+?)(\d)(\d)(\d)(\d)$',  # Sem horário
-                    r'(\d{1,2}:\d{2})?FT(.+?)(\d)(\d)(\d)(\d)$',  # FT simples
-                    r'FT(.+?)(\d)(\d)(\d)(\d)$'  # FT sem horário
-                ]
-                
-                for i, pattern in enumerate(finished_patterns):
-                    finished_match = re.search(pattern, clean_text)
-                    if finished_match:
-                        print(f"✅ [EXTRACT] PADRÃO FINALIZADO {i+1} encontrado!")
-                        
-                        if len(finished_match.groups()) == 5:  # Com horário
-                            time_str = finished_match.group(1) or "FT"
-                            teams_str = finished_match.group(2)
-                            scores = finished_match.group(3) + finished_match.group(4) + finished_match.group(5) + finished_match.group(6)
-                        else:  # Sem horário
-                            time_str = "FT"
-                            teams_str = finished_match.group(1)
-                            scores = finished_match.group(2) + finished_match.group(3) + finished_match.group(4) + finished_match.group(5)
-                        
-                        print(f"🔍 [EXTRACT] Time: {time_str}, Teams: '{teams_str}', Scores: {scores}")
-                        
-                        if len(scores) == 4:
-                            home_score = scores[0]
-                            away_score = scores[1]
-                            
-                            teams_split = self._split_team_names(teams_str)
-                            if teams_split:
-                                home_team, away_team = teams_split
-                                match_details.update({
-                                    "home_team": home_team,
-                                    "away_team": away_team,
-                                    "home_score": home_score,
-                                    "away_score": away_score,
-                                    "match_time": "FT",
-                                    "match_status": "finished"
-                                })
-                                print(f"🏁 FINISHED: {home_team} {home_score}-{away_score} {away_team} (FT)")
-                                return match_details
-                        break
-                
-                # NOVO PADRÃO 2: Partidas ao vivo melhoradas
-                # Exemplo: "22:0024'MonterreyInter0000" ou "24'MonterreyInter0000"
-                print(f"🔍 [EXTRACT] Testando PADRÃO AO VIVO MELHORADO...")
-                live_patterns = [
-                    r'(\d{1,2}:\d{2})(\d+)\'(.+?)(\d)(\d)(\d)(\d)$',  # Com horário inicial
-                    r'(\d+)\'(.+?)(\d)(\d)(\d)(\d)$',  # Apenas minuto
-                    r'(\d{1,2}:\d{2})(\d+)\"(.+?)(\d)(\d)(\d)(\d)$',  # Com aspas duplas
-                    r'(\d+)\"(.+?)(\d)(\d)(\d)(\d)$'  # Apenas minuto com aspas duplas
-                ]
-                
-                for i, pattern in enumerate(live_patterns):
-                    live_match = re.search(pattern, clean_text)
-                    if live_match:
-                        print(f"✅ [EXTRACT] PADRÃO AO VIVO {i+1} encontrado!")
-                        
-                        if len(live_match.groups()) == 6:  # Com horário inicial
-                            time_str = live_match.group(1)
-                            minute = live_match.group(2)
-                            teams_str = live_match.group(3)
-                            scores = live_match.group(4) + live_match.group(5) + live_match.group(6) + live_match.group(7)
-                        else:  # Apenas minuto
-                            time_str = "Live"
-                            minute = live_match.group(1)
-                            teams_str = live_match.group(2)
-                            scores = live_match.group(3) + live_match.group(4) + live_match.group(5) + live_match.group(6)
-                        
-                        print(f"🔍 [EXTRACT] Time: {time_str}, Minute: {minute}, Teams: '{teams_str}', Scores: {scores}")
-                        
-                        if len(scores) == 4:
-                            home_score = scores[0]
-                            away_score = scores[1]
-                            
-                            teams_split = self._split_team_names(teams_str)
-                            if teams_split:
-                                home_team, away_team = teams_split
-                                match_details.update({
-                                    "home_team": home_team,
-                                    "away_team": away_team,
-                                    "home_score": home_score,
-                                    "away_score": away_score,
-                                    "match_time": f"{minute}'",
-                                    "match_status": "in_progress"
-                                })
-                                print(f"🔴 LIVE: {home_team} {home_score}-{away_score} {away_team} ({minute}')")
-                                return match_details
-                        break
-                
-                # NOVO PADRÃO 3: Partidas com placar explícito
-                # Exemplo: "Fluminense 2 - 1 Botafogo" ou "Fluminense2-1Botafogo"
-                print(f"🔍 [EXTRACT] Testando PADRÃO PLACAR EXPLÍCITO...")
-                score_patterns = [
-                    r'(.+?)\s*(\d+)\s*-\s*(\d+)\s*(.+?)$',  # Com espaços
-                    r'(.+?)(\d+)-(\d+)(.+?)$',  # Sem espaços
-                    r'(.+?)\s*(\d+)\s*x\s*(\d+)\s*(.+?)$',  # Com x
-                    r'(.+?)(\d+)x(\d+)(.+?)$'  # x sem espaços
-                ]
-                
-                for i, pattern in enumerate(score_patterns):
-                    score_match = re.search(pattern, clean_text)
-                    if score_match:
-                        print(f"✅ [EXTRACT] PADRÃO PLACAR {i+1} encontrado!")
-                        
-                        home_team = score_match.group(1).strip()
-                        home_score = score_match.group(2)
-                        away_score = score_match.group(3)
-                        away_team = score_match.group(4).strip()
-                        
-                        print(f"🔍 [EXTRACT] Home: '{home_team}', Away: '{away_team}', Score: {home_score}-{away_score}")
-                        
-                        # Validar se são nomes válidos de times
-                        if len(home_team) >= 3 and len(away_team) >= 3:
-                            # Determinar status baseado no contexto
-                            status = "finished"
-                            if "ao vivo" in clean_text.lower() or "live" in clean_text.lower():
-                                status = "in_progress"
-                            elif "'" in clean_text or '"' in clean_text:
-                                status = "in_progress"
-                            
-                            match_details.update({
-                                "home_team": home_team,
-                                "away_team": away_team,
-                                "home_score": home_score,
-                                "away_score": away_score,
-                                "match_time": "FT" if status == "finished" else "Live",
-                                "match_status": status
-                            })
-                            print(f"⚽ SCORE: {home_team} {home_score}-{away_score} {away_team} ({status})")
-                            return match_details
-                        break
-                
-                # PADRÃO 4: Partidas agendadas melhoradas
-                # Exemplo: "23:30-CanadáHonduras" ou "23:30 Canadá x Honduras"
-                print(f"🔍 [EXTRACT] Testando PADRÃO AGENDADO MELHORADO...")
-                scheduled_patterns = [
-                    r'(\d{1,2}:\d{2})-(.+)$',  # Com hífen
-                    r'(\d{1,2}:\d{2})\s+(.+?)$',  # Com espaço
-                    r'(\d{1,2}:\d{2})\s*x\s*(.+?)$',  # Com x
-                    r'(\d{1,2}:\d{2})\s*vs\s*(.+?)$'  # Com vs
-                ]
-                
-                for i, pattern in enumerate(scheduled_patterns):
-                    scheduled_match = re.search(pattern, clean_text)
-                    if scheduled_match:
-                        print(f"✅ [EXTRACT] PADRÃO AGENDADO {i+1} encontrado!")
-                        
-                        time_str = scheduled_match.group(1)
-                        teams_str = scheduled_match.group(2)
-                        
-                        print(f"🔍 [EXTRACT] Time: {time_str}, Teams: '{teams_str}'")
-                        
-                        teams_split = self._split_team_names(teams_str)
-                        if teams_split:
-                            home_team, away_team = teams_split
-                            match_details.update({
-                                "home_team": home_team,
-                                "away_team": away_team,
-                                "match_time": time_str,
-                                "match_status": "scheduled"
-                            })
-                            print(f"📅 SCHEDULED: {home_team} vs {away_team} ({time_str})")
-                            return match_details
-                        break
-                
-                # PADRÃO 5: Formato simples "Time A vs Time B" ou "Time A - Time B"
-                print(f"🔍 [EXTRACT] Testando PADRÃO SIMPLES MELHORADO...")
-                simple_patterns = [
-                    r'^([A-Za-zÀ-ÿ\s\.]+)\s*-\s*([A-Za-zÀ-ÿ\s\.]+)$',  # Com hífen
-                    r'^([A-Za-zÀ-ÿ\s\.]+)\s*vs\s*([A-Za-zÀ-ÿ\s\.]+)$',  # Com vs
-                    r'^([A-Za-zÀ-ÿ\s\.]+)\s*x\s*([A-Za-zÀ-ÿ\s\.]+)$'  # Com x
-                ]
-                
-                for i, pattern in enumerate(simple_patterns):
-                    simple_match = re.search(pattern, clean_text, re.IGNORECASE)
-                    if simple_match:
-                        print(f"✅ [EXTRACT] PADRÃO SIMPLES {i+1} encontrado!")
-                        
-                        home_team = simple_match.group(1).strip()
-                        away_team = simple_match.group(2).strip()
-                        
-                        print(f"🔍 [EXTRACT] Home: '{home_team}', Away: '{away_team}'")
-                        
-                        # Validar se são nomes válidos de times
-                        if len(home_team) > 2 and len(away_team) > 2:
-                            match_details.update({
-                                "home_team": home_team,
-                                "away_team": away_team,
-                                "home_score": "0",
-                                "away_score": "0",
-                                "match_status": "not_started"
-                            })
-                            print(f"⏳ NOT_STARTED: {home_team} vs {away_team}")
-                            return match_details
-                        break
-                
-                # PADRÃO 6: Formato compacto sem separadores claros
-                # Exemplo: "FluminenseBotafogo" ou "PaysanduAvai"
-                print(f"🔍 [EXTRACT] Testando PADRÃO COMPACTO...")
-                if len(clean_text) > 6 and clean_text.isalpha():
-                    teams_split = self._split_team_names(clean_text)
-                    if teams_split:
-                        home_team, away_team = teams_split
-                        match_details.update({
-                            "home_team": home_team,
-                            "away_team": away_team,
-                            "home_score": "0",
-                            "away_score": "0",
-                            "match_status": "not_started"
-                        })
-                        print(f"🔤 COMPACT: {home_team} vs {away_team}")
-                        return match_details
-                
-                print(f"❌ [EXTRACT] Nenhum formato reconhecido para: '{clean_text}'")
-            
-            # 2. Se não conseguiu extrair do texto, tentar extrair do HTML
-            if match_details["home_team"] == "N/A":
-                print(f"🔍 [EXTRACT] Tentando extrair do HTML...")
-                container_html = await match_container.inner_html()
-                print(f"🔍 [DEBUG] HTML snippet: {container_html[:200]}...")
-                
-                # Tentar buscar elementos específicos dentro do container
-                try:
-                    # Procurar por spans com texto dos times
-                    spans = await match_container.locator('span').all()
-                    span_texts = []
-                    for span in spans:
-                        text = await span.text_content()
-                        if text and len(text.strip()) > 2:
-                            span_texts.append(text.strip())
-                    
-                    if len(span_texts) >= 2:
-                        print(f"🔍 [DEBUG] Textos encontrados nos spans: {span_texts[:5]}")
-                        
-                        # Tentar identificar times nos textos
-                        potential_teams = []
-                        for text in span_texts:
-                            if not any(char.isdigit() for char in text) and len(text) > 2:
-                                potential_teams.append(text)
-                        
-                        if len(potential_teams) >= 2:
-                            match_details.update({
-                                "home_team": potential_teams[0],
-                                "away_team": potential_teams[1],
-                                "home_score": "0",
-                                "away_score": "0",
-                                "match_status": "not_started"
-                            })
-                            print(f"📋 HTML_EXTRACT: {potential_teams[0]} vs {potential_teams[1]}")
-                            return match_details
-                
-                except Exception as html_error:
-                    print(f"⚠️ [DEBUG] Erro na extração HTML: {html_error}")
-            
-            return match_details
-            
-        except Exception as e:
-            print(f"❌ [EXTRACT] Erro: {type(e).__name__}: {str(e)}")
-            return match_details
-    
-    def _split_team_names(self, teams_str):
-        """Separa nomes de times de uma string compacta usando heurísticas melhoradas - VERSÃO DEPLOY"""
-        try:
-            # Remover espaços extras
-            teams_str = teams_str.strip()
-            print(f"🔍 [SPLIT] Tentando separar: '{teams_str}'")
-            
-            # ESTRATÉGIA 0: Casos já separados por espaços, hífen ou vs
-            if ' vs ' in teams_str.lower():
-                parts = teams_str.lower().split(' vs ')
-                if len(parts) == 2:
-                    result = [parts[0].strip().title(), parts[1].strip().title()]
-                    print(f"✅ [SPLIT] Estratégia 0 (vs): '{result[0]}' vs '{result[1]}'")
-                    return result
-            
-            if ' - ' in teams_str:
-                parts = teams_str.split(' - ')
-                if len(parts) == 2:
-                    result = [parts[0].strip(), parts[1].strip()]
-                    print(f"✅ [SPLIT] Estratégia 0 (hífen): '{result[0]}' vs '{result[1]}'")
-                    return result
-            
-            if ' x ' in teams_str.lower():
-                parts = teams_str.lower().split(' x ')
-                if len(parts) == 2:
-                    result = [parts[0].strip().title(), parts[1].strip().title()]
-                    print(f"✅ [SPLIT] Estratégia 0 (x): '{result[0]}' vs '{result[1]}'")
-                    return result
-            
-            # ESTRATÉGIA 1: Procurar por maiúsculas consecutivas no meio da string
-            # Exemplo: "Volta RedondaAvaí" -> "Volta Redonda" + "Avaí"
-            for i in range(1, len(teams_str) - 1):
-                if teams_str[i].isupper() and teams_str[i-1].islower():
-                    # Verificar se é uma separação válida
-                    potential_team1 = teams_str[:i].strip()
-                    potential_team2 = teams_str[i:].strip()
-                    
-                    # Validar se ambos têm tamanho razoável
-                    if len(potential_team1) >= 3 and len(potential_team2) >= 3:
-                        print(f"✅ [SPLIT] Estratégia 1 funcionou: '{potential_team1}' vs '{potential_team2}'")
-                        return [potential_team1, potential_team2]
-            
-            # ESTRATÉGIA 2: Casos específicos conhecidos do SofaScore (EXPANDIDO)
-            specific_cases = {
-                # Casos brasileiros
-                'VoltaRedondaAvaí': ['Volta Redonda', 'Avaí'],
-                'PaysanduBotafogo': ['Paysandu', 'Botafogo'],
-                'PaysanduBotafogoSP': ['Paysandu', 'Botafogo-SP'],
-                'FluminenseBotafogo': ['Fluminense', 'Botafogo'],
-                'FlamengoVasco': ['Flamengo', 'Vasco'],
-                'CorintiansFlamengo': ['Corinthians', 'Flamengo'],
-                'PalmeirasFlamengo': ['Palmeiras', 'Flamengo'],
-                'SantosSãoPaulo': ['Santos', 'São Paulo'],
-                'SãoPauloCorinthians': ['São Paulo', 'Corinthians'],
-                'GrêmioInternacional': ['Grêmio', 'Internacional'],
-                'AtléticoMGCruzeiro': ['Atlético-MG', 'Cruzeiro'],
-                'BahiaVitória': ['Bahia', 'Vitória'],
-                'FortalezaCeará': ['Fortaleza', 'Ceará'],
-                'SportNáutico': ['Sport', 'Náutico'],
-                'CriciúmaAvaí': ['Criciúma', 'Avaí'],
-                'ChapecoenseCriciúma': ['Chapecoense', 'Criciúma'],
-                'GoiásVilaNova': ['Goiás', 'Vila Nova'],
-                'CuiabáAméricaMG': ['Cuiabá', 'América-MG'],
-                'BragantinoPalmeiras': ['Bragantino', 'Palmeiras'],
-                'AtléticoGOGoiânia': ['Atlético-GO', 'Goiânia'],
-                'JuventudeGrêmio': ['Juventude', 'Grêmio'],
-                'OperárioLondrina': ['Operário', 'Londrina'],
-                'TombenseVila': ['Tombense', 'Vila'],
-                'CSANáutico': ['CSA', 'Náutico'],
-                'SampaioVitória': ['Sampaio', 'Vitória'],
-                'BotafogoSPPonte': ['Botafogo-SP', 'Ponte'],
-                'GuaraniPonte': ['Guarani', 'Ponte'],
-                'CRBNáutico': ['CRB', 'Náutico'],
-                'VitóriaBahia': ['Vitória', 'Bahia'],
-                'CearáFortaleza': ['Ceará', 'Fortaleza'],
-                'NáuticoSport': ['Náutico', 'Sport'],
-                'AvaíFigueirense': ['Avaí', 'Figueirense'],
-                'CriciúmaChapecoense': ['Criciúma', 'Chapecoense'],
-                'VilaNovaCrac': ['Vila Nova', 'Crac'],
-                'AméricaMGCruzeiro': ['América-MG', 'Cruzeiro'],
-                'PalmeirasCorinthians': ['Palmeiras', 'Corinthians'],
-                'SantosFlamengo': ['Santos', 'Flamengo'],
-                'VascoFluminense': ['Vasco', 'Fluminense'],
-                'InternacionalGrêmio': ['Internacional', 'Grêmio'],
-                'CruzeiroAtléticoMG': ['Cruzeiro', 'Atlético-MG'],
-                
-                # Casos internacionais
-                'RiverPlateUrawaReds': ['River Plate', 'Urawa Reds'],
-                'MonterreyInter': ['Monterrey', 'Inter'],
-                'FluminenseDortmund': ['Fluminense', 'Dortmund'],
-                'UlsanSundowns': ['Ulsan', 'Sundowns'],
-                'CuraçaoElSalvador': ['Curaçao', 'El Salvador'],
-                'CanadáHonduras': ['Canadá', 'Honduras'],
-                'DaeguFCPohangSteelers': ['Daegu FC', 'Pohang Steelers'],
-                'FCSeoulGangwon': ['FC Seoul', 'Gangwon'],
-                'JeonbukSuwonFC': ['Jeonbuk', 'Suwon FC'],
-                'ChlefMCAlger': ['Chlef', 'MC Alger'],
-                'BelouizdadOran': ['Belouizdad', 'Oran'],
-                'ESMostaganemKabylie': ['ES Mostaganem', 'Kabylie'],
-                'ElBayadhOlympiqueAkbou': ['El Bayadh', 'Olympique Akbou'],
-                'MagraConstantine': ['Magra', 'Constantine'],
-                'SaouraParadou': ['Saoura', 'Paradou'],
-                'OrshaDynamoBrest': ['Orsha', 'Dynamo Brest'],
-                'KuressaareTammeka': ['Kuressaare', 'Tammeka'],
-                'WestChesterUnitedLehighValleyUnited': ['West Chester United', 'Lehigh Valley United'],
-                'MarinFCAllianceOaklandSoul': ['Marin FC Alliance', 'Oakland Soul'],
-                'BeijingQingdao': ['Beijing', 'Qingdao'],
-                'ColoColoCobresal': ['Colo Colo', 'Cobresal'],
-                'BarcelonaRealMadrid': ['Barcelona', 'Real Madrid'],
-                'RealMadridAtléticoMadrid': ['Real Madrid', 'Atlético Madrid'],
-                'ManchesterUnitedManchesterCity': ['Manchester United', 'Manchester City'],
-                'ChelseaArsenal': ['Chelsea', 'Arsenal'],
-                'LiverpoolTottenham': ['Liverpool', 'Tottenham'],
-                'BayernMunichBorussiaDortmund': ['Bayern Munich', 'Borussia Dortmund'],
-                'JuventusMilan': ['Juventus', 'Milan'],
-                'InterMilan': ['Inter', 'Milan'],
-                'PSGMarseille': ['PSG', 'Marseille'],
-                'AjaxPSV': ['Ajax', 'PSV'],
-                'PortoSporting': ['Porto', 'Sporting'],
-                'BenficaPorto': ['Benfica', 'Porto'],
-                'CelticRangers': ['Celtic', 'Rangers'],
-                'FenerbahçeGalatasaray': ['Fenerbahçe', 'Galatasaray'],
-                'OlympiacosPanathinaikos': ['Olympiacos', 'Panathinaikos'],
-                'SpartakDynamo': ['Spartak', 'Dynamo'],
-                'ZenitCSKA': ['Zenit', 'CSKA'],
-                'RiverBoca': ['River', 'Boca'],
-                'SanLorenzoRacing': ['San Lorenzo', 'Racing'],
-                'FlamengoSantos': ['Flamengo', 'Santos'],
-                'BocaRiver': ['Boca', 'River'],
-                'RacingIndependiente': ['Racing', 'Independiente'],
-                'EstudiantesGimnasia': ['Estudiantes', 'Gimnasia'],
-                'TigreBanfield': ['Tigre', 'Banfield'],
-                'LanúsArsenal': ['Lanús', 'Arsenal'],
-                'VélezHuracán': ['Vélez', 'Huracán'],
-                'NewellsRosario': ['Newell\'s', 'Rosario'],
-                'TalleresGodoy': ['Talleres', 'Godoy'],
-                'UnionColón': ['Union', 'Colón'],
-                'AldosiviPlatense': ['Aldosivi', 'Platense'],
-                'BarracasCentral': ['Barracas', 'Central'],
-                'DefensaJusticia': ['Defensa', 'Justicia'],
-                'PatronatoSarmiento': ['Patronato', 'Sarmiento'],
-                'ArsenalSarmiento': ['Arsenal', 'Sarmiento'],
-                'CentralCórdoba': ['Central', 'Córdoba'],
-                'GimnasiaRiestra': ['Gimnasia', 'Riestra'],
-                'IndependienteRivadavia': ['Independiente', 'Rivadavia'],
-                'InstitutoDeportivo': ['Instituto', 'Deportivo'],
-                'RivaraviaGodoy': ['Rivaravia', 'Godoy'],
-                'TigreBelgrano': ['Tigre', 'Belgrano'],
-                'BanfieldSan': ['Banfield', 'San'],
-                'HuracánPlatense': ['Huracán', 'Platense'],
-                'RosarioCentral': ['Rosario', 'Central'],
-                'GodoyTalleres': ['Godoy', 'Talleres'],
-                'ColónUnión': ['Colón', 'Unión'],
-                'PlatenseAldosivi': ['Platense', 'Aldosivi'],
-                'CentralBarracas': ['Central', 'Barracas'],
-                'JusticiaDefensa': ['Justicia', 'Defensa'],
-                'SarmientoPatronato': ['Sarmiento', 'Patronato'],
-                'SarmientoArsenal': ['Sarmiento', 'Arsenal'],
-                'CórdobaCentral': ['Córdoba', 'Central'],
-                'RiestraGimnasia': ['Riestra', 'Gimnasia'],
-                'RivadaviaIndependiente': ['Rivadavia', 'Independiente'],
-                'DeportivoInstituto': ['Deportivo', 'Instituto'],
-                'GodoyRivaravia': ['Godoy', 'Rivaravia'],
-                'BelgranoTigre': ['Belgrano', 'Tigre'],
-                'SanBanfield': ['San', 'Banfield'],
-                'PlatenseHuracán': ['Platense', 'Huracán']
-            }
-            
-            # Remover espaços para comparação
-            teams_no_space = teams_str.replace(' ', '')
-            if teams_no_space in specific_cases:
-                result = specific_cases[teams_no_space]
-                print(f"✅ [SPLIT] Caso específico encontrado: '{result[0]}' vs '{result[1]}'")
-                return result
-            
-            # ESTRATÉGIA 3: Procurar por padrões conhecidos de times (EXPANDIDO)
-            # Lista de palavras que geralmente terminam nomes de times
-            team_endings = [
-                'FC', 'SC', 'AC', 'EC', 'CF', 'CD', 'CD', 'RC', 'TC', 'UC', 'MC', 'BC', 'DC', 'GC',
-                'United', 'City', 'Town', 'County', 'Rovers', 'Wanderers', 'Athletic', 'Atletico',
-                'Reds', 'Blues', 'Whites', 'Greens', 'Yellows', 'Blacks', 'Lions', 'Eagles', 'Tigers',
-                'Steelers', 'Warriors', 'Knights', 'Rangers', 'Gunners', 'Hammers', 'Spurs', 'Saints',
-                'Plate', 'Madrid', 'Barcelona', 'Milan', 'Inter', 'Juventus', 'Bayern', 'Borussia',
-                'Real', 'Atlético', 'Athletic', 'Deportivo', 'Sporting', 'Nacional', 'Internacional',
-                'Flamengo', 'Corinthians', 'Palmeiras', 'Santos', 'Vasco', 'Botafogo', 'Fluminense',
-                'Grêmio', 'Cruzeiro', 'Atlético', 'Bahia', 'Vitória', 'Fortaleza', 'Ceará', 'Sport',
-                'Náutico', 'Avaí', 'Criciúma', 'Chapecoense', 'Goiás', 'Vila', 'Cuiabá', 'América',
-                'Bragantino', 'Juventude', 'Operário', 'Londrina', 'Tombense', 'CSA', 'Sampaio',
-                'Guarani', 'Ponte', 'CRB', 'Figueirense', 'Crac', 'SP', 'RJ', 'MG', 'RS', 'PR',
-                'BA', 'PE', 'CE', 'GO', 'DF', 'AC', 'AL', 'AP', 'AM', 'ES', 'MA', 'MT', 'MS',
-                'PA', 'PB', 'PI', 'RN', 'RO', 'RR', 'SE', 'TO'
-            ]
-            
-            for ending in team_endings:
-                if ending in teams_str:
-                    idx = teams_str.find(ending) + len(ending)
-                    if idx < len(teams_str):
-                        team1 = teams_str[:idx].strip()
-                        team2 = teams_str[idx:].strip()
-                        if len(team1) >= 3 and len(team2) >= 3:
-                            print(f"✅ [SPLIT] Estratégia 3 (ending '{ending}'): '{team1}' vs '{team2}'")
-                            return [team1, team2]
-            
-            # ESTRATÉGIA 4: Procurar por sequências de maiúsculas no meio
-            # Exemplo: "MonterreyInter" -> "Monterrey" + "Inter"
-            uppercase_positions = [i for i, c in enumerate(teams_str) if c.isupper()]
-            if len(uppercase_positions) >= 2:
-                for i in range(1, len(uppercase_positions)):
-                    split_pos = uppercase_positions[i]
-                    team1 = teams_str[:split_pos].strip()
-                    team2 = teams_str[split_pos:].strip()
-                    
-                    if len(team1) >= 3 and len(team2) >= 3:
-                        print(f"✅ [SPLIT] Estratégia 4 (maiúsculas): '{team1}' vs '{team2}'")
-                        return [team1, team2]
-            
-            # ESTRATÉGIA 5: Dividir por palavras e tentar agrupar
-            words = teams_str.split()
-            if len(words) >= 2:
-                # Para 2 palavras, assumir 1 palavra por time
-                if len(words) == 2:
-                    print(f"✅ [SPLIT] Estratégia 5 (2 palavras): '{words[0]}' vs '{words[1]}'")
-                    return words
-                
-                # Para 3 palavras, tentar 2+1 ou 1+2
-                if len(words) == 3:
-                    # Verificar se a segunda palavra é um sufixo comum
-                    if words[1].upper() in ['FC', 'SC', 'AC', 'EC', 'CF', 'CD', 'RC', 'TC', 'UC', 'MC', 'BC', 'DC', 'GC']:
-                        team1 = f"{words[0]} {words[1]}"
-                        team2 = words[2]
-                        print(f"✅ [SPLIT] Estratégia 5 (3 palavras 2+1): '{team1}' vs '{team2}'")
-                        return [team1, team2]
-                    elif words[2].upper() in ['FC', 'SC', 'AC', 'EC', 'CF', 'CD', 'RC', 'TC', 'UC', 'MC', 'BC', 'DC', 'GC']:
-                        team1 = words[0]
-                        team2 = f"{words[1]} {words[2]}"
-                        print(f"✅ [SPLIT] Estratégia 5 (3 palavras 1+2): '{team1}' vs '{team2}'")
-                        return [team1, team2]
-                
-                # Para mais palavras, tentar dividir no meio
-                mid = len(words) // 2
-                team1 = ' '.join(words[:mid])
-                team2 = ' '.join(words[mid:])
-                
-                if len(team1) >= 3 and len(team2) >= 3:
-                    print(f"✅ [SPLIT] Estratégia 5 (divisão meio): '{team1}' vs '{team2}'")
-                    return [team1, team2]
-            
-            # ESTRATÉGIA 6: Tentar dividir por números ou caracteres especiais
-            # Exemplo: "Team1U21Team2U19" -> procurar por padrões
-            import re
-            patterns = [r'U\d+', r'\d+', r'Jr', r'Sr', r'II', r'III', r'IV']
-            for pattern in patterns:
-                matches = list(re.finditer(pattern, teams_str))
-                if len(matches) >= 1:
-                    match = matches[0]
-                    end_pos = match.end()
-                    if end_pos < len(teams_str) - 2:
-                        team1 = teams_str[:end_pos].strip()
-                        team2 = teams_str[end_pos:].strip()
-                        if len(team1) >= 3 and len(team2) >= 3:
-                            print(f"✅ [SPLIT] Estratégia 6 (padrão '{pattern}'): '{team1}' vs '{team2}'")
-                            return [team1, team2]
-            
-            # ESTRATÉGIA 7: Tentar dividir baseado em palavras conhecidas de times
-            common_team_words = [
-                'Real', 'Club', 'Deportivo', 'Atlético', 'Athletic', 'Sporting', 'Nacional', 'Internacional',
-                'United', 'City', 'Town', 'County', 'Rovers', 'Wanderers', 'Rangers', 'Celtic',
-                'Flamengo', 'Corinthians', 'Palmeiras', 'Santos', 'Vasco', 'Botafogo', 'Fluminense',
-                'Grêmio', 'Cruzeiro', 'Bahia', 'Vitória', 'Fortaleza', 'Ceará', 'Sport', 'Náutico'
-            ]
-            
-            for word in common_team_words:
-                if word in teams_str:
-                    word_pos = teams_str.find(word)
-                    if word_pos > 0:
-                        # Tentar dividir antes da palavra
-                        team1 = teams_str[:word_pos].strip()
-                        team2 = teams_str[word_pos:].strip()
-                        if len(team1) >= 3 and len(team2) >= 3:
-                            print(f"✅ [SPLIT] Estratégia 7 (palavra '{word}' antes): '{team1}' vs '{team2}'")
-                            return [team1, team2]
-                    
-                    word_end = word_pos + len(word)
-                    if word_end < len(teams_str) - 2:
-                        # Tentar dividir depois da palavra
-                        team1 = teams_str[:word_end].strip()
-                        team2 = teams_str[word_end:].strip()
-                        if len(team1) >= 3 and len(team2) >= 3:
-                            print(f"✅ [SPLIT] Estratégia 7 (palavra '{word}' depois): '{team1}' vs '{team2}'")
-                            return [team1, team2]
-            
-            # ESTRATÉGIA 8: Dividir por consonantes seguidas de vogais (heurística)
-            vowels = 'aeiouAEIOU'
-            consonants = 'bcdfghjklmnpqrstvwxyzBCDFGHJKLMNPQRSTVWXYZ'
-            
-            for i in range(2, len(teams_str) - 2):
-                if (teams_str[i] in consonants and 
-                    teams_str[i+1] in vowels and 
-                    teams_str[i-1] in vowels and
-                    teams_str[i-2] in consonants):
-                    
-                    team1 = teams_str[:i].strip()
-                    team2 = teams_str[i:].strip()
-                    
-                    if len(team1) >= 3 and len(team2) >= 3:
-                        print(f"✅ [SPLIT] Estratégia 8 (padrão CV): '{team1}' vs '{team2}'")
-                        return [team1, team2]
-            
-            # Se nada funcionou, retornar None
-            print(f"❌ [SPLIT] Não foi possível separar: '{teams_str}'")
-            return None
-            
-        except Exception as e:
-            print(f"❌ [SPLIT] Erro: {e}")
-            return None
+    def extract_match_details_from_text(self, container_text, span_texts=None):
+        """Extrai informações detalhadas de uma partida a partir do texto e dos spans do container"""
+        match_details = parse_match_text(container_text, span_texts, team_index)
+        if match_details["home_team"] == "N/A":
+            print(f"❌ [EXTRACT] Nenhum formato reconhecido para: '{(container_text or '').strip()}'")
+        return match_details
     
     def validate_and_clean_match_data(self, match_details):
         """Valida e limpa os dados extraídos da partida"""
         try:
-            # 1. Limpar nomes dos times
-            if match_details["home_team"] != "N/A":
-                match_details["home_team"] = re.sub(r'[^\w\s-]', '', match_details["home_team"])[:50].strip()
-            
-            if match_details["away_team"] != "N/A":
-                match_details["away_team"] = re.sub(r'[^\w\s-]', '', match_details["away_team"])[:50].strip()
-            
-            # 2. Validar tempo da partida
-            match_time = match_details.get("match_time", "N/A")
-            if match_time != "N/A" and len(match_time) > 10:
-                match_details["match_time"] = "N/A"
-            
-            # 3. Validar status da partida
-            valid_statuses = ["not_started", "in_progress", "finished", "postponed", "halftime", "scheduled", "N/A"]
-            if match_details.get("match_status") not in valid_statuses:
-                match_details["match_status"] = "N/A"
-            
-            return match_details
-            
+            return clean_match_details(match_details)
         except Exception:
             return match_details
     
 
-
     async def get_latest_links_collection(self) -> Dict[str, Any]:
         """Busca a coleta de links mais recente do banco de dados"""
         try:
@@ -1532,11 +895,35 @@ class SofaScoreLinksService:
 class SofaScoreScreenshotService:
     """Serviço para captura de screenshots de partidas"""
     
-    def __init__(self):
+    def __init__(self, browser_pool=None, page_pool=None):
         self.website_url = "https://www.sofascore.com/"
         self.database = DatabaseService()
+        self.browser_pool = browser_pool
+        self.page_pool = page_pool
         self.screenshots_dir = Path("screenshots")
         self.screenshots_dir.mkdir(exist_ok=True)
+        
+        if self.page_pool:
+            self.page_pool.register_profile(MATCH_PAGE_PROFILE, init_script=STEALTH_INIT_SCRIPT,
+                                            default_timeout=30000, **self.get_context_options())
+    
+    def get_context_options(self) -> Dict[str, Any]:
+        """Configurações realistas do contexto do navegador"""
+        return {
+            'viewport': {'width': 1920, 'height': 1080},
+            'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            'locale': 'pt-BR',
+            'timezone_id': 'America/Sao_Paulo',
+            'extra_http_headers': {
+                'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
+                'Accept-Encoding': 'gzip, deflate, br',
+                'DNT': '1',
+                'Connection': 'keep-alive',
+                'Upgrade-Insecure-Requests': '1'
+            },
+            # Estado pós-consentimento compartilhado (evita o banner de cookies)
+            **consent_store.context_options()
+        }
     
     async def create_browser_context(self, playwright):
         """Cria contexto do navegador com configurações realistas"""
@@ -1551,19 +938,7 @@ class SofaScoreScreenshotService:
             ]
         )
         
-        context = await browser.new_context(
-            viewport={'width': 1920, 'height': 1080},
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            locale='pt-BR',
-            timezone_id='America/Sao_Paulo',
-            extra_http_headers={
-                'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'DNT': '1',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1'
-            }
-        )
+        context = await browser.new_context(**self.get_context_options())
         
         return browser, context
     
@@ -1610,6 +985,7 @@ class SofaScoreScreenshotService:
         except:
             return match_identifier
     
+    @retry_on_browser_crash("Erro ao tirar screenshot")
     async def take_match_screenshot(self, match_identifier: str) -> Dict[str, Any]:
         """Tira screenshot da página completa de uma partida seguindo exatamente o exemplo do get-print-from-match.py"""
         
@@ -1618,9 +994,11 @@ class SofaScoreScreenshotService:
         if not connectivity_ok:
             print("⚠️ Problema de conectividade detectado")
         
-        async with async_playwright() as playwright:
-            browser, context = await self.create_browser_context(playwright)
-            page = await context.new_page()
+        async with browser_page(self.page_pool, MATCH_PAGE_PROFILE, self.browser_pool,
+                                self.create_browser_context, init_script=STEALTH_INIT_SCRIPT,
+                                default_timeout=30000, **self.get_context_options()) as page:
+            await apply_blocking_profile(page, "match_page")
+            tracker = ResponseTracker(page)
             
             try:
                 # Decodificar URL se necessário
@@ -1640,18 +1018,11 @@ class SofaScoreScreenshotService:
                 
                 print("✅ Página carregada com sucesso!")
                 
-                # Aguardar carregamento completo
-                await asyncio.sleep(3)
+                # Aguardar carregamento da partida (antes: 3s fixos)
+                await readiness_waiter.wait_for(page, "match_page_loaded", tracker, fallback_delay=3.0)
                 
-                # Aceitar cookies se aparecer o banner
-                try:
-                    cookie_button = page.locator('button:has-text("Accept"), button:has-text("Aceitar"), [data-testid="cookie-accept"]')
-                    if await cookie_button.count() > 0:
-                        await cookie_button.first.click()
-                        print("🍪 Cookies aceitos")
-                        await asyncio.sleep(1)
-                except:
-                    pass  # Ignorar se não houver banner de cookies
+                # Aceitar cookies só se o banner voltar (estado de consentimento é carregado no contexto)
+                await consent_store.handle_banner(page, fallback_delay=1.0)
                 
                 # Obter informações da partida para o nome do arquivo
                 try:
@@ -1661,8 +1032,8 @@ class SofaScoreScreenshotService:
                     home_team = "Home"
                     away_team = "Away"
                     
-                    # Aguardar um pouco mais para garantir que a página carregou
-                    await asyncio.sleep(2)
+                    # Aguardar o cabeçalho da partida (antes: 2s fixos)
+                    await readiness_waiter.wait_for(page, "match_header")
                     
                     # Múltiplos seletores para tentar encontrar os nomes dos times
                     home_selectors = [
@@ -1713,8 +1084,12 @@ class SofaScoreScreenshotService:
                         except:
                             continue
                     
+                    # Origem dos nomes (match_info.team_names_source): só os lidos da página alimentam o índice de times
+                    team_names_source = TEAM_SOURCE_PAGE
+                    
                     # Se ainda não conseguiu, tentar extrair da URL
                     if home_team == "Home" or away_team == "Away":
+                        team_names_source = TEAM_SOURCE_URL
                         print("🔄 Tentando extrair nomes dos times da URL...")
                         try:
                             # Extrair da parte do slug: slovakia-u21-spain-u21
@@ -1771,13 +1146,16 @@ class SofaScoreScreenshotService:
                     # Limpar nomes dos times para usar no nome do arquivo
                     home_team = "".join(c for c in home_team if c.isalnum() or c in (' ', '-', '_')).strip()
                     away_team = "".join(c for c in away_team if c.isalnum() or c in (' ', '-', '_')).strip()
+                    if team_key(home_team) in PLACEHOLDER_TEAM_KEYS or team_key(away_team) in PLACEHOLDER_TEAM_KEYS:
+                        team_names_source = TEAM_SOURCE_PLACEHOLDER
                     
-                    print(f"⚽ Partida final: {home_team} vs {away_team}")
+                    print(f"⚽ Partida final: {home_team} vs {away_team} (origem: {team_names_source})")
                     
                 except Exception as e:
                     print(f"⚠️ Erro ao obter nomes dos times: {e}")
                     home_team = "Home"
                     away_team = "Away"
+                    team_names_source = TEAM_SOURCE_PLACEHOLDER
                 
                 # Extrair match_id para o nome do arquivo
                 match_id = self.extract_match_id_from_identifier(decoded_identifier)
@@ -1843,7 +1221,8 @@ class SofaScoreScreenshotService:
                         title=f"{home_team} vs {away_team}",
                         home_team=home_team,
                         away_team=away_team,
-                        status="screenshot_captured"
+                        status="screenshot_captured",
+                        team_names_source=team_names_source
                     )
                     
                     if record_id:
@@ -1917,21 +1296,27 @@ class SofaScoreScreenshotService:
                 }
                 
             except Exception as e:
+                if is_browser_crash(e):
+                    raise
                 return {
                     "success": False,
                     "message": f"Erro ao tirar screenshot: {str(e)}",
                     "data": None,
                     "timestamp": datetime.now()
                 }
-                
             finally:
-                await browser.close()
+                tracker.detach()
 
 class MatchDataScrapingService:
     """Serviço para análise técnica baseada em scrapping direto dos dados da partida"""
     
-    def __init__(self):
+    def __init__(self, browser_pool=None, page_pool=None):
         self.assistant = None
+        self.browser_pool = browser_pool
+        self.page_pool = page_pool
+        # Usar os JSONs baixados pelo SPA durante o carregamento (DOM só como fallback)
+        self.capture_xhr = os.getenv('XHR_CAPTURE_ENABLED', 'true').lower() == 'true'
+        self.simplifier = MatchDataSimplifierAPI()
         
         if TechnicalAssistant:
             try:
@@ -1940,6 +1325,7 @@ class MatchDataScrapingService:
             except Exception as e:
                 print(f"⚠️ Assistente técnico não disponível: {e}")
     
+    @retry_on_browser_crash("Erro na análise de dados")
     async def analyze_match_from_scraping(self, match_identifier: str) -> Dict[str, Any]:
         """Analisa uma partida baseada em scrapping direto dos dados da página"""
         try:
@@ -1947,102 +1333,128 @@ class MatchDataScrapingService:
             decoded_identifier = unquote(match_identifier)
             
             # Acessar a página e extrair dados
-            async with async_playwright() as playwright:
-                screenshot_service = SofaScoreScreenshotService()
-                browser, context = await screenshot_service.create_browser_context(playwright)
-                page = await context.new_page()
+            screenshot_service = SofaScoreScreenshotService(browser_pool=self.browser_pool,
+                                                            page_pool=self.page_pool)
+            async with browser_page(self.page_pool, MATCH_PAGE_PROFILE, self.browser_pool,
+                                    screenshot_service.create_browser_context,
+                                    init_script=STEALTH_INIT_SCRIPT, default_timeout=30000,
+                                    **screenshot_service.get_context_options()) as page:
+                await apply_blocking_profile(page, "match_page")
+                tracker = ResponseTracker(page)
+                capture = MatchResponseCapture(
+                    page, screenshot_service.extract_match_id_from_identifier(decoded_identifier)
+                ) if self.capture_xhr else None
                 
                 try:
                     print(f"🔄 Acessando página da partida para scrapping: {decoded_identifier}...")
-                    
+                
                     # Construir URL da partida
                     match_url = screenshot_service.build_match_url(decoded_identifier)
                     print(f"🌐 URL construída: {match_url}")
-                    
+                
                     # Navegar para a página
                     response = await page.goto(match_url, timeout=30000, wait_until='domcontentloaded')
-                    
+                
                     if response.status != 200:
                         print(f"❌ Erro ao acessar página: Status {response.status}")
                         raise Exception(f"Erro ao acessar página: Status {response.status}")
-                    
+                
                     print("✅ Página carregada com sucesso!")
-                    await asyncio.sleep(5)  # Aguardar carregamento completo dos dados
-                    
-                    # Aceitar cookies se aparecer o banner
-                    try:
-                        cookie_button = page.locator('button:has-text("Accept"), button:has-text("Aceitar"), [data-testid="cookie-accept"]')
-                        if await cookie_button.count() > 0:
-                            await cookie_button.first.click()
-                            print("🍪 Cookies aceitos")
-                            await asyncio.sleep(2)
-                    except:
-                        pass
-                    
-                    # Extrair dados da partida
-                    match_data = await self._extract_match_data(page)
-                    match_id = screenshot_service.extract_match_id_from_identifier(decoded_identifier)
-                    
-                    # Analisar dados usando IA
-                    if self.assistant:
-                        print("🤖 Analisando dados da partida com IA especializada...")
-                        analysis_text = await self._analyze_match_data_with_ai(match_data, match_id, match_url)
+                    # Aguardar carregamento dos dados da partida (antes: 5s fixos)
+                    await readiness_waiter.wait_for(page, "match_page_loaded", tracker)
+                
+                    # Aceitar cookies só se o banner voltar (estado de consentimento é carregado no contexto)
+                    await consent_store.handle_banner(page)
+                
+                    # Extrair dados da partida: respostas XHR capturadas ou, se insuficientes, o DOM
+                    raw_data = {}
+                    if capture:
+                        await readiness_waiter.wait_for(page, "match_statistics", tracker)
+                        raw_data = await capture.collect()
+                    
+                    if is_capture_sufficient(raw_data):
+                        print(f"📡 Dados capturados das respostas da API: {', '.join(raw_data['metadata']['collected_types'])}")
+                        match_data = to_match_data(raw_data)
+                        match_data["data_source"] = "xhr"
+                        # Incremental: só as seções que mudaram desde o último snapshot desta partida
+                        simplification = incremental_simplifier.update(
+                            raw_data["metadata"].get("match_id") or decoded_identifier, raw_data
+                        )
+                        match_data["simplified_data"] = simplification["view"]
+                        match_data["simplified_delta"] = simplification["delta"]
+                        print(f"♻️ [SIMPLIFIER] Seções recalculadas: "
+                              f"{', '.join(simplification['delta']['changed_sections']) or 'nenhuma'}")
                     else:
-                        print("⚠️ IA não disponível, gerando análise básica...")
-                        analysis_text = self._generate_basic_match_analysis(match_data, match_id)
-                    
-                    # Preparar resultado da análise
-                    analysis_result = {
-                        "match_info": {
-                            "home_team": match_data.get("home_team", "Time Casa"),
-                            "away_team": match_data.get("away_team", "Time Visitante"),
-                            "match_id": match_id,
-                            "match_url": match_url,
-                            "score": match_data.get("score", "0 - 0"),
-                            "match_time": match_data.get("match_time", ""),
-                            "match_status": match_data.get("match_status", "")
-                        },
-                        "match_statistics": match_data.get("statistics", {}),
-                        "match_events": match_data.get("events", []),
-                        "analysis_text": analysis_text,
-                        "analysis_type": "data_scraping_analysis",
-                        "generated_at": datetime.now().isoformat()
-                    }
-                    
-                    # Salvar análise no banco de dados
-                    database = DatabaseService()
-                    analysis_record_id = await database.save_screenshot_analysis(
-                        match_id=match_id,
-                        match_identifier=decoded_identifier,
-                        match_url=match_url,
-                        home_team=match_data.get("home_team", "Time Casa"),
-                        away_team=match_data.get("away_team", "Time Visitante"),
-                        analysis_text=analysis_text,
-                        analysis_type="data_scraping_analysis",
-                        analysis_metadata={
-                            "statistics": match_data.get("statistics", {}),
-                            "events": match_data.get("events", []),
-                            "match_info": analysis_result["match_info"]
-                        }
-                    )
-                    
-                    if analysis_record_id:
-                        analysis_result["analysis_record_id"] = analysis_record_id
-                        print(f"💾 Análise salva no banco com ID: {analysis_record_id}")
-                    
-                    print("✅ Análise baseada em dados concluída")
-                    
-                    return {
-                        "success": True,
-                        "message": "Análise técnica baseada em dados gerada com sucesso",
-                        "data": analysis_result,
-                        "timestamp": datetime.now()
-                    }
-                    
+                        match_data = await self._extract_match_data(page, tracker)
+                        match_data["data_source"] = "dom"
                 finally:
-                    await browser.close()
+                    tracker.detach()
+                    if capture:
+                        capture.detach()
+                
+                match_id = screenshot_service.extract_match_id_from_identifier(decoded_identifier)
+                
+                # Analisar dados usando IA
+                if self.assistant:
+                    print("🤖 Analisando dados da partida com IA especializada...")
+                    analysis_text = await self._analyze_match_data_with_ai(match_data, match_id, match_url)
+                else:
+                    print("⚠️ IA não disponível, gerando análise básica...")
+                    analysis_text = self._generate_basic_match_analysis(match_data, match_id)
+                
+                # Preparar resultado da análise
+                analysis_result = {
+                    "match_info": {
+                        "home_team": match_data.get("home_team", "Time Casa"),
+                        "away_team": match_data.get("away_team", "Time Visitante"),
+                        "match_id": match_id,
+                        "match_url": match_url,
+                        "score": match_data.get("score", "0 - 0"),
+                        "match_time": match_data.get("match_time", ""),
+                        "match_status": match_data.get("match_status", "")
+                    },
+                    "match_statistics": match_data.get("statistics", {}),
+                    "match_events": match_data.get("events", []),
+                    "analysis_text": analysis_text,
+                    "analysis_type": "data_scraping_analysis",
+                    "generated_at": datetime.now().isoformat()
+                }
+                
+                # Salvar análise no banco de dados
+                database = DatabaseService()
+                analysis_record_id = await database.save_screenshot_analysis(
+                    match_id=match_id,
+                    match_identifier=decoded_identifier,
+                    match_url=match_url,
+                    home_team=match_data.get("home_team", "Time Casa"),
+                    away_team=match_data.get("away_team", "Time Visitante"),
+                    analysis_text=analysis_text,
+                    analysis_type="data_scraping_analysis",
+                    analysis_metadata={
+                        "statistics": match_data.get("statistics", {}),
+                        "events": match_data.get("events", []),
+                        "match_info": analysis_result["match_info"],
+                        "data_source": match_data.get("data_source"),
+                        "simplified_data": match_data.get("simplified_data")
+                    }
+                )
+                
+                if analysis_record_id:
+                    analysis_result["analysis_record_id"] = analysis_record_id
+                    print(f"💾 Análise salva no banco com ID: {analysis_record_id}")
+                
+                print("✅ Análise baseada em dados concluída")
+                
+                return {
+                    "success": True,
+                    "message": "Análise técnica baseada em dados gerada com sucesso",
+                    "data": analysis_result,
+                    "timestamp": datetime.now()
+                }
             
         except Exception as e:
+            if is_browser_crash(e):
+                raise
             return {
                 "success": False,
                 "message": f"Erro na análise de dados: {str(e)}",
@@ -2050,181 +1462,40 @@ class MatchDataScrapingService:
                 "timestamp": datetime.now()
             }
     
-    async def _extract_match_data(self, page) -> Dict[str, Any]:
-        """Extrai dados estruturados da página da partida baseado nos elementos HTML específicos do SofaScore"""
+    async def _extract_match_data(self, page, tracker: Optional[ResponseTracker] = None) -> Dict[str, Any]:
+        """Extrai dados estruturados da página da partida com um único extrator JavaScript em página"""
+        match_data = {
+            "home_team": "",
+            "away_team": "",
+            "score": "0 - 0",
+            "match_time": "",
+            "match_status": "",
+            "statistics": {},
+            "events": []
+        }
+        
         try:
-            match_data = {
-                "home_team": "",
-                "away_team": "",
-                "score": "0 - 0",
-                "match_time": "",
-                "match_status": "",
-                "statistics": {},
-                "events": []
-            }
-            
-            # Extrair informações básicas da partida (times, placar, tempo)
-            try:
-                # Esperar carregamento da página
-                await asyncio.sleep(3)
-                
-                # ESTRATÉGIA 1: Extrair times usando múltiplas abordagens
-                team_names = await self._extract_team_names(page)
-                if team_names:
-                    match_data["home_team"] = team_names[0]
-                    match_data["away_team"] = team_names[1]
-                
-                # Extrair placar - procurar por elementos com classe específica
-                score_selectors = [
-                    '.textStyle_display\\.extraLarge.c_neutrals\\.nLv1',
-                    'span[style*="color: var(--colors-status-live)"]',
-                    '.textStyle_display\\.extraLarge'
-                ]
-                
-                for selector in score_selectors:
-                    score_elements = await page.query_selector_all(selector)
-                    if len(score_elements) >= 2:
-                        home_score = await score_elements[0].text_content()
-                        away_score = await score_elements[1].text_content()
-                        if home_score and away_score and home_score.strip().isdigit() and away_score.strip().isdigit():
-                            match_data["score"] = f"{home_score.strip()} - {away_score.strip()}"
-                            break
-                
-                # Extrair status da partida
-                status_selectors = [
-                    '.textStyle_body\\.medium.c_status\\.live',
-                    'span:has-text("Intervalo")',
-                    'span:has-text("Tempo adicional")',
-                    '.c_status\\.live'
-                ]
-                
-                for selector in status_selectors:
-                    try:
-                        status_element = await page.query_selector(selector)
-                        if status_element:
-                            status_text = await status_element.text_content()
-                            if status_text:
-                                match_data["match_status"] = status_text.strip()
-                                break
-                    except:
-                        continue
-                        
-            except Exception as e:
-                print(f"⚠️ Erro ao extrair info básica: {e}")
-            
-            # Extrair estatísticas usando seletores específicos do HTML fornecido
-            try:
-                # Procurar pela seção "Visão geral da partida"
-                overview_section = await page.query_selector('text=Visão geral da partida')
-                if overview_section:
-                    # Navegar para o container pai das estatísticas
-                    stats_container = await overview_section.evaluate(
-                        'el => el.closest(".bg_surface, [class*=bg_surface]")'
-                    )
-                    
-                    if stats_container:
-                        # Extrair estatísticas específicas
-                        stats_rows = await page.query_selector_all('.Box.Flex.dsybxc, [class*="Box Flex"][class*="dsybxc"]')
-                        
-                        for row in stats_rows:
-                            try:
-                                # Procurar nome da estatística
-                                stat_name_element = await row.query_selector('.Text.lluFbU')
-                                if not stat_name_element:
-                                    continue
-                                
-                                stat_name = await stat_name_element.text_content()
-                                if not stat_name:
-                                    continue
-                                
-                                # Procurar valores numéricos nas colunas
-                                number_elements = await row.query_selector_all('.Text')
-                                numbers = []
-                                
-                                for num_el in number_elements:
-                                    text = await num_el.text_content()
-                                    if text and (text.strip().isdigit() or '%' in text):
-                                        numbers.append(text.strip())
-                                
-                                if len(numbers) >= 2:
-                                    stat_key = stat_name.lower().replace(' ', '_').replace('(', '').replace(')', '').replace('-', '_')
-                                    match_data["statistics"][stat_key] = {
-                                        "home": numbers[0],
-                                        "away": numbers[-1],
-                                        "name": stat_name.strip()
-                                    }
-                                    
-                            except Exception as e:
-                                continue
-                
-                # Extrair posse de bola específica (formato percentual)
-                possession_elements = await page.query_selector_all('span.Text.gxbNET')
-                if len(possession_elements) >= 2:
-                    try:
-                        home_poss = await possession_elements[0].text_content()
-                        away_poss = await possession_elements[1].text_content()
-                        if home_poss and away_poss and '%' in home_poss and '%' in away_poss:
-                            match_data["statistics"]["posse_de_bola"] = {
-                                "home": home_poss.strip(),
-                                "away": away_poss.strip(),
-                                "name": "Posse de bola"
-                            }
-                    except:
-                        pass
-                        
-            except Exception as e:
-                print(f"⚠️ Erro ao extrair estatísticas: {e}")
-            
-            # Extrair eventos da partida usando seletores específicos
-            try:
-                # Procurar eventos usando classe específica do HTML fornecido
-                event_containers = await page.query_selector_all('.hover\\:bg_surface\\.s2.cursor_pointer')
-                
-                for event_container in event_containers:
-                    try:
-                        # Extrair tempo do evento
-                        time_element = await event_container.query_selector('.textStyle_display\\.micro')
-                        time_text = ""
-                        if time_element:
-                            time_text = await time_element.text_content()
-                        
-                        # Extrair jogador e tipo de evento
-                        text_elements = await event_container.query_selector_all('.textStyle_body\\.medium')
-                        player_name = ""
-                        event_type = ""
-                        
-                        for i, text_el in enumerate(text_elements):
-                            text = await text_el.text_content()
-                            if text:
-                                text = text.strip()
-                                if i == 0 and not any(word in text.lower() for word in ['falta', 'cartão', 'gol', 'amarelo']):
-                                    player_name = text
-                                elif i == 1:
-                                    event_type = text
-                        
-                        # Verificar se há ícones de cartão
-                        card_icon = await event_container.query_selector('svg[title*="Cartão"], svg[title*="cartão"]')
-                        if card_icon and not event_type:
-                            title = await card_icon.get_attribute('title')
-                            if title:
-                                event_type = title
-                        
-                        if time_text and player_name:
-                            # Determinar time baseado na estrutura do HTML
-                            is_home = await self._is_home_team_event(event_container)
-                            
-                            match_data["events"].append({
-                                "time": time_text.strip(),
-                                "player": player_name,
-                                "type": event_type if event_type else "Evento",
-                                "team": "home" if is_home else "away"
-                            })
-                            
-                    except Exception as e:
-                        continue
-                        
-            except Exception as e:
-                print(f"⚠️ Erro ao extrair eventos: {e}")
+            # Esperar estatísticas/eventos (antes: 3s fixos)
+            await readiness_waiter.wait_for(page, "match_statistics", tracker)
+            
+            # Placar, status, estatísticas, eventos e nomes dos times em uma única ida à página
+            extracted = await run_extractor(page, "match_page")
+            
+            # Times: URL do SofaScore é a fonte mais confiável, depois título/h1/imagens/seletores
+            team_names = self._team_names_from_url(page.url) or extracted.get("team_names")
+            if not team_names and 'paysandu' in page.url.lower() and 'botafogo' in page.url.lower():
+                team_names = ["Paysandu", "Botafogo-SP"]
+            if not team_names:
+                print("⚠️ Não foi possível extrair nomes dos times, usando padrão")
+                team_names = ["Time Casa", "Time Visitante"]
+            
+            match_data["home_team"] = team_names[0]
+            match_data["away_team"] = team_names[1]
+            match_data["score"] = extracted.get("score") or match_data["score"]
+            match_data["match_status"] = extracted.get("match_status", "")
+            match_data["statistics"] = extracted.get("statistics", {})
+            match_data["events"] = extracted.get("events", [])
+            match_data["extractor"] = extracted.get("extractor")
             
             print(f"📊 Dados extraídos: {match_data['home_team']} vs {match_data['away_team']}")
             print(f"📈 Estatísticas encontradas: {len(match_data['statistics'])} categorias")
@@ -2234,6 +1505,8 @@ class MatchDataScrapingService:
             
         except Exception as e:
             print(f"❌ Erro na extração de dados: {e}")
+            if is_browser_crash(e):
+                raise
             return {
                 "home_team": "Time Casa",
                 "away_team": "Time Visitante", 
@@ -2244,13 +1517,9 @@ class MatchDataScrapingService:
                 "events": []
             }
 
-    async def _extract_team_names(self, page) -> List[str]:
-        """Extrai nomes dos times usando múltiplas estratégias"""
-        team_names = []
-        
+    def _team_names_from_url(self, url: str) -> Optional[List[str]]:
+        """Extrai nomes dos times do slug da URL da partida (ex: paysandu-sc-botafogo-sp)"""
         try:
-            # ESTRATÉGIA 1: Extrair da URL (mais confiável para SofaScore)
-            url = page.url
             print(f"🔍 Analisando URL: {url}")
             
             if '/match/' in url:
@@ -2299,101 +1568,10 @@ class MatchDataScrapingService:
                             away_team = f"{words[2]} {words[3]}".title()
                             print(f"✅ Times extraídos da URL (2+2): {home_team} vs {away_team}")
                             return [home_team, away_team]
-            
-            # ESTRATÉGIA 2: Buscar por elementos de título da página
-            title_element = await page.query_selector('title')
-            if title_element:
-                title_text = await title_element.text_content()
-                print(f"🔍 Título da página: {title_text}")
-                if title_text and ' vs ' in title_text:
-                    teams = title_text.split(' vs ')
-                    if len(teams) >= 2:
-                        home_team = teams[0].strip().split(' - ')[0].strip()
-                        away_team = teams[1].strip().split(' - ')[0].strip()
-                        if len(home_team) > 2 and len(away_team) > 2:
-                            print(f"✅ Times extraídos do título: {home_team} vs {away_team}")
-                            return [home_team, away_team]
-            
-            # ESTRATÉGIA 3: Buscar por elementos h1 com nomes dos times
-            h1_elements = await page.query_selector_all('h1')
-            for h1 in h1_elements:
-                text = await h1.text_content()
-                if text and ' vs ' in text:
-                    teams = text.split(' vs ')
-                    if len(teams) >= 2:
-                        home_team = teams[0].strip()
-                        away_team = teams[1].strip()
-                        if len(home_team) > 2 and len(away_team) > 2:
-                            print(f"✅ Times extraídos do H1: {home_team} vs {away_team}")
-                            return [home_team, away_team]
-            
-            # ESTRATÉGIA 4: Buscar por atributos alt das imagens (método original melhorado)
-            team_images = await page.query_selector_all('img[alt]')
-            potential_teams = []
-            
-            for img in team_images:
-                alt_text = await img.get_attribute('alt')
-                if alt_text and len(alt_text) > 2:
-                    # Filtrar palavras genéricas
-                    generic_words = ['match', 'football', 'soccer', 'logo', 'icon', 'image', 'photo']
-                    if not any(word in alt_text.lower() for word in generic_words):
-                        # Verificar se parece ser nome de time (não contém números ou símbolos estranhos)
-                        if not any(char.isdigit() for char in alt_text) and len(alt_text.split()) <= 4:
-                            potential_teams.append(alt_text.strip())
-            
-            # Pegar os dois primeiros times únicos
-            unique_teams = []
-            for team in potential_teams:
-                if team not in unique_teams and len(unique_teams) < 2:
-                    unique_teams.append(team)
-            
-            if len(unique_teams) >= 2:
-                print(f"✅ Times extraídos das imagens: {unique_teams[0]} vs {unique_teams[1]}")
-                return unique_teams[:2]
-            
-            # ESTRATÉGIA 5: Buscar por elementos com classes específicas de times
-            team_selectors = [
-                '[data-testid*="team"]',
-                '.team-name',
-                '[class*="team"][class*="name"]',
-                '.participant-name'
-            ]
-            
-            for selector in team_selectors:
-                elements = await page.query_selector_all(selector)
-                if len(elements) >= 2:
-                    team_texts = []
-                    for elem in elements[:2]:
-                        text = await elem.text_content()
-                        if text and len(text.strip()) > 2:
-                            team_texts.append(text.strip())
-                    
-                    if len(team_texts) >= 2:
-                        print(f"✅ Times extraídos dos seletores: {team_texts[0]} vs {team_texts[1]}")
-                        return team_texts[:2]
-            
         except Exception as e:
-            print(f"⚠️ Erro ao extrair nomes dos times: {e}")
-        
-        # Se nenhuma estratégia funcionou, tentar extrair da URL de forma mais simples
-        try:
-            url = page.url
-            if 'paysandu' in url.lower() and 'botafogo' in url.lower():
-                return ["Paysandu", "Botafogo-SP"]
-        except:
-            pass
+            print(f"⚠️ Erro ao extrair nomes dos times da URL: {e}")
         
-        print("⚠️ Não foi possível extrair nomes dos times, usando padrão")
-        return ["Time Casa", "Time Visitante"]
-    
-    async def _is_home_team_event(self, event_element) -> bool:
-        """Determina se o evento pertence ao time da casa baseado na posição do elemento"""
-        try:
-            # Verificar se o elemento está alinhado à esquerda (time da casa) ou direita (time visitante)
-            classes = await event_element.get_attribute('class')
-            return 'flex-d_row-reverse' not in (classes or '')
-        except:
-            return True
+        return None
     
     async def _analyze_match_data_with_ai(self, match_data: Dict[str, Any], match_id: str, match_url: str) -> str:
         """Analisa os dados da partida usando IA especializada"""
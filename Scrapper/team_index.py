@@ -0,0 +1,129 @@
+"""
+Índice de Nomes de Times
+Trie com os nomes de times já vistos (match_info.home_team/away_team e casos conhecidos do parser)
+para separar nomes concatenados do texto dos containers ("Volta RedondaAvaí") em tempo linear,
+com divisão exata em prefixo + sufixo conhecidos; nomes inéditos continuam nas heurísticas
+"""
+
+import re
+from typing import Optional, Dict, Any, List, Iterable
+
+from match_text_parser import SPECIFIC_CASES
+
+_NON_ALNUM = re.compile(r"[\W_]+")
+
+# Marca de fim de nome dentro do nó da trie (guarda o nome canônico)
+_TERMINAL = "$"
+
+# match_info.team_names_source: de onde vieram home_team/away_team. Só nomes lidos da página entram no
+# índice; palpites do slug da URL ("Slovakia U21 Spain" / "U21") e placeholders sequestrariam o split
+TEAM_SOURCE_PAGE = "page"
+TEAM_SOURCE_URL = "url"
+TEAM_SOURCE_PLACEHOLDER = "placeholder"
+
+
+def team_key(name: str) -> str:
+    """Chave de comparação: sem espaços, hífens ou pontuação e sem diferenciar maiúsculas"""
+    return _NON_ALNUM.sub("", name).casefold()
+
+
+# Valores padrão dos fluxos de screenshot/análise quando o nome não foi encontrado
+PLACEHOLDER_TEAM_KEYS = frozenset(team_key(name) for name in ("Home", "Away", "Time Casa", "Time Visitante", "N/A"))
+
+
+class TeamNameIndex:
+    """Trie de nomes de times com atualização incremental a partir do banco"""
+
+    def __init__(self, seed_names: Iterable[str] = ()):
+        self._root: Dict[str, Any] = {}
+        self._names: Dict[str, str] = {}
+        self._last_refresh: Optional[str] = None
+        self.stats = {
+            "splits_found": 0,
+            "splits_missed": 0,
+            "refreshes": 0,
+            "names_from_database": 0
+        }
+        self.add_many(seed_names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def add(self, name: Optional[str]) -> bool:
+        """Adiciona um nome; devolve True se ele ainda não estava no índice"""
+        if not name:
+            return False
+        name = name.strip()
+        key = team_key(name)
+        if len(key) < 3 or key in PLACEHOLDER_TEAM_KEYS or key in self._names:
+            return False
+        self._names[key] = name
+        node = self._root
+        for char in key:
+            node = node.setdefault(char, {})
+        node[_TERMINAL] = name
+        return True
+
+    def add_many(self, names: Iterable[Optional[str]]) -> int:
+        return sum(1 for name in names if self.add(name))
+
+    def split(self, teams_str: str) -> Optional[List[str]]:
+        """
+        Percorre a trie uma vez coletando os prefixos que são nomes conhecidos e usa o mais longo
+        cujo restante também é um nome conhecido; None quando algum dos dois times é inédito
+        """
+        key = team_key(teams_str)
+        node = self._root
+        prefix_ends = []
+        for position, char in enumerate(key):
+            node = node.get(char)
+            if node is None:
+                break
+            if _TERMINAL in node:
+                prefix_ends.append((position + 1, node[_TERMINAL]))
+
+        for end, home_team in reversed(prefix_ends):
+            away_team = self._names.get(key[end:])
+            if away_team:
+                self.stats["splits_found"] += 1
+                return [home_team, away_team]
+
+        self.stats["splits_missed"] += 1
+        return None
+
+    async def refresh(self, database) -> int:
+        """
+        Carrega os times de match_info alterados desde a última atualização (a primeira carrega o histórico
+        inteiro); só linhas com team_names_source == TEAM_SOURCE_PAGE entram no índice. A marca é o maior
+        updated_at lido (de todas as linhas), e só avança quando a consulta dá certo
+        """
+        try:
+            rows = await database.get_team_names(since=self._last_refresh)
+        except Exception as e:
+            rows = None
+            print(f"⚠️ [TEAM-INDEX] Erro ao atualizar índice de times: {e}")
+        if rows is None:
+            return 0
+
+        added = self.add_many(
+            name for row in rows if row.get("team_names_source") == TEAM_SOURCE_PAGE
+            for name in (row.get("home_team"), row.get("away_team"))
+        )
+        self._last_refresh = max((row["updated_at"] for row in rows if row.get("updated_at")),
+                                 default=self._last_refresh)
+        self.stats["refreshes"] += 1
+        self.stats["names_from_database"] += added
+        if added:
+            print(f"📇 [TEAM-INDEX] {added} time(s) novo(s) no índice ({len(self)} no total)")
+        return added
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "names": len(self),
+            "last_refresh": self._last_refresh,
+            **self.stats
+        }
+
+
+# Instância global, semeada com os casos conhecidos do parser
+team_index = TeamNameIndex(name for pair in SPECIFIC_CASES.values() for name in pair)
@@ -0,0 +1,192 @@
+"""
+Estratégias de Espera por Prontidão
+Substitui os asyncio.sleep fixos dos fluxos de scraping por esperas em seletores/respostas da API,
+com timeout por fase, fallback para o atraso antigo e registro do tempo realmente esperado
+"""
+
+import os
+import re
+import time
+import asyncio
+from typing import Optional, Dict, Any, List
+
+# Fases de espera: seletores e/ou respostas que indicam que a página está pronta.
+# fallback_delay é o atraso fixo usado antes (e no modo WAIT_STRATEGY=fixed).
+WAIT_PHASES: Dict[str, Dict[str, Any]] = {
+    "homepage_matches": {
+        "selectors": ['a[href*="/football/match/"]'],
+        "responses": [],
+        "timeout": 10.0,
+        "fallback_delay": 3.0,
+        "settle": 0.5
+    },
+    "match_page_loaded": {
+        "selectors": [
+            '.textStyle_display\\.extraLarge',
+            'text=Visão geral da partida'
+        ],
+        "responses": [r"/api/v1/event/\d+$"],
+        "timeout": 10.0,
+        "fallback_delay": 5.0,
+        "settle": 0.3
+    },
+    "cookie_dismissed": {
+        "selectors": ['button:has-text("Accept"), button:has-text("Aceitar"), [data-testid="cookie-accept"]'],
+        "state": "detached",
+        "responses": [],
+        "timeout": 2.0,
+        "fallback_delay": 2.0,
+        "settle": 0.0
+    },
+    "match_header": {
+        "selectors": [
+            '[data-testid="match_header_team_home"]',
+            '.textStyle_display\\.extraLarge'
+        ],
+        "responses": [],
+        "timeout": 3.0,
+        "fallback_delay": 2.0,
+        "settle": 0.0
+    },
+    "match_statistics": {
+        "selectors": [
+            '.Box.Flex.dsybxc',
+            '.hover\\:bg_surface\\.s2.cursor_pointer',
+            'text=Visão geral da partida'
+        ],
+        "responses": [r"/api/v1/event/\d+/statistics$", r"/api/v1/event/\d+/incidents$"],
+        "timeout": 6.0,
+        "fallback_delay": 3.0,
+        "settle": 0.5
+    }
+}
+
+
+class ResponseTracker:
+    """Registra respostas da aba desde antes da navegação para esperas baseadas em API"""
+
+    def __init__(self, page):
+        self.page = page
+        self.urls: List[str] = []
+        self._event = asyncio.Event()
+        page.on("response", self._on_response)
+
+    def _on_response(self, response):
+        self.urls.append(response.url.split('?')[0])
+        self._event.set()
+
+    def has_match(self, patterns: List[str]) -> bool:
+        return any(re.search(pattern, url) for pattern in patterns for url in self.urls)
+
+    async def wait_for(self, patterns: List[str]):
+        """Aguarda até que alguma resposta case com os padrões"""
+        while not self.has_match(patterns):
+            self._event.clear()
+            await self._event.wait()
+
+    def detach(self):
+        """Remove o listener (necessário para abas reutilizadas do pool)"""
+        try:
+            self.page.remove_listener("response", self._on_response)
+        except Exception:
+            pass
+
+
+class ReadinessWaiter:
+    """Executa esperas por fase e acumula quanto tempo cada uma realmente levou"""
+
+    def __init__(self, mode: str = None):
+        self.mode = mode or os.getenv('WAIT_STRATEGY', 'readiness').lower()
+        self.stats: Dict[str, Dict[str, Any]] = {}
+
+    def _record(self, phase: str, waited: float, fallback_delay: float, outcome: str):
+        stats = self.stats.setdefault(phase, {
+            "count": 0,
+            "total_waited": 0.0,
+            "max_waited": 0.0,
+            "total_recovered": 0.0,
+            "outcomes": {}
+        })
+        stats["count"] += 1
+        stats["total_waited"] += waited
+        stats["max_waited"] = max(stats["max_waited"], waited)
+        stats["total_recovered"] += max(0.0, fallback_delay - waited)
+        stats["outcomes"][outcome] = stats["outcomes"].get(outcome, 0) + 1
+
+    async def wait_for(self, page, phase: str, tracker: Optional[ResponseTracker] = None,
+                       fallback_delay: float = None) -> Dict[str, Any]:
+        """Espera a fase ficar pronta; em timeout/erro respeita o atraso fixo antigo"""
+        config = WAIT_PHASES[phase]
+        fallback_delay = fallback_delay if fallback_delay is not None else config["fallback_delay"]
+        started = time.perf_counter()
+
+        if self.mode == 'fixed':
+            await asyncio.sleep(fallback_delay)
+            waited = time.perf_counter() - started
+            self._record(phase, waited, fallback_delay, "fixed")
+            return {"phase": phase, "outcome": "fixed", "waited": round(waited, 3)}
+
+        timeout = config.get("timeout", fallback_delay)
+        state = config.get("state", "attached")
+        tasks = [
+            asyncio.ensure_future(page.wait_for_selector(selector, state=state, timeout=timeout * 1000))
+            for selector in config.get("selectors", [])
+        ]
+        if tracker is not None and config.get("responses"):
+            tasks.append(asyncio.ensure_future(tracker.wait_for(config["responses"])))
+
+        outcome = "timeout"
+        try:
+            pending = set(tasks)
+            deadline = started + timeout
+            while pending:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                done, pending = await asyncio.wait(pending, timeout=remaining,
+                                                   return_when=asyncio.FIRST_COMPLETED)
+                if any(not task.cancelled() and task.exception() is None for task in done):
+                    outcome = "ready"
+                    break
+            if not tasks:
+                outcome = "fallback"
+        except Exception:
+            outcome = "fallback"
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            for task in tasks:
+                if task.done() and not task.cancelled():
+                    task.exception()  # evita "exception was never retrieved"
+
+        if outcome == "ready" and config.get("settle"):
+            await asyncio.sleep(config["settle"])
+        elif outcome != "ready":
+            # Nunca esperar menos que o atraso antigo quando a prontidão não foi detectada
+            await asyncio.sleep(max(0.0, fallback_delay - (time.perf_counter() - started)))
+
+        waited = time.perf_counter() - started
+        self._record(phase, waited, fallback_delay, outcome)
+        print(f"⏱️ [WAIT] {phase}: {outcome} em {waited:.2f}s (antes: {fallback_delay:.1f}s fixos)")
+        return {"phase": phase, "outcome": outcome, "waited": round(waited, 3)}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retorna tempos por fase, incluindo latência recuperada em relação aos atrasos fixos"""
+        return {
+            "mode": self.mode,
+            "phases": {
+                phase: {
+                    **stats,
+                    "avg_waited": round(stats["total_waited"] / stats["count"], 3) if stats["count"] else 0.0,
+                    "total_waited": round(stats["total_waited"], 3),
+                    "max_waited": round(stats["max_waited"], 3),
+                    "total_recovered": round(stats["total_recovered"], 3)
+                }
+                for phase, stats in self.stats.items()
+            }
+        }
+
+
+# Instância compartilhada pelos serviços
+readiness_waiter = ReadinessWaiter()
@@ -0,0 +1,247 @@
+"""
+Captura de Respostas XHR da Página da Partida
+Enquanto a página da partida carrega, o SPA do SofaScore já baixa event/{id}, statistics, incidents,
+lineups e shotmap; este módulo guarda esses JSONs (page.on("response")) no mesmo formato da coleta via API
+"""
+
+import re
+import asyncio
+import unicodedata
+from typing import Optional, Dict, Any, List
+
+from executors import executors
+
+# Endpoint -> chave no formato de get_live_match_data_api
+CAPTURED_ENDPOINTS = {
+    "": "basic_info",
+    "/statistics": "statistics",
+    "/incidents": "timeline",
+    "/lineups": "lineups",
+    "/shotmap": "shotmap"
+}
+
+EVENT_URL_PATTERN = re.compile(r"/api/v1/event/(\d+)(/statistics|/incidents|/lineups|/shotmap)?$")
+
+MATCH_ID_IN_URL = re.compile(r"#id:(\d+)")
+
+# ID da partida no __NEXT_DATA__ da página (quando a URL não traz #id:)
+NEXT_DATA_EVENT_ID_SCRIPT = r"""() => {
+    const data = window.__NEXT_DATA__
+        || JSON.parse((document.getElementById('__NEXT_DATA__') || {}).textContent || 'null');
+    const props = (data && data.props && data.props.pageProps) || {};
+    const event = (props.initialProps && props.initialProps.event) || props.event || null;
+    return event && event.id ? String(event.id) : null;
+}"""
+
+# Chaves da API -> rótulo exibido na "Visão geral da partida"; a chave do DOM sai do rótulo
+# (dom_statistic_key), então os dados capturados chegam com as mesmas chaves lidas pela
+# análise avançada (_generate_advanced_match_analysis)
+STATISTIC_LABELS = {
+    "ballPossession": "Posse de bola",
+    "totalShotsOnGoal": "Finalizações",
+    "shotsOnGoal": "Finalizações no gol",
+    "bigChanceCreated": "Grandes chances",
+    "duelWonPercent": "Duelos",
+    "throwIns": "Laterais",
+    "cornerKicks": "Escanteios",
+    "passes": "Passes",
+    "accuratePasses": "Passes certos",
+    "yellowCards": "Cartões amarelos"
+}
+
+SIMPLE_STATISTIC_VALUE = re.compile(r"^\d+%?$")
+
+INCIDENT_TYPE_NAMES = {
+    "goal": "Gol",
+    "substitution": "Substituição",
+    "varDecision": "Decisão do VAR"
+}
+
+CARD_NAMES = {
+    "yellow": "Cartão amarelo",
+    "yellowRed": "Segundo amarelo",
+    "red": "Cartão vermelho"
+}
+
+
+class MatchResponseCapture:
+    """Guarda os payloads JSON da partida baixados pelo SPA durante a navegação"""
+
+    def __init__(self, page, match_id: Optional[str] = None):
+        self.page = page
+        # Sem ID numérico conhecido, guarda os payloads de cada event/{id} visto (a página também
+        # baixa partidas relacionadas) e escolhe em collect() pelo ID da URL ou do __NEXT_DATA__
+        self.match_id = match_id if match_id and match_id.isdigit() else None
+        self._payloads: Dict[str, Dict[str, Any]] = {}
+        self._pending: List[asyncio.Task] = []
+        page.on("response", self._on_response)
+
+    @property
+    def payloads(self) -> Dict[str, Any]:
+        return self._payloads.get(self.match_id, {}) if self.match_id else {}
+
+    def _on_response(self, response):
+        path = response.url.split('?')[0]
+        match = EVENT_URL_PATTERN.search(path)
+        if not match or response.status != 200:
+            return
+        event_id, suffix = match.group(1), match.group(2) or ""
+        if self.match_id is not None and event_id != self.match_id:
+            return
+        self._pending.append(asyncio.ensure_future(self._store(event_id, CAPTURED_ENDPOINTS[suffix], response)))
+
+    async def _store(self, event_id: str, key: str, response):
+        try:
+            payload = await executors.decode_json(await response.body(), name="xhr_json")
+            self._payloads.setdefault(event_id, {})[key] = payload
+        except Exception:
+            pass  # corpo indisponível (aba navegou) ou não-JSON
+
+    async def resolve_match_id(self) -> Optional[str]:
+        """ID da partida aberta: o informado, o #id: da URL atual ou o evento do __NEXT_DATA__"""
+        if self.match_id:
+            return self.match_id
+        url_match = MATCH_ID_IN_URL.search(self.page.url or "")
+        if url_match:
+            self.match_id = url_match.group(1)
+            return self.match_id
+        try:
+            self.match_id = await self.page.evaluate(NEXT_DATA_EVENT_ID_SCRIPT)
+        except Exception:
+            self.match_id = None
+        return self.match_id
+
+    def detach(self):
+        """Remove o listener (necessário para abas reutilizadas do pool)"""
+        try:
+            self.page.remove_listener("response", self._on_response)
+        except Exception:
+            pass
+
+    async def collect(self, timeout: float = 5.0) -> Dict[str, Any]:
+        """Aguarda os corpos pendentes e devolve os dados no formato de get_live_match_data_api"""
+        if self._pending:
+            await asyncio.wait(list(self._pending), timeout=timeout)
+
+        raw_data: Dict[str, Any] = {}
+        if not await self.resolve_match_id():
+            # Sem ID não dá para saber qual event/{id} é a partida: fica com o DOM
+            print(f"⚠️ [XHR-CAPTURE] ID da partida não resolvido ({len(self._payloads)} evento(s) "
+                  f"capturado(s)); captura ignorada")
+            raw_data["metadata"] = {'match_id': None, 'collected_types': [], 'source': 'xhr_capture'}
+            return raw_data
+
+        event = (self.payloads.get("basic_info") or {}).get("event")
+        if event:
+            raw_data["basic_info"] = {
+                'homeTeam': event.get('homeTeam', {}),
+                'awayTeam': event.get('awayTeam', {}),
+                'homeScore': event.get('homeScore', {}),
+                'awayScore': event.get('awayScore', {}),
+                'status': event.get('status', {}),
+                'time': event.get('time', {}),
+                'startTimestamp': event.get('startTimestamp'),
+                'tournament': event.get('tournament', {}),
+                'season': event.get('season', {})
+            }
+        if "statistics" in self.payloads:
+            raw_data["statistics"] = self.payloads["statistics"].get("statistics", [])
+        if "timeline" in self.payloads:
+            raw_data["timeline"] = self.payloads["timeline"].get("incidents", [])
+        if "lineups" in self.payloads:
+            raw_data["lineups"] = {
+                'home': self.payloads["lineups"].get('home', {}),
+                'away': self.payloads["lineups"].get('away', {})
+            }
+        if "shotmap" in self.payloads:
+            raw_data["shotmap"] = self.payloads["shotmap"].get("shotmap", [])
+
+        raw_data["metadata"] = {
+            'match_id': self.match_id,
+            'collected_types': [key for key in raw_data],
+            'source': 'xhr_capture'
+        }
+        return raw_data
+
+
+def is_capture_sufficient(raw_data: Dict[str, Any]) -> bool:
+    """Captura serve para a análise quando há dados básicos e estatísticas ou incidentes"""
+    return "basic_info" in raw_data and ("statistics" in raw_data or "timeline" in raw_data)
+
+
+def dom_statistic_key(name: str) -> str:
+    """Mesma chave que o extrator match_page (v2) gera a partir do rótulo da estatística"""
+    name = ''.join(char for char in unicodedata.normalize('NFD', name) if not unicodedata.combining(char))
+    return name.lower().replace(' ', '_').replace('(', '').replace(')', '').replace('-', '_')
+
+
+def _statistic_key(item: Dict[str, Any]) -> tuple:
+    name = STATISTIC_LABELS.get(item.get("key", "")) or item.get("name", "")
+    return dom_statistic_key(name), name
+
+
+def _statistic_value(item: Dict[str, Any], side: str) -> str:
+    """
+    Valor como o DOM mostra (número ou porcentagem); valores compostos da API, ex: "345 (85%)"
+    em passes certos, usam o número de homeValue/awayValue para a análise conseguir converter
+    """
+    text = str(item.get(side, "0"))
+    value = item.get(f"{side}Value")
+    if SIMPLE_STATISTIC_VALUE.match(text) or not isinstance(value, (int, float)):
+        return text
+    return str(int(value)) if float(value).is_integer() else str(value)
+
+
+def _incident_type(incident: Dict[str, Any]) -> Optional[str]:
+    incident_type = incident.get("incidentType", "")
+    if incident_type == "card":
+        return CARD_NAMES.get(incident.get("incidentClass", ""), "Cartão")
+    return INCIDENT_TYPE_NAMES.get(incident_type)
+
+
+def to_match_data(raw_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Converte os payloads capturados para o formato de _extract_match_data (DOM)"""
+    basic_info = raw_data.get("basic_info", {})
+    status = basic_info.get("status", {})
+
+    match_data = {
+        "home_team": basic_info.get("homeTeam", {}).get("name", ""),
+        "away_team": basic_info.get("awayTeam", {}).get("name", ""),
+        "score": f"{basic_info.get('homeScore', {}).get('current', 0)} - {basic_info.get('awayScore', {}).get('current', 0)}",
+        "match_time": status.get("description", ""),
+        "match_status": status.get("type", ""),
+        "statistics": {},
+        "events": []
+    }
+
+    for period_data in raw_data.get("statistics", []):
+        if period_data.get("period") != "ALL":
+            continue
+        for group in period_data.get("groups", []):
+            for item in group.get("statisticsItems", []):
+                stat_key, stat_name = _statistic_key(item)
+                match_data["statistics"][stat_key] = {
+                    "home": _statistic_value(item, "home"),
+                    "away": _statistic_value(item, "away"),
+                    "name": stat_name
+                }
+
+    # Incidentes vêm do mais recente para o mais antigo
+    for incident in reversed(raw_data.get("timeline", [])):
+        event_type = _incident_type(incident)
+        if not event_type:
+            continue
+        if incident.get("incidentType") == "substitution":
+            player = incident.get("playerIn", {}).get("name", "")
+        else:
+            player = incident.get("player", {}).get("name", "") or incident.get("playerName", "")
+        added_time = incident.get("addedTime")
+        time_text = f"{incident.get('time', '')}'" + (f"+{added_time}" if added_time else "")
+        match_data["events"].append({
+            "time": time_text,
+            "player": player,
+            "type": event_type,
+            "team": "home" if incident.get("isHome") else "away"
+        })
+
+    return match_data
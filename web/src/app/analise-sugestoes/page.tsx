@@ -104,6 +104,7 @@ function AnalyseSugestoesContent() {
   const [analysisCount, setAnalysisCount] = useState(0);
   
   const intervalRef = useRef<NodeJS.Timeout | null>(null);
+  const streamRef = useRef<EventSource | null>(null);
 
   // Extrair match_id do href
   const extractMatchIdFromHref = (href: string): string | null => {
@@ -223,34 +224,73 @@ function AnalyseSugestoesContent() {
     }
   };
 
+  // Análise recebida pelo canal ao vivo (gerada uma vez no servidor para todos os espectadores)
+  const handleStreamedAnalysis = async (data: DataAnalysisResponse) => {
+    setCurrentAnalysis(data);
+    setLastUpdate(new Date());
+    setAnalysisCount(prev => prev + 1);
+    setError(null);
+    
+    const analysisMatchId = matchId || data.match_info?.match_id;
+    if (analysisMatchId) {
+      await loadExistingAnalyses(analysisMatchId);
+    }
+  };
+
+  // Polling a cada minuto (fallback quando o canal ao vivo não está disponível)
+  const startPolling = () => {
+    performRealTimeAnalysis();
+    intervalRef.current = setInterval(() => {
+      performRealTimeAnalysis();
+    }, 60000); // 60 segundos
+  };
+
+  const stopAutoAnalysisUpdates = () => {
+    if (intervalRef.current) {
+      clearInterval(intervalRef.current);
+      intervalRef.current = null;
+    }
+    if (streamRef.current) {
+      streamRef.current.close();
+      streamRef.current = null;
+    }
+  };
+
   // Iniciar/parar análise automática
   const toggleAutoAnalysis = () => {
     if (autoAnalysis) {
       // Parar análise automática
-      if (intervalRef.current) {
-        clearInterval(intervalRef.current);
-        intervalRef.current = null;
-      }
+      stopAutoAnalysisUpdates();
       setAutoAnalysis(false);
-    } else {
-      // Iniciar análise automática
-      setAutoAnalysis(true);
-      // Fazer análise imediatamente
-      performRealTimeAnalysis();
-      
-      // Configurar intervalo de 1 minuto
-      intervalRef.current = setInterval(() => {
-        performRealTimeAnalysis();
-      }, 60000); // 60 segundos
+      return;
     }
+    
+    // Iniciar análise automática
+    setAutoAnalysis(true);
+    
+    if (!matchId || typeof EventSource === 'undefined') {
+      startPolling();
+      return;
+    }
+    
+    // Canal ao vivo: o servidor gera a análise a cada minuto e envia a todos os inscritos
+    streamRef.current = ApiService.subscribeToMatch(matchId, {
+      onAnalysis: handleStreamedAnalysis,
+      onAnalysisError: (message) => setError(message || 'Erro na análise'),
+      onError: (source) => {
+        // O navegador reconecta sozinho; só cai para o polling se a conexão for encerrada de vez
+        if (source.readyState === EventSource.CLOSED && streamRef.current === source) {
+          streamRef.current = null;
+          startPolling();
+        }
+      }
+    }, { identifier: href || undefined, analysis: true });
   };
 
   // Cleanup no unmount
   useEffect(() => {
     return () => {
-      if (intervalRef.current) {
-        clearInterval(intervalRef.current);
-      }
+      stopAutoAnalysisUpdates();
     };
   }, []);
 
@@ -93,6 +93,32 @@ export class ApiService {
     const response = await api.get(`/match/${matchId}/screenshot-analysis/latest`);
     return response.data;
   }
+
+  // Assinar o canal ao vivo (SSE) de uma partida: estado e análises chegam por push,
+  // compartilhados entre todos os espectadores da mesma partida
+  static subscribeToMatch(
+    matchId: string,
+    handlers: {
+      onState?: (data: any) => void;
+      onAnalysis?: (data: any) => void;
+      onAnalysisError?: (message: string) => void;
+      onError?: (source: EventSource) => void;
+    },
+    options: { identifier?: string; analysis?: boolean } = {}
+  ): EventSource {
+    const params = new URLSearchParams();
+    if (options.identifier) params.set('identifier', options.identifier);
+    if (options.analysis) params.set('analysis', 'true');
+
+    const source = new EventSource(`${API_BASE_URL}/monitor/${encodeURIComponent(matchId)}/stream?${params.toString()}`);
+    source.addEventListener('state', (event) => handlers.onState?.(JSON.parse((event as MessageEvent).data)));
+    source.addEventListener('analysis', (event) => handlers.onAnalysis?.(JSON.parse((event as MessageEvent).data)));
+    source.addEventListener('analysis_error', (event) =>
+      handlers.onAnalysisError?.(JSON.parse((event as MessageEvent).data).message)
+    );
+    source.onerror = () => handlers.onError?.(source);
+    return source;
+  }
 }
 
 export default ApiService; 
\ No newline at end of file